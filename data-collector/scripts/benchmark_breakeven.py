@@ -0,0 +1,127 @@
+"""
+Benchmark do breakeven plano x API (calculators/breakeven.py).
+Compara o loop escalar (plano x modelo x perfil) com breakeven_matrix()
+e confere que a busca binária na tabela publicada dá a mesma resposta
+que comparar o custo da API com o preço do plano, modelo a modelo.
+"""
+
+import argparse
+import bisect
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.breakeven import DAYS_PER_MONTH, breakeven_matrix, breakeven_table, plan_keys
+from calculators.workloads import profile_matrix, simulate_models
+
+from benchmark_workloads import best_of, generate_profiles, generate_synthetic_models
+
+
+def generate_plans(count: int, seed: int = 11) -> list:
+    """Planos sintéticos: ~10% grátis, ~40% com limite de tokens, ~50% com limite diário."""
+    rng = random.Random(seed)
+    return [
+        {
+            "provider": f"provider-{i % 20}",
+            "plan_name": f"Plan {i}",
+            "price_monthly": 0.0 if rng.random() < 0.1 else float(rng.choice([10, 20, 30, 60, 100, 200])),
+            "tokens_included": rng.randint(1, 200) * 1_000_000 if rng.random() < 0.4 else None,
+            "requests_per_day": rng.randint(20, 2_000) if rng.random() < 0.5 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def scalar_path(cost_per_request: np.ndarray, profiles: list, plans: list) -> list:
+    """Referência: breakeven plano a plano, modelo a modelo, perfil a perfil."""
+    result = []
+    for plan in plans:
+        price = plan["price_monthly"] or 0.0
+        by_model = []
+        for costs in cost_per_request.tolist():
+            row = []
+            for cost, p in zip(costs, profiles):
+                tokens = p["input_tokens"] + p["output_tokens"]
+                capacity = min(
+                    plan["tokens_included"] or math.inf,
+                    (plan["requests_per_day"] or math.inf) * DAYS_PER_MONTH * tokens,
+                )
+                if math.isnan(cost):
+                    row.append(math.nan)
+                elif price == 0:
+                    row.append(0.0)
+                elif cost == 0 or price / (cost / tokens) > capacity:
+                    row.append(math.inf)
+                else:
+                    row.append(price / (cost / tokens))
+            by_model.append(row)
+        result.append(by_model)
+    return result
+
+
+def check_lookup(models: list, profiles: list, plans: list, cost_per_request: np.ndarray, samples: int = 200):
+    """Busca binária na tabela publicada x comparação direta V * custo por token < preço, dentro da capacidade."""
+    table = breakeven_table(models, plans, profiles)
+    rng = random.Random(3)
+    keys = plan_keys(plans)
+    for _ in range(samples):
+        p, k = rng.randrange(len(profiles)), rng.randrange(len(plans))
+        profile, plan = profiles[p], plans[k]
+        entry = table["tables"][profile["name"]][keys[k]]
+        capacity = table["plans"][keys[k]]["capacity_tokens"][profile["name"]]
+        volume = rng.choice(entry["breakeven_tokens"] or [0]) + rng.choice([-1, 0, 1]) * rng.randint(0, 10_000)
+        if capacity is not None and rng.random() < 0.2:
+            volume = capacity + rng.randint(1, 10_000)
+        # Mesma regra de planOrApi (src/lib/static-api.ts): acima da capacidade, tudo API
+        within = capacity is None or volume <= capacity
+        plan_cheaper = set(entry["model_ids"][:bisect.bisect_right(entry["breakeven_tokens"], volume)] if within else [])
+
+        tokens = profile["input_tokens"] + profile["output_tokens"]
+        for i, model in enumerate(models):
+            cost = cost_per_request[i, p]
+            if np.isnan(cost):
+                continue
+            breakeven = (plan["price_monthly"] or 0) / (cost / tokens) if cost > 0 else math.inf
+            fits = capacity is None or breakeven <= capacity
+            expected = within and fits and math.ceil(breakeven) <= volume
+            assert (model["id"] in plan_cheaper) == expected, (model["id"], keys[k], profile["name"], volume)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do breakeven plano x API")
+    parser.add_argument("--sizes", default="500,2000,10000", help="Tamanhos de catálogo (separados por vírgula)")
+    parser.add_argument("--profiles", type=int, default=20, help="Perfis de uso")
+    parser.add_argument("--plans", type=int, default=40, help="Planos de assinatura")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição (usa a melhor)")
+    args = parser.parse_args()
+
+    profiles, plans = generate_profiles(args.profiles), generate_plans(args.plans)
+    workloads = profile_matrix(profiles)
+    print(f"⚖️ {len(plans)} planos x {len(profiles)} perfis\n")
+    print(f"{'modelos':>10} {'escalar (ms)':>14} {'matriz (ms)':>13} {'tabela (ms)':>13} {'ganho':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        models = generate_synthetic_models(size)
+        cost = simulate_models(models, profiles)["cost_per_request"]
+
+        # Confere os dois caminhos e a busca binária antes de medir
+        result = breakeven_matrix(cost, workloads, plans)["breakeven_tokens"]
+        assert np.allclose(result, np.array(scalar_path(cost, profiles, plans)), equal_nan=True)
+        if size <= 2000:
+            check_lookup(models, profiles, plans, cost)
+
+        scalar_time = best_of(scalar_path, args.repeat, cost, profiles, plans)
+        matrix_time = best_of(breakeven_matrix, args.repeat, cost, workloads, plans)
+        table_time = best_of(breakeven_table, 1, models, plans, profiles)
+        print(
+            f"{size:>10} {scalar_time * 1000:>14.1f} {matrix_time * 1000:>13.2f} {table_time * 1000:>13.1f}"
+            f" {scalar_time / matrix_time:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
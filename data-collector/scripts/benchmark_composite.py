@@ -0,0 +1,112 @@
+"""
+Benchmark do score composto por preset (calculators/composite.py).
+Compara um loop escalar (um cálculo por modelo por preset, com a mesma
+renormalização) com o produto de matrizes de composite_scores, num
+catálogo sintético com as colunas de value.benchmarks e presets extras
+além dos quatro de value.ranking_weights.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.composite import DEFAULT_PRESETS, WEIGHT_COLUMNS, component_matrix, composite_scores, weight_matrix
+
+
+def generate_frame(count: int, seed: int = 42) -> pd.DataFrame:
+    """Linhas de latest_benchmarks sintéticas, com benchmarks ausentes como no banco."""
+    rng = np.random.default_rng(seed)
+
+    def sparse(low, high, missing):
+        values = rng.uniform(low, high, count).round(2)
+        return np.where(rng.random(count) < missing, np.nan, values)
+
+    return pd.DataFrame({
+        "id": [f"provider-{i % 50}/model-{i}" for i in range(count)],
+        "artificial_analysis_intelligence_score": sparse(40, 98, 0.3),
+        "swe_bench_verified": sparse(5, 85, 0.3),
+        "agentic_score": sparse(0, 90, 0.5),
+        "bfcl_score": sparse(0, 95, 0.5),
+        "niah_score": sparse(0, 100, 0.7),
+        "humanity_last_exam_score": sparse(0, 40, 0.7),
+        "aider_polyglot_score": sparse(0, 80, 0.5),
+        "leaderboard_ai_score": sparse(1050, 1450, 0.3),
+        "price_input": np.where(rng.random(count) < 0.1, 0.0, sparse(0.05, 30, 0.05)),
+        "price_output": np.where(rng.random(count) < 0.1, 0.0, sparse(0.1, 120, 0.05)),
+        "plan_price_monthly": sparse(10, 200, 0.9),
+        "plan_tokens_included": sparse(1e5, 1e8, 0.9).round(),
+    })
+
+
+def random_presets(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        {"id": 100 + i, "name": f"custom-{i}", **{column: rng.choice([0, 0, rng.randint(1, 40)]) for column in WEIGHT_COLUMNS}}
+        for i in range(count)
+    ]
+
+
+def scalar_scores(components: np.ndarray, presets: list) -> np.ndarray:
+    """Referência: renormalização por modelo e por preset em Python puro."""
+    rows = components.tolist()
+    weights = [[float(preset.get(column) or 0) for column in WEIGHT_COLUMNS] for preset in presets]
+    result = []
+    for row in rows:
+        scores = []
+        for preset_weights in weights:
+            total, used = 0.0, 0.0
+            for value, weight in zip(row, preset_weights):
+                if value == value and weight:
+                    total += value * weight
+                    used += weight
+            scores.append(total / used if used else float("nan"))
+        result.append(scores)
+    return np.array(result, dtype=np.float64)
+
+
+def best_of(func, repeat: int, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do score composto por preset")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Tamanhos de catálogo (separados por vírgula)")
+    parser.add_argument("--extra-presets", type=int, default=28, help="Presets além dos quatro padrão")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição (usa a melhor)")
+    args = parser.parse_args()
+
+    presets = list(DEFAULT_PRESETS) + random_presets(args.extra_presets)
+    weights = weight_matrix(presets)
+    print(f"🧮 {len(presets)} presets x {len(WEIGHT_COLUMNS)} componentes\n")
+    print(f"{'modelos':>10} {'escalar (ms)':>14} {'componentes (ms)':>17} {'matriz (ms)':>12} {'ganho':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        frame = generate_frame(size)
+        components = component_matrix(frame)
+
+        # Confere que os dois caminhos concordam antes de medir
+        scores, _ = composite_scores(components, weights)
+        assert np.allclose(scores, scalar_scores(components, presets), equal_nan=True)
+
+        scalar_time = best_of(scalar_scores, args.repeat, components, presets)
+        components_time = best_of(component_matrix, args.repeat, frame)
+        matrix_time = best_of(composite_scores, args.repeat, components, weights)
+        print(
+            f"{size:>10} {scalar_time * 1000:>14.1f} {components_time * 1000:>17.1f} {matrix_time * 1000:>12.2f}"
+            f" {scalar_time / matrix_time:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark do histórico de snapshots (storage/snapshots.py).
+Grava um ano de execuções semanais sintéticas num diretório temporário,
+confere que o estado "as of" de cada semana reproduz o catálogo gravado
+e mede as consultas (rankings numa data, histórico de preço, variações).
+"""
+
+import argparse
+import copy
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.rankings import RankingIndex
+from storage.snapshots import SnapshotStore, flatten_models
+
+
+def synthetic_model(rng: random.Random, i: int) -> dict:
+    provider = f"provider-{i % 40}"
+    return {
+        "id": f"{provider}/model-{i}",
+        "name": f"Model {i}",
+        "provider": provider,
+        "context_length": rng.choice([8192, 32768, 128000, 200000]),
+        "pricing": {"prompt": round(rng.uniform(0.05, 30), 4), "completion": round(rng.uniform(0.1, 120), 4)},
+        "benchmarks": {
+            "arena_elo": rng.choice([None, rng.randint(1100, 1450)]),
+            "swe_bench_full": rng.choice([None, round(rng.uniform(5, 85), 1)]),
+            "intelligence_score": rng.choice([None, rng.randint(50, 98)]),
+        },
+        "performance": {"output_speed_tps": None, "latency_ttft": None},
+        "cost_benefit_scores": {"coding": round(rng.uniform(0, 500), 2), "general": round(rng.uniform(0, 900), 2)},
+    }
+
+
+def weekly_catalogs(models: int, weeks: int, churn: float, seed: int = 42):
+    """Catálogo por semana: ~churn dos preços mudam, alguns modelos entram e saem."""
+    rng = random.Random(seed)
+    catalog = [synthetic_model(rng, i) for i in range(models)]
+    next_id = models
+    for _ in range(weeks):
+        for model in catalog:
+            if rng.random() < churn:
+                model["pricing"]["prompt"] = round(model["pricing"]["prompt"] * rng.uniform(0.5, 1.5), 4)
+        for _ in range(rng.randint(0, 3)):
+            catalog.pop(rng.randrange(len(catalog)))
+        for _ in range(rng.randint(0, 4)):
+            catalog.append(synthetic_model(rng, next_id))
+            next_id += 1
+        yield copy.deepcopy(catalog)
+
+
+def timed(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do histórico de snapshots")
+    parser.add_argument("--models", type=int, default=2000, help="Modelos no catálogo")
+    parser.add_argument("--weeks", type=int, default=52, help="Execuções semanais")
+    parser.add_argument("--churn", type=float, default=0.05, help="Fração de preços alterados por semana")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por medição (usa a melhor)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        store = SnapshotStore(root)
+        start_date = datetime(2025, 1, 5, 6, 0)
+        snapshots = []
+        write_start = time.perf_counter()
+        for week, catalog in enumerate(weekly_catalogs(args.models, args.weeks, args.churn)):
+            collected_at = start_date + timedelta(weeks=week)
+            store.append(catalog, collected_at.isoformat())
+            snapshots.append((collected_at, catalog))
+        write_time = time.perf_counter() - write_start
+
+        rows = len(store.frame())
+        files = len(list(Path(root).rglob("*.parquet")))
+        size = sum(p.stat().st_size for p in Path(root).rglob("*.parquet"))
+        full_rows = sum(len(catalog) for _, catalog in snapshots)
+        print(f"\n🗄️ {args.weeks} execuções, {args.models:,} modelos: {rows:,} linhas gravadas de {full_rows:,} ({rows / full_rows:.1%})")
+        print(f"   {files} arquivos Parquet, {size / 1024:,.0f} KiB, escrita total {write_time:.1f} s")
+
+        # Estado reconstruído == catálogo gravado em cada semana
+        for collected_at, catalog in snapshots:
+            expected = flatten_models(catalog).sort_values("model_id", ignore_index=True)
+            got = store.as_of(collected_at.strftime("%Y-%m-%d")).sort_values("model_id", ignore_index=True)
+            assert expected["model_id"].tolist() == got["model_id"].tolist(), collected_at
+            assert expected["row_hash"].tolist() == got["row_hash"].tolist(), collected_at
+            expected_rankings = RankingIndex(sorted(catalog, key=lambda m: m["id"])).rankings()
+            assert store.rankings_as_of(collected_at.isoformat()) == expected_rankings, collected_at
+        print("   ✅ as_of e rankings_as_of conferem com o catálogo de todas as semanas")
+
+        middle = snapshots[len(snapshots) // 2][0].strftime("%Y-%m-%d")
+        model_id = snapshots[0][1][0]["id"]
+        cold = SnapshotStore(root)
+        measurements = [
+            ("carga do histórico (fria)", lambda: SnapshotStore(root).frame()),
+            (f"as_of({middle})", lambda: cold.as_of(middle)),
+            (f"rankings em {middle} (cálculo)", lambda: RankingIndex(cold.models_as_of(middle)).rankings()),
+            (f"rankings_as_of({middle}) (cache por execução)", lambda: cold.rankings_as_of(middle)),
+            (f"price_history({model_id})", lambda: cold.price_history(model_id)),
+            ("price_changes(> 20%)", lambda: cold.price_changes(20)),
+        ]
+        cold.frame()
+        print(f"\n   {'consulta':<50} {'ms':>8}")
+        for label, func in measurements:
+            print(f"   {label:<50} {timed(func, args.repeat):>8.2f}")
+        print(f"\n   {len(cold.price_changes(20)):,} variações de preço > 20% no período")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Benchmark de value.latest_benchmarks (database/latest_benchmarks.sql)
+contra as views com LEFT JOIN LATERAL por modelo, num PostgreSQL local.
+
+Cria um schema descartável com um histórico sintético (vários snapshots
+por modelo), mede as views atuais, aplica a migração no mesmo schema,
+confere que a tabela reproduz os scores das views e o custo mensal de
+/api/models e mede as leituras novas e o custo do refresh.
+
+Uso:
+    python scripts/benchmark_latest_benchmarks.py --dsn postgresql://localhost/postgres
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from storage.benchmarks_loader import connect, refresh_latest_benchmarks
+
+SCHEMA = "latest_bench"
+MIGRATION = Path(__file__).parent.parent.parent / "database" / "latest_benchmarks.sql"
+
+# Recorte de database/schema_v2_agentic.sql
+TABLES = f"""
+CREATE SCHEMA {SCHEMA};
+CREATE TABLE {SCHEMA}.llm_master_list (
+    id VARCHAR(100) PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    provider VARCHAR(100) NOT NULL,
+    context_window INTEGER,
+    is_active BOOLEAN DEFAULT TRUE,
+    supports_coding BOOLEAN DEFAULT TRUE,
+    supports_agents BOOLEAN DEFAULT TRUE
+);
+CREATE TABLE {SCHEMA}.benchmarks (
+    id SERIAL PRIMARY KEY,
+    llm_id VARCHAR(100) REFERENCES {SCHEMA}.llm_master_list(id) ON DELETE CASCADE,
+    artificial_analysis_intelligence_score DECIMAL(10, 2),
+    price_input DECIMAL(10, 4),
+    price_output DECIMAL(10, 4),
+    leaderboard_ai_score DECIMAL(10, 2),
+    swe_bench_verified DECIMAL(10, 2),
+    agentic_score DECIMAL(10, 2),
+    bfcl_score DECIMAL(10, 2),
+    niah_score DECIMAL(10, 2),
+    humanity_last_exam_score DECIMAL(10, 2),
+    aider_polyglot_score DECIMAL(10, 2),
+    plan_price_monthly DECIMAL(10, 2),
+    plan_price_annual DECIMAL(10, 2),
+    plan_tokens_included INTEGER,
+    plan_requests_per_day INTEGER,
+    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    data_source VARCHAR(100),
+    UNIQUE(llm_id, collected_at)
+);
+CREATE INDEX ON {SCHEMA}.benchmarks(llm_id);
+CREATE INDEX ON {SCHEMA}.benchmarks(collected_at);
+"""
+
+# Views atuais (schema_v2_agentic.sql). v_performance_score também expõe
+# preços/plano: a versão do arquivo não expõe e v_value_score falha sem eles.
+PERFORMANCE_SUM = """
+    COALESCE(b.artificial_analysis_intelligence_score * 0.15, 0) +
+    COALESCE(b.swe_bench_verified * 0.20, 0) +
+    COALESCE(b.agentic_score * 0.20, 0) +
+    COALESCE(b.bfcl_score * 0.10, 0) +
+    COALESCE(b.niah_score * 0.05, 0) +
+    COALESCE(b.humanity_last_exam_score * 0.10, 0) +
+    COALESCE(b.aider_polyglot_score * 0.15, 0) +
+    COALESCE(b.leaderboard_ai_score * 0.05, 0)"""
+VALUE_EXPR = """
+    CASE
+        WHEN (COALESCE(b.price_input, 0) + COALESCE(b.price_output, 0) * 0.5) > 0
+        THEN b.performance_score / (b.price_input + b.price_output * 0.5)
+        ELSE 0
+    END"""
+LATERAL_VIEWS = f"""
+CREATE VIEW {SCHEMA}.v_performance_score AS
+SELECT lm.id, lm.name, lm.provider,
+    b.price_input, b.price_output, b.plan_price_monthly, b.plan_tokens_included,
+    {PERFORMANCE_SUM} as performance_score,
+    ROW_NUMBER() OVER (ORDER BY {PERFORMANCE_SUM} DESC) as performance_rank
+FROM {SCHEMA}.llm_master_list lm
+LEFT JOIN LATERAL (
+    SELECT * FROM {SCHEMA}.benchmarks b2 WHERE b2.llm_id = lm.id ORDER BY b2.collected_at DESC LIMIT 1
+) b ON true
+WHERE lm.is_active = TRUE AND lm.supports_coding = TRUE AND lm.supports_agents = TRUE;
+
+CREATE VIEW {SCHEMA}.v_value_score AS
+SELECT lm.id, lm.name, lm.provider, b.price_input, b.price_output, b.performance_score,
+    {VALUE_EXPR} as value_score,
+    ROW_NUMBER() OVER (ORDER BY {VALUE_EXPR} DESC) as value_rank
+FROM {SCHEMA}.v_performance_score b
+JOIN {SCHEMA}.llm_master_list lm ON lm.id = b.id
+WHERE lm.is_active = TRUE;
+"""
+
+def synthetic(models: int, snapshots: int) -> str:
+    return f"""
+SELECT setseed(0.42);
+INSERT INTO {SCHEMA}.llm_master_list (id, name, provider, context_window, is_active, supports_coding, supports_agents)
+SELECT 'provider-' || (i % 40) || '/model-' || i, 'Model ' || i, 'provider-' || (i % 40),
+       (ARRAY[8192, 32768, 128000, 200000])[1 + i % 4], i % 20 <> 0, true, i % 10 <> 0
+FROM generate_series(1, {models}) i;
+
+INSERT INTO {SCHEMA}.benchmarks (
+    llm_id, collected_at, price_input, price_output, artificial_analysis_intelligence_score,
+    swe_bench_verified, agentic_score, bfcl_score, niah_score, humanity_last_exam_score,
+    aider_polyglot_score, leaderboard_ai_score
+)
+SELECT 'provider-' || (i % 40) || '/model-' || i,
+       TIMESTAMP '2025-01-05 06:00' + (s || ' weeks')::interval,
+       round((random() * 30)::numeric, 4),
+       CASE WHEN random() < 0.02 THEN NULL WHEN random() < 0.05 THEN 0 ELSE round((random() * 120)::numeric, 4) END,
+       CASE WHEN random() < 0.3 THEN NULL ELSE round((50 + random() * 48)::numeric, 2) END,
+       CASE WHEN random() < 0.3 THEN NULL ELSE round((5 + random() * 80)::numeric, 2) END,
+       CASE WHEN random() < 0.5 THEN NULL ELSE round((random() * 90)::numeric, 2) END,
+       CASE WHEN random() < 0.5 THEN NULL ELSE round((random() * 90)::numeric, 2) END,
+       CASE WHEN random() < 0.7 THEN NULL ELSE round((random() * 100)::numeric, 2) END,
+       CASE WHEN random() < 0.7 THEN NULL ELSE round((random() * 40)::numeric, 2) END,
+       CASE WHEN random() < 0.5 THEN NULL WHEN random() < 0.05 THEN 0 ELSE round((random() * 80)::numeric, 2) END,
+       CASE WHEN random() < 0.3 THEN NULL ELSE 1100 + floor(random() * 350) END
+FROM generate_series(1, {models}) i, generate_series(0, {snapshots} - 1) s;
+ANALYZE {SCHEMA}.llm_master_list;
+ANALYZE {SCHEMA}.benchmarks;
+"""
+
+# /api/models: leitura atual (todas as linhas de benchmarks) e nova
+ROUTE_CURRENT = f"""
+SELECT lm.id, b.price_input, b.price_output, b.price_input * 1.0 + b.price_output * 0.5 as monthly_cost,
+       b.swe_bench_verified, b.agentic_score, b.artificial_analysis_intelligence_score, b.bfcl_score,
+       b.leaderboard_ai_score, b.aider_polyglot_score
+FROM {SCHEMA}.llm_master_list lm
+INNER JOIN {SCHEMA}.benchmarks b ON b.llm_id = lm.id
+WHERE b.price_input IS NOT NULL AND b.price_output IS NOT NULL AND lm.is_active = TRUE
+"""
+ROUTE_LATEST = f"""
+SELECT * FROM {SCHEMA}.latest_benchmarks
+WHERE price_input IS NOT NULL AND price_output IS NOT NULL
+ORDER BY monthly_cost
+"""
+
+
+def timed(conn, query: str, repeat: int) -> tuple:
+    timings, rows = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(conn.execute(query).fetchall())
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de latest_benchmarks contra as views LATERAL")
+    parser.add_argument("--dsn", default=os.environ.get("TEST_DATABASE_URL"), help="PostgreSQL de teste (TEST_DATABASE_URL)")
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--snapshots", type=int, default=52, help="Snapshots por modelo")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("informe --dsn ou TEST_DATABASE_URL (nunca o banco de produção)")
+
+    conn = connect(args.dsn)
+    try:
+        conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        conn.execute(TABLES)
+        conn.execute(LATERAL_VIEWS)
+        conn.execute(synthetic(args.models, args.snapshots))
+        total = conn.execute(f"SELECT count(*) FROM {SCHEMA}.benchmarks").fetchone()[0]
+        print(f"\n🗃️ {args.models:,} modelos x {args.snapshots} snapshots = {total:,} linhas em benchmarks")
+
+        queries = {
+            "top 50 v_performance_score": f"SELECT * FROM {SCHEMA}.v_performance_score ORDER BY performance_rank LIMIT 50",
+            "top 50 v_value_score": f"SELECT * FROM {SCHEMA}.v_value_score ORDER BY value_rank LIMIT 50",
+        }
+        before = {label: timed(conn, query, args.repeat) for label, query in queries.items()}
+        before["/api/models (todas as linhas)"] = timed(conn, ROUTE_CURRENT, args.repeat)
+        expected = {
+            "performance": conn.execute(f"SELECT id, performance_score FROM {SCHEMA}.v_performance_score ORDER BY id").fetchall(),
+            "value": conn.execute(f"SELECT id, value_score FROM {SCHEMA}.v_value_score ORDER BY id").fetchall(),
+        }
+
+        # Migração no schema descartável
+        start = time.perf_counter()
+        conn.execute(MIGRATION.read_text(encoding="utf-8").replace("value.", f"{SCHEMA}."))
+        migration_ms = (time.perf_counter() - start) * 1000
+
+        assert conn.execute(f"SELECT id, performance_score FROM {SCHEMA}.v_performance_score ORDER BY id").fetchall() == expected["performance"]
+        assert conn.execute(f"SELECT id, value_score FROM {SCHEMA}.v_value_score ORDER BY id").fetchall() == expected["value"]
+        for price_input, price_output, monthly_cost in conn.execute(
+            f"SELECT price_input, price_output, monthly_cost "
+            f"FROM {SCHEMA}.latest_benchmarks WHERE price_input IS NOT NULL AND price_output IS NOT NULL"
+        ):
+            assert abs(float(monthly_cost) - (float(price_input) * 1.0 + float(price_output) * 0.5)) < 1e-6
+        print("✅ latest_benchmarks reproduz as views e o custo mensal")
+
+        # Um preço NULL: value_score NULL como nas views, sem abortar o INSERT (trigger)
+        conn.execute(
+            f"INSERT INTO {SCHEMA}.benchmarks (llm_id, collected_at, price_input, price_output) "
+            f"VALUES ('provider-1/model-1', TIMESTAMP '2030-01-01', 1.5, NULL)"
+        )
+        row = conn.execute(f"SELECT price_output, value_score FROM {SCHEMA}.latest_benchmarks WHERE llm_id = 'provider-1/model-1'").fetchone()
+        assert row == (None, None), row
+        print("✅ preço NULL grava value_score NULL")
+
+        after = {label: timed(conn, query, args.repeat) for label, query in queries.items()}
+        after["/api/models (latest_benchmarks)"] = timed(conn, ROUTE_LATEST, args.repeat)
+
+        print(f"\n   {'consulta':<40} {'views LATERAL (ms)':>19} {'tabela (ms)':>12} {'linhas':>8}")
+        for (label, (old_ms, _)), (new_ms, rows) in zip(before.items(), after.values()):
+            print(f"   {label:<40} {old_ms:>19.2f} {new_ms:>12.2f} {rows:>8,}")
+
+        with conn.cursor() as cur:
+            ids = [row[0] for row in conn.execute(f"SELECT id FROM {SCHEMA}.llm_master_list ORDER BY random() LIMIT 50")]
+            start = time.perf_counter()
+            refresh_latest_benchmarks(cur, ids, schema=SCHEMA)
+            partial_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            refresh_latest_benchmarks(cur, schema=SCHEMA)
+            full_ms = (time.perf_counter() - start) * 1000
+        print(f"\n   refresh: migração + carga inicial {migration_ms:.0f} ms, completo {full_ms:.0f} ms, 50 modelos {partial_ms:.1f} ms")
+    finally:
+        conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
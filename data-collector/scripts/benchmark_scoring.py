@@ -0,0 +1,120 @@
+"""
+Benchmark do caminho vetorizado de scoring.
+Compara o loop escalar (um cálculo por modelo por categoria) com
+batch_scoring.score_columns em catálogos sintéticos.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.batch_scoring import score_columns
+
+
+def generate_synthetic_models(count: int, seed: int = 42) -> list:
+    """
+    Gera um catálogo mesclado sintético com ~30% de benchmarks ausentes.
+    """
+    rng = random.Random(seed)
+
+    def maybe(value):
+        return value if rng.random() > 0.3 else None
+
+    return [
+        {
+            "id": f"provider-{i % 50}/model-{i}",
+            "pricing": {
+                "prompt": round(rng.uniform(0, 30), 4),
+                "completion": round(rng.choice([0, rng.uniform(0, 120)]), 4),
+            },
+            "benchmarks": {
+                "swe_bench_full": maybe(round(rng.uniform(5, 85), 1)),
+                "arena_elo": maybe(rng.randint(1100, 1450)),
+                "intelligence_score": maybe(rng.randint(50, 98)),
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_cost_benefit_score(price_per_1m, benchmark_score, benchmark_type="coding"):
+    """Implementação escalar original (referência do benchmark)."""
+    if not benchmark_score or price_per_1m <= 0:
+        return 0.0
+    if benchmark_type == "elo":
+        normalized_score = (benchmark_score - 1200) / 3
+    else:
+        normalized_score = benchmark_score
+    return round((normalized_score / price_per_1m) * 100, 2)
+
+
+def scalar_path(models: list) -> list:
+    """Caminho antigo: Python escalar, branching por modelo."""
+    results = []
+    for m in models:
+        prompt = m["pricing"]["prompt"]
+        completion = m["pricing"]["completion"]
+        avg_price = (prompt + completion) / 2 if completion > 0 else prompt
+        results.append({
+            "coding": legacy_cost_benefit_score(avg_price, m["benchmarks"]["swe_bench_full"], "coding"),
+            "general": legacy_cost_benefit_score(avg_price, m["benchmarks"]["intelligence_score"], "intelligence"),
+        })
+    return results
+
+
+def build_columns(models: list) -> dict:
+    """Extrai as colunas do catálogo (custo pago uma vez por execução)."""
+    columns = {
+        "price_prompt": np.array([m["pricing"]["prompt"] for m in models], dtype=np.float64),
+        "price_completion": np.array([m["pricing"]["completion"] for m in models], dtype=np.float64),
+    }
+    for column in ("swe_bench_full", "arena_elo", "intelligence_score"):
+        columns[column] = np.array([m["benchmarks"][column] for m in models], dtype=np.float64)
+    return columns
+
+
+def best_of(func, data, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do scoring vetorizado")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Tamanhos de catálogo (separados por vírgula)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição (usa a melhor)")
+    args = parser.parse_args()
+
+    print(f"{'modelos':>10} {'escalar (ms)':>14} {'colunas (ms)':>14} {'kernel (ms)':>13} {'ganho total':>12} {'ganho kernel':>13}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        models = generate_synthetic_models(size)
+
+        # Confere que os dois caminhos concordam antes de medir
+        expected = scalar_path(models)
+        columns = build_columns(models)
+        batch = score_columns(columns)
+        for category in ("coding", "general"):
+            got = np.nan_to_num(batch[f"cost_benefit_{category}"], nan=0.0)
+            assert np.allclose(got, [r[category] for r in expected]), category
+
+        scalar_time = best_of(scalar_path, models, args.repeat)
+        columns_time = best_of(build_columns, models, args.repeat)
+        kernel_time = best_of(score_columns, columns, args.repeat)
+        total_time = columns_time + kernel_time
+        print(
+            f"{size:>10} {scalar_time * 1000:>14.1f} {columns_time * 1000:>14.1f} {kernel_time * 1000:>13.1f}"
+            f" {scalar_time / total_time:>11.1f}x {scalar_time / kernel_time:>12.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
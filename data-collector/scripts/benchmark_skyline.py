@@ -0,0 +1,99 @@
+"""
+Benchmark da fronteira de Pareto (calculators/skyline.py).
+Compara a comparação par a par ingênua com a varredura 2-D
+(preço x SWE-bench) e o sort-filter-skyline N-D em catálogos sintéticos,
+e confere que as fronteiras batem com as contagens de dominância.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.skyline import _fill_missing, dimension_matrix, dominance_counts, frontier_2d, frontier_nd
+
+
+def generate_synthetic_models(count: int, seed: int = 42) -> list:
+    """Catálogo mesclado sintético: preço correlacionado com qualidade, ~30% de ausentes."""
+    rng = random.Random(seed)
+
+    def maybe(value):
+        return value if rng.random() > 0.3 else None
+
+    models = []
+    for i in range(count):
+        quality = rng.random()
+        price = round(max(0.0, rng.gauss(quality * 20, 5)), 4)
+        models.append({
+            "id": f"provider-{i % 50}/model-{i}",
+            "context_length": rng.choice([8192, 32768, 128000, 200000, 1000000]),
+            "pricing": {"prompt": price, "completion": round(price * rng.uniform(1, 5), 4)},
+            "benchmarks": {
+                "swe_bench_full": maybe(round(5 + quality * 70 + rng.gauss(0, 8), 1)),
+                "intelligence_score": maybe(round(50 + quality * 40 + rng.gauss(0, 5))),
+            },
+            "performance": {"output_speed_tps": maybe(round(rng.uniform(20, 400), 1))},
+        })
+    return models
+
+
+def naive_frontier(points: np.ndarray) -> np.ndarray:
+    """Referência: cada ponto contra todos os outros, em Python puro."""
+    rows = points.tolist()
+    mask = []
+    for a in rows:
+        dominated = False
+        for b in rows:
+            if all(x >= y for x, y in zip(b, a)) and any(x > y for x, y in zip(b, a)):
+                dominated = True
+                break
+        mask.append(not dominated)
+    return np.array(mask, dtype=bool)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da fronteira de Pareto")
+    parser.add_argument("--sizes", default="1000,5000,20000", help="Tamanhos de catálogo (separados por vírgula)")
+    parser.add_argument("--naive-limit", type=int, default=5000, help="Maior catálogo medido com a referência ingênua")
+    args = parser.parse_args()
+
+    print(
+        f"{'modelos':>9} {'fronteira':>10} {'ingênuo 2-D':>12} {'varredura':>10} "
+        f"{'ingênuo N-D':>12} {'SFS N-D':>9} {'contagens':>10}   (ms)"
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        models = generate_synthetic_models(size)
+        matrix = dimension_matrix(models)
+        points = _fill_missing(matrix)
+        pair = matrix[~np.isnan(matrix[:, 1])][:, :2]
+
+        sweep, sweep_ms = timed(frontier_2d, -pair[:, 0], pair[:, 1])
+        sfs, sfs_ms = timed(frontier_nd, points)
+        (dominated_by, _), counts_ms = timed(dominance_counts, points)
+        assert (sfs == (dominated_by == 0)).all()
+
+        naive_2d_ms = naive_nd_ms = float("nan")
+        if size <= args.naive_limit:
+            expected_2d, naive_2d_ms = timed(naive_frontier, pair)
+            expected_nd, naive_nd_ms = timed(naive_frontier, points)
+            assert (sweep == expected_2d).all() and (sfs == expected_nd).all()
+
+        print(
+            f"{size:>9} {int(sfs.sum()):>10} {naive_2d_ms:>12.1f} {sweep_ms:>10.2f} "
+            f"{naive_nd_ms:>12.1f} {sfs_ms:>9.1f} {counts_ms:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
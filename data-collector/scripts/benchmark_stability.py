@@ -0,0 +1,102 @@
+"""
+Benchmark da estabilidade de rankings (calculators/stability.py).
+Compara o Monte Carlo iteração a iteração (sorteio + sorted() por
+ranking) com o caminho em lotes, confere os histogramas de posição
+contra a ordenação em Python e mede rank_stability() com 10k iterações.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.composite import DEFAULT_PRESETS
+from calculators.stability import DEFAULT_NOISE, composite_sampler, cost_benefit_sampler, rank_histograms, rank_stability
+
+
+def generate_synthetic_models(count: int, seed: int = 42) -> list:
+    """Catálogo mesclado sintético: qualidade correlacionada com preço, ~40% de benchmarks ausentes."""
+    rng = random.Random(seed)
+
+    def maybe(value):
+        return value if rng.random() > 0.4 else None
+
+    models = []
+    for i in range(count):
+        quality = rng.random()
+        price = round(max(0.01, rng.gauss(quality * 10, 3)), 4)
+        models.append({
+            "id": f"provider-{i % 50}/model-{i}",
+            "pricing": {"prompt": price, "completion": round(price * rng.uniform(1, 5), 4)},
+            "benchmarks": {
+                "swe_bench_full": maybe(round(5 + quality * 70 + rng.gauss(0, 8), 1)),
+                "swe_bench_verified": maybe(round(10 + quality * 70 + rng.gauss(0, 8), 1)),
+                "intelligence_score": maybe(round(50 + quality * 40 + rng.gauss(0, 5))),
+                "arena_elo": maybe(round(1100 + quality * 300 + rng.gauss(0, 30))),
+            },
+        })
+    return models
+
+
+def naive_histograms(scores: list) -> list:
+    """Referência: para cada iteração e ranking, sorted() dos elegíveis em Python."""
+    result = []
+    for criterion in scores:
+        size = criterion.shape[1]
+        counts = np.zeros((size, size), dtype=np.int64)
+        for row in criterion.tolist():
+            order = sorted(range(size), key=lambda i: (-row[i], i))
+            for position, i in enumerate(order):
+                counts[i, position] += 1
+        result.append(counts)
+    return result
+
+
+def loop_path(models: list, iterations: int, seed: int = 1) -> float:
+    """Monte Carlo uma iteração por vez (mesmos rankings); devolve segundos por iteração."""
+    samplers = [
+        composite_sampler(models, DEFAULT_PRESETS, DEFAULT_NOISE)[3],
+        cost_benefit_sampler(models, DEFAULT_NOISE)[3],
+    ]
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for sample in samplers:
+            for criterion in sample(rng, 1):
+                row = criterion[0].tolist()
+                sorted(range(len(row)), key=lambda i: -row[i])
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da estabilidade de rankings")
+    parser.add_argument("--sizes", default="300,1000,2000", help="Tamanhos de catálogo (separados por vírgula)")
+    parser.add_argument("--iterations", type=int, default=10_000, help="Iterações do Monte Carlo")
+    parser.add_argument("--loop-iterations", type=int, default=200, help="Iterações medidas no caminho iteração a iteração")
+    args = parser.parse_args()
+
+    print(f"{'modelos':>9} {'loop 10k (s, estimado)':>23} {'lotes 10k (s)':>14} {'ganho':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        models = generate_synthetic_models(size)
+
+        # Histogramas em lote x sorted() sobre os mesmos scores sorteados
+        _, _, eligible, sample = composite_sampler(models, DEFAULT_PRESETS, DEFAULT_NOISE)
+        scores = sample(np.random.default_rng(3), 50)
+        batched = rank_histograms(lambda rng, batch: scores, eligible, 50, np.random.default_rng(0), batch=50, stable=True)
+        if size <= 1000:
+            assert all((a == b).all() for a, b in zip(batched, naive_histograms(scores)))
+
+        loop_time = loop_path(models, args.loop_iterations) * args.iterations
+        start = time.perf_counter()
+        rank_stability(models, DEFAULT_PRESETS, iterations=args.iterations)
+        batch_time = time.perf_counter() - start
+        print(f"{size:>9} {loop_time:>23.1f} {batch_time:>14.2f} {loop_time / batch_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
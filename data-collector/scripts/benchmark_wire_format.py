@@ -0,0 +1,123 @@
+"""
+Benchmark do formato colunar do ranking.
+Compara o JSON atual (array de objetos) com o payload colunar
+(publishers/columnar.py) em bytes (minificado, gzip, brotli) e tempo de
+parse (json.loads + decodificação), no dataset publicado e em catálogos
+sintéticos.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from publishers.artifacts import compress, minify
+from publishers.columnar import COLUMNAR_FIELDS, _get_path, decode_columnar, encode_columnar
+
+PUBLIC_MODELS = Path(__file__).parent.parent.parent / "public" / "data" / "models.json"
+
+PROVIDERS = ["openai", "anthropic", "google", "meta-llama", "mistralai", "deepseek", "qwen", "x-ai", "cohere", "groq"]
+FAMILIES = ["gpt", "claude", "gemini", "llama", "mistral", "deepseek", "qwen", "grok", "command", "phi"]
+
+
+def generate_synthetic_dataset(count: int, seed: int = 42) -> dict:
+    """Dataset mesclado sintético no formato de final_dataset.json."""
+    rng = random.Random(seed)
+
+    def maybe(value):
+        return value if rng.random() > 0.3 else None
+
+    models = []
+    for i in range(count):
+        provider = rng.choice(PROVIDERS)
+        family = rng.choice(FAMILIES)
+        prompt = round(rng.uniform(0, 30), 6)
+        completion = round(rng.uniform(0, 120), 6)
+        models.append({
+            "id": f"{provider}/{family}-{i}",
+            "name": f"{family.title()} {rng.randint(1, 5)}.{rng.randint(0, 9)} Variant {i}",
+            "provider": provider,
+            "context_length": rng.choice([8192, 32768, 128000, 200000, 1000000]),
+            "pricing": {"prompt": prompt, "completion": completion},
+            "benchmarks": {
+                "arena_elo": maybe(rng.randint(1100, 1450)),
+                "swe_bench_full": maybe(round(rng.uniform(5, 85), 2)),
+                "swe_bench_verified": maybe(round(rng.uniform(10, 90), 2)),
+                "intelligence_score": maybe(round(rng.uniform(50, 98), 2)),
+            },
+            "cost_benefit_scores": {
+                "coding": round(rng.uniform(0, 500), 2),
+                "general": round(rng.uniform(0, 900), 2),
+            },
+        })
+    rankings = {
+        "by_price": [
+            {"rank": r, "model_id": m["id"], "price": m["pricing"]["prompt"]}
+            for r, m in enumerate(sorted(models, key=lambda m: m["pricing"]["prompt"])[:50], 1)
+        ]
+    }
+    return {"updated_at": "2026-01-01T00:00:00", "total_models": count, "models": models, "rankings": rankings}
+
+
+def check_roundtrip(dataset: dict, payload: dict):
+    """Valores decodificados batem com o original até a escala de cada coluna."""
+    rows = decode_columnar(json.loads(minify(payload)))
+    assert len(rows) == len(dataset["models"])
+    for model, row in zip(dataset["models"], rows):
+        for column, path, kind, scale in COLUMNAR_FIELDS:
+            if kind != "num":
+                continue
+            original = _get_path(model, path)
+            if original is None:
+                assert row[column] is None, (model["id"], column)
+            else:
+                assert abs(row[column] - original) <= 0.5 / scale + 1e-9, (model["id"], column)
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def compare(label: str, dataset: dict, repeat: int):
+    payload = encode_columnar(dataset)
+    check_roundtrip(dataset, payload)
+
+    row_bytes = minify(dataset)
+    columnar_bytes = minify(payload)
+    row_parse = best_of(lambda: json.loads(row_bytes), repeat)
+    columnar_parse = best_of(lambda: decode_columnar(json.loads(columnar_bytes)), repeat)
+
+    print(f"\n📊 {label} ({len(dataset['models']):,} modelos)")
+    print(f"   {'formato':<10} {'minificado':>12} {'gzip':>10} {'br':>10} {'parse (ms)':>11}")
+    for name, raw, parse in (("linhas", row_bytes, row_parse), ("colunar", columnar_bytes, columnar_parse)):
+        encoded = compress(raw)
+        sizes = [f"{len(encoded[enc]):>10,}" if enc in encoded else f"{'—':>10}" for enc in ("gzip", "br")]
+        print(f"   {name:<10} {len(raw):>12,} {' '.join(sizes)} {parse * 1000:>11.2f}")
+    print(f"   colunar/linhas: {len(columnar_bytes) / len(row_bytes):.0%} dos bytes minificados")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do formato colunar do ranking")
+    parser.add_argument("--input", default=str(PUBLIC_MODELS), help="Dataset publicado")
+    parser.add_argument("--sizes", default="1000,10000", help="Tamanhos sintéticos (separados por vírgula)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por medição (usa a melhor)")
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        compare(Path(args.input).name, json.load(f), args.repeat)
+
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        compare("sintético", generate_synthetic_dataset(size), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
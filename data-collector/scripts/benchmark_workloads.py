@@ -0,0 +1,117 @@
+"""
+Benchmark do simulador de custo por perfil de uso (calculators/workloads.py).
+Compara o loop escalar (um cálculo por modelo por perfil) com simulate()
+em catálogos e conjuntos de perfis sintéticos.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.workloads import model_matrix, profile_matrix, simulate
+
+
+def generate_synthetic_models(count: int, seed: int = 42) -> list:
+    """Catálogo sintético: ~40% com preço de cache, ~5% com taxa por requisição, ~50% com velocidade, ~2% roteadores (-1)."""
+    rng = random.Random(seed)
+    models = []
+    for i in range(count):
+        prompt = round(rng.uniform(0, 15), 4) if rng.random() > 0.02 else -1
+        models.append({
+            "id": f"provider-{i % 50}/model-{i}",
+            "pricing": {
+                "prompt": prompt,
+                "completion": round(prompt * rng.uniform(1, 5), 4) if prompt >= 0 else -1,
+                "input_cache_read": round(prompt * 0.1, 4) if rng.random() < 0.4 else None,
+                "request": 0.001 if rng.random() < 0.05 else None,
+            },
+            "performance": {
+                "output_speed_tps": round(rng.uniform(20, 400), 1) if rng.random() < 0.5 else None,
+                "latency_ttft": round(rng.uniform(0.2, 3), 2),
+            },
+        })
+    return models
+
+
+def generate_profiles(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"profile-{i}",
+            "input_tokens": rng.randint(500, 200_000),
+            "output_tokens": rng.randint(50, 8_000),
+            "cached_input_share": round(rng.uniform(0, 0.9), 2),
+            "requests_per_month": rng.randint(10, 50_000),
+            "requests_per_task": rng.randint(1, 40),
+        }
+        for i in range(count)
+    ]
+
+
+def scalar_path(models: list, profiles: list) -> list:
+    """Referência: custo mensal e segundos por tarefa, modelo a modelo."""
+    results = []
+    for m in models:
+        pricing, perf = m["pricing"], m["performance"]
+        cache_read = pricing["input_cache_read"] if pricing["input_cache_read"] is not None else pricing["prompt"]
+        unknown = pricing["prompt"] < 0 or pricing["completion"] < 0
+        row = []
+        for p in profiles:
+            per_request = float("nan") if unknown else (
+                p["input_tokens"] * (1 - p["cached_input_share"]) * pricing["prompt"]
+                + p["input_tokens"] * p["cached_input_share"] * cache_read
+                + p["output_tokens"] * pricing["completion"]
+            ) / 1_000_000 + (pricing["request"] or 0)
+            tps = perf["output_speed_tps"]
+            seconds = (perf["latency_ttft"] + p["output_tokens"] / tps) * p["requests_per_task"] if tps else float("nan")
+            row.append((per_request * p["requests_per_month"], seconds))
+        results.append(row)
+    return results
+
+
+def best_of(func, repeat: int, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do simulador de custo por perfil de uso")
+    parser.add_argument("--sizes", default="500,2000,10000", help="Tamanhos de catálogo (separados por vírgula)")
+    parser.add_argument("--profiles", type=int, default=300, help="Perfis de uso")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição (usa a melhor)")
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.profiles)
+    print(f"🧾 {len(profiles)} perfis\n")
+    print(f"{'modelos':>10} {'escalar (ms)':>14} {'extração (ms)':>15} {'simulate (ms)':>15} {'ganho':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        models = generate_synthetic_models(size)
+        prices, workloads = model_matrix(models), profile_matrix(profiles)
+
+        # Confere que os dois caminhos concordam antes de medir
+        result = simulate(prices, workloads)
+        expected = np.array(scalar_path(models, profiles))
+        assert np.allclose(result["monthly_cost"], expected[:, :, 0], equal_nan=True)
+        assert np.allclose(result["seconds_per_task"], expected[:, :, 1], equal_nan=True)
+
+        scalar_time = best_of(scalar_path, args.repeat, models, profiles)
+        extract_time = best_of(model_matrix, args.repeat, models)
+        simulate_time = best_of(simulate, args.repeat, prices, workloads)
+        print(
+            f"{size:>10} {scalar_time * 1000:>14.1f} {extract_time * 1000:>15.1f} {simulate_time * 1000:>15.2f}"
+            f" {scalar_time / simulate_time:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Confere o loader de value.benchmarks (storage/benchmarks_loader.py)
+contra um PostgreSQL local. Cria um schema descartável com as colunas
+usadas de value.llm_master_list/value.benchmarks, roda cenários de
+inserção, atualização, linhas sem mudança e ids desconhecidos, e apaga
+o schema no fim.
+
+Uso:
+    python scripts/check_benchmarks_loader.py --dsn postgresql://localhost/postgres
+    TEST_DATABASE_URL=... python scripts/check_benchmarks_loader.py
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from storage.benchmarks_loader import benchmark_rows, connect, load_benchmarks
+
+SCHEMA = "loader_check"
+
+# Recorte de database/schema_v2_agentic.sql (tipos de fix_and_populate_benchmarks.sql)
+DDL = f"""
+CREATE SCHEMA {SCHEMA};
+CREATE TABLE {SCHEMA}.llm_master_list (
+    id VARCHAR(100) PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    provider VARCHAR(100) NOT NULL
+);
+CREATE TABLE {SCHEMA}.benchmarks (
+    id SERIAL PRIMARY KEY,
+    llm_id VARCHAR(100) REFERENCES {SCHEMA}.llm_master_list(id) ON DELETE CASCADE,
+    artificial_analysis_intelligence_score DECIMAL(10, 2),
+    leaderboard_ai_score DECIMAL(10, 2),
+    swe_bench_verified DECIMAL(10, 2),
+    price_input DECIMAL(10, 4),
+    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    data_source VARCHAR(100),
+    UNIQUE(llm_id, collected_at)
+);
+INSERT INTO {SCHEMA}.llm_master_list VALUES
+    ('openai/gpt-4o', 'GPT-4o', 'openai'),
+    ('anthropic/claude-sonnet-4', 'Claude Sonnet 4', 'anthropic'),
+    ('google/gemini-2.5-pro', 'Gemini 2.5 Pro', 'google');
+INSERT INTO {SCHEMA}.benchmarks (llm_id, artificial_analysis_intelligence_score, leaderboard_ai_score, price_input, data_source)
+VALUES ('openai/gpt-4o', 80.0, 1270, 2.5, 'seed'),
+       ('anthropic/claude-sonnet-4', 85.0, 1290, 3.0, 'seed');
+"""
+
+
+def snapshot(conn):
+    return {
+        row[0]: row[1:]
+        for row in conn.execute(
+            f"SELECT llm_id, artificial_analysis_intelligence_score, leaderboard_ai_score, swe_bench_verified, "
+            f"price_input, data_source FROM {SCHEMA}.benchmarks ORDER BY llm_id"
+        )
+    }
+
+
+def run_checks(conn):
+    load = lambda data: load_benchmarks(
+        conn, benchmark_rows(data),
+        table=f"{SCHEMA}.benchmarks", master_table=f"{SCHEMA}.llm_master_list",
+    )
+    data = {"benchmarks": {
+        "openai/gpt-4o": {"intelligence_score": 80.0, "arena_elo": 1275, "swe_bench": None},  # muda só o ELO
+        "anthropic/claude-sonnet-4": {"intelligence_score": 85.001, "arena_elo": 1290, "swe_bench": 0},  # igual após arredondar
+        "google/gemini-2.5-pro": {"intelligence_score": 88.5, "arena_elo": 1300, "swe_bench": 63.8},  # sem linha
+        "acme/unknown-model": {"intelligence_score": 50, "arena_elo": None, "swe_bench": None},  # fora do cadastro
+        "acme/no-scores": {"intelligence_score": None, "arena_elo": None, "swe_bench": None},
+    }}
+
+    stats = load(data)
+    assert (stats["staged"], stats["updated"], stats["inserted"], stats["unchanged"]) == (4, 1, 1, 1), stats
+    assert stats["unknown_ids"] == ["acme/unknown-model"], stats
+    rows = snapshot(conn)
+    assert float(rows["openai/gpt-4o"][1]) == 1275 and float(rows["openai/gpt-4o"][3]) == 2.5, rows  # preço intacto
+    assert rows["openai/gpt-4o"][4] == "seed", rows
+    assert rows["google/gemini-2.5-pro"][4] == "benchmarks_unified", rows
+    print("✅ primeira carga: 1 atualizado, 1 inserido, 1 sem mudança, 1 desconhecido")
+
+    # Mesma coleta de novo: nada muda
+    stats = load(data)
+    assert (stats["updated"], stats["inserted"], stats["unchanged"]) == (0, 0, 3), stats
+    assert snapshot(conn) == rows
+    print("✅ carga repetida: nenhuma linha tocada")
+
+    # NULL não apaga valor existente
+    stats = load({"benchmarks": {"google/gemini-2.5-pro": {"intelligence_score": None, "arena_elo": 1310, "swe_bench": None}}})
+    after = snapshot(conn)["google/gemini-2.5-pro"]
+    assert stats["updated"] == 1 and float(after[0]) == 88.5 and float(after[1]) == 1310, after
+    print("✅ NULL preserva valores existentes")
+
+    # Valor inválido em uma linha: a carga inteira é desfeita
+    before = snapshot(conn)
+    try:
+        load({"benchmarks": {
+            "openai/gpt-4o": {"intelligence_score": 99.0, "arena_elo": None, "swe_bench": None},
+            "anthropic/claude-sonnet-4": {"intelligence_score": 10 ** 9, "arena_elo": None, "swe_bench": None},
+        }})
+        raise AssertionError("carga com overflow deveria falhar")
+    except Exception as e:
+        assert "overflow" in str(e), e
+    assert snapshot(conn) == before
+    print("✅ erro em uma linha desfaz a carga inteira")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Confere o loader de value.benchmarks num PostgreSQL local")
+    parser.add_argument("--dsn", default=os.environ.get("TEST_DATABASE_URL"), help="PostgreSQL de teste (TEST_DATABASE_URL)")
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("informe --dsn ou TEST_DATABASE_URL (nunca o banco de produção)")
+
+    conn = connect(args.dsn)
+    try:
+        conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        conn.execute(DDL)
+        run_checks(conn)
+    finally:
+        conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Consultas ao histórico de snapshots (data/history).
+
+Uso:
+    python scripts/history.py rankings --as-of 2026-03-01 [--criterion by_price] [--top 10]
+    python scripts/history.py prices openai/gpt-4o-mini
+    python scripts/history.py changes --threshold 20 [--since 2026-01-01] [--until 2026-06-30]
+    python scripts/history.py ingest data/processed/final_dataset.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from storage.snapshots import SnapshotStore
+
+HISTORY_DIR = Path(__file__).parent.parent / "data" / "history"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultas ao histórico de snapshots")
+    parser.add_argument("--root", default=str(HISTORY_DIR), help="Diretório do histórico")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rankings = commands.add_parser("rankings", help="Rankings como estavam numa data")
+    rankings.add_argument("--as-of", default=None, help="Data (YYYY-MM-DD) ou timestamp; padrão: mais recente")
+    rankings.add_argument("--criterion", default=None, help="Só um critério (ex.: by_price)")
+    rankings.add_argument("--top", type=int, default=10, help="Posições exibidas")
+
+    prices = commands.add_parser("prices", help="Histórico de preço de um modelo")
+    prices.add_argument("model_id")
+
+    changes = commands.add_parser("changes", help="Variações de preço acima de N%% entre execuções")
+    changes.add_argument("--threshold", type=float, default=10.0, help="Variação mínima (%%)")
+    changes.add_argument("--column", default="price_prompt", choices=["price_prompt", "price_completion"])
+    changes.add_argument("--since", default=None)
+    changes.add_argument("--until", default=None)
+
+    ingest = commands.add_parser("ingest", help="Grava um dataset mesclado como snapshot")
+    ingest.add_argument("input", help="JSON com models e updated_at (ex.: final_dataset.json)")
+
+    args = parser.parse_args()
+    store = SnapshotStore(args.root)
+
+    if args.command == "rankings":
+        criteria = [args.criterion] if args.criterion else None
+        for criterion, entries in store.rankings_as_of(args.as_of, k=args.top, criteria=criteria).items():
+            print(f"\n🏆 {criterion} (as of {args.as_of or 'agora'})")
+            for entry in entries:
+                value = {k: v for k, v in entry.items() if k not in ("rank", "model_id")}
+                print(f"   {entry['rank']:>3}. {entry['model_id']:<50} {json.dumps(value)}")
+
+    elif args.command == "prices":
+        history = store.price_history(args.model_id)
+        if history.empty:
+            print(f"❌ Sem histórico para {args.model_id}")
+            return
+        print(f"\n💲 {args.model_id}")
+        for row in history.itertuples():
+            prices = "removido do catálogo" if row.removed else f"${row.price_prompt:.4f} / ${row.price_completion:.4f} por 1M"
+            print(f"   {row.valid_from:%Y-%m-%d}  {prices}")
+
+    elif args.command == "changes":
+        found = store.price_changes(args.threshold, column=args.column, start=args.since, end=args.until)
+        print(f"\n📈 {len(found)} variações de {args.column} > {args.threshold:g}%")
+        for row in found.itertuples():
+            print(f"   {row.valid_from:%Y-%m-%d}  {row.model_id:<50} ${row.old:.4f} -> ${row.new:.4f} ({row.change_pct:+.1f}%)")
+
+    elif args.command == "ingest":
+        with open(args.input, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        run = store.append(data["models"], data.get("updated_at"))
+        print(f"🗄️ {run['collected_at']}: {run['changed']} alterados, {run['removed']} removidos de {run['models']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Publica o dataset do site como artefatos estáticos: JSON minificado com
+hash no nome, .gz/.br pré-comprimidos e manifest.json. O mesmo dataset
+também sai no formato colunar (<name>-columnar, ver publishers/columnar.py),
+como API estática em shards (índice "models-index" + public/data/api/,
+ver publishers/shards.py), com os custos por perfil de uso
+(<name>-workloads, ver calculators/workloads.py) e com as tabelas de
+breakeven plano x API (<name>-breakeven, ver calculators/breakeven.py).
+
+Uso:
+    python scripts/publish.py                                   # data/processed/final_dataset.json (run_weekly.py)
+    python scripts/publish.py --input ../public/data/models.json        # baseline curado à mão
+    python scripts/publish.py --workloads data/workloads.json          # perfis próprios
+    python scripts/publish.py --plans data/processed/monthly_plans.json # planos sem banco
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculators.breakeven import breakeven_table, load_plans
+from calculators.workloads import load_profiles, workloads_payload
+from publishers.artifacts import KEEP_VERSIONS, publish_json
+from publishers.columnar import encode_columnar
+from publishers.shards import INDEX_NAME, publish_shards
+
+PUBLIC_DATA_DIR = Path(__file__).parent.parent.parent / "public" / "data"
+FINAL_DATASET = Path(__file__).parent.parent / "data" / "processed" / "final_dataset.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publica artefatos compactos do dataset")
+    parser.add_argument("--input", default=str(FINAL_DATASET), help="Dataset de entrada (padrão: final_dataset.json do run_weekly)")
+    parser.add_argument("--name", default="models", help="Nome do artefato no manifest")
+    parser.add_argument("--out-dir", default=str(PUBLIC_DATA_DIR), help="Diretório publicado")
+    parser.add_argument("--keep", type=int, default=KEEP_VERSIONS, help="Versões mantidas")
+    parser.add_argument("--no-columnar", action="store_true", help="Não publica o formato colunar")
+    parser.add_argument("--no-shards", action="store_true", help="Não publica a API em shards")
+    parser.add_argument("--workloads", default=None, help="JSON com perfis de uso (padrão: DEFAULT_PROFILES)")
+    parser.add_argument("--no-workloads", action="store_true", help="Não publica os custos por perfil de uso")
+    parser.add_argument("--plans", default=None, help="JSON com planos de assinatura (padrão: banco ou monthly_plans.json)")
+    parser.add_argument("--no-breakeven", action="store_true", help="Não publica as tabelas de breakeven plano x API")
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    entries = {args.name: publish_json(data, args.name, args.out_dir, keep=args.keep)}
+    if not args.no_columnar and "models" in data:
+        columnar_name = f"{args.name}-columnar"
+        entries[columnar_name] = publish_json(encode_columnar(data), columnar_name, args.out_dir, keep=args.keep)
+    if not args.no_shards and "models" in data:
+        entries[INDEX_NAME] = publish_shards(data, args.out_dir, keep=args.keep)
+    if not args.no_workloads and "models" in data:
+        workloads_name = f"{args.name}-workloads"
+        payload = workloads_payload(data["models"], load_profiles(args.workloads), updated_at=data.get("updated_at"))
+        entries[workloads_name] = publish_json(payload, workloads_name, args.out_dir, keep=args.keep)
+    if not args.no_breakeven and "models" in data:
+        breakeven_name = f"{args.name}-breakeven"
+        payload = breakeven_table(
+            data["models"],
+            load_plans(path=args.plans) if args.plans else None,
+            load_profiles(args.workloads),
+            updated_at=data.get("updated_at"),
+        )
+        entries[breakeven_name] = publish_json(payload, breakeven_name, args.out_dir, keep=args.keep)
+
+    original = os.path.getsize(args.input)
+    for name, entry in entries.items():
+        print(f"\n📦 {name} -> {args.out_dir}/{entry['path']}")
+        print(f"   original (indent=2): {original:>9,} B")
+        print(f"   minificado:          {entry['bytes']:>9,} B ({entry['bytes'] / original:.0%})")
+        for encoding, info in entry["encodings"].items():
+            print(f"   {encoding:<20} {info['bytes']:>9,} B ({info['bytes'] / original:.0%})")
+
+
+if __name__ == "__main__":
+    main()
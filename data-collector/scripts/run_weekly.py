@@ -3,6 +3,7 @@ Script de execução semanal completa.
 Roda via GitHub Actions todo domingo.
 """
 
+import asyncio
 import json
 import sys
 from datetime import datetime
@@ -10,10 +11,10 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from collectors.openrouter import fetch_openrouter_models, normalize_model
-from collectors.arena import fetch_arena_leaderboard, normalize_arena_model
-from collectors.swebench import fetch_swebench_leaderboard, normalize_swebench_model
-from collectors.artificial import fetch_artificial_leaderboard, normalize_artificial_model
+from calculators.cost_benefit import generate_final_dataset, merge_model_data
+from calculators.stability import rank_stability
+from collectors.orchestrator import STATUS_OK, collect_all, source_status
+from storage.snapshots import SnapshotStore
 
 
 def run_weekly_update():
@@ -27,45 +28,18 @@ def run_weekly_update():
     
     timestamp = datetime.utcnow().isoformat() + "Z"
     
-    # 1. Coleta OpenRouter
-    print("📡 1/4 Coletando dados da OpenRouter...")
-    openrouter_models = fetch_openrouter_models()
-    if openrouter_models:
-        normalized_openrouter = [normalize_model(m) for m in openrouter_models]
-        print(f"   ✅ {len(normalized_openrouter)} modelos coletados")
-    else:
-        print("   ❌ Falha ao coletar OpenRouter")
-        normalized_openrouter = []
+    # 1-4. Coleta todas as fontes em paralelo
+    print("📡 Coletando OpenRouter, Arena, SWE-bench e Artificial Analysis em paralelo...")
+    results = asyncio.run(collect_all())
     
-    # 2. Coleta Arena
-    print("\n📡 2/4 Coletando dados do Arena...")
-    arena_models = fetch_arena_leaderboard()
-    if arena_models:
-        normalized_arena = [normalize_arena_model(m) for m in arena_models]
-        print(f"   ✅ {len(normalized_arena)} modelos coletados")
-    else:
-        print("   ⚠️ Usando dados de fallback")
-        normalized_arena = []
+    for name, result in results.items():
+        icon = "✅" if result["status"] == STATUS_OK else "⚠️" if result["models"] else "❌"
+        print(f"   {icon} {name}: {len(result['models'])} modelos ({result['status']}, {result['elapsed_ms']} ms)")
     
-    # 3. Coleta SWE-bench
-    print("\n📡 3/4 Coletando dados do SWE-bench...")
-    swebench_models = fetch_swebench_leaderboard()
-    if swebench_models:
-        normalized_swebench = [normalize_swebench_model(m) for m in swebench_models]
-        print(f"   ✅ {len(normalized_swebench)} modelos coletados")
-    else:
-        print("   ⚠️ Usando dados de fallback")
-        normalized_swebench = []
-    
-    # 4. Coleta Artificial Analysis
-    print("\n📡 4/4 Coletando dados do Artificial Analysis...")
-    artificial_models = fetch_artificial_leaderboard()
-    if artificial_models:
-        normalized_artificial = [normalize_artificial_model(m) for m in artificial_models]
-        print(f"   ✅ {len(normalized_artificial)} modelos coletados")
-    else:
-        print("   ⚠️ Usando dados de fallback")
-        normalized_artificial = []
+    normalized_openrouter = results["openrouter"]["models"]
+    normalized_arena = results["arena"]["models"]
+    normalized_swebench = results["swebench"]["models"]
+    normalized_artificial = results["artificial_analysis"]["models"]
     
     # 5. Compila dataset final
     print("\n📊 Compilando dataset final...")
@@ -73,12 +47,7 @@ def run_weekly_update():
     dataset = {
         "updated_at": timestamp,
         "update_type": "weekly",
-        "sources": {
-            "openrouter": {"models_count": len(normalized_openrouter), "status": "ok"},
-            "arena": {"models_count": len(normalized_arena), "status": "ok"},
-            "swebench": {"models_count": len(normalized_swebench), "status": "ok"},
-            "artificial_analysis": {"models_count": len(normalized_artificial), "status": "ok"}
-        },
+        "sources": source_status(results),
         "models": normalized_openrouter,
         "benchmarks": {
             "arena": normalized_arena,
@@ -99,6 +68,29 @@ def run_weekly_update():
     print(f"   Total de modelos: {len(normalized_openrouter)}")
     print(f"   Timestamp: {timestamp}")
     
+    # 5b. Dataset do site (merge, scores, rankings, Pareto, presets): entrada de scripts/publish.py
+    final_file = output_dir / "final_dataset.json"
+    final_dataset = generate_final_dataset(
+        output_path=str(final_file),
+        sources=(normalized_openrouter, normalized_arena, normalized_swebench, normalized_artificial),
+    )
+    print(f"\n✅ Dataset final salvo em: {final_file} ({final_dataset['total_models']} modelos)")
+    
+    # 6. Histórico: snapshot do catálogo mesclado (só linhas alteradas)
+    merged_models = merge_model_data(
+        normalized_openrouter, normalized_arena, normalized_swebench, normalized_artificial
+    )
+    history = SnapshotStore(str(Path(__file__).parent.parent / "data" / "history"))
+    run = history.append(merged_models, timestamp)
+    print(f"\n🗄️ Histórico: {run['changed']} modelos alterados, {run['removed']} removidos")
+    
+    # 7. Estabilidade dos rankings (Monte Carlo sobre benchmarks, ELO e pesos)
+    stability = rank_stability(merged_models, updated_at=timestamp)
+    stability_file = output_dir / "rank_stability.json"
+    with open(stability_file, "w", encoding="utf-8") as f:
+        json.dump(stability, f, indent=2, ensure_ascii=False)
+    print(f"\n🎲 Estabilidade: {len(stability['criteria'])} rankings x {stability['iterations']} iterações -> {stability_file}")
+    
     # Gera resumo
     print("\n📈 Resumo de Preços (top 5 mais baratos):")
     sorted_by_price = sorted(
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Servidor SSE local que imita o /chat/completions da OpenRouter com
+stream=true, para testar o cliente de streaming sem gastar créditos.
+
+Uso:
+    python scripts/sse_stub_server.py --port 8765          # só o servidor
+    python scripts/sse_stub_server.py --check              # servidor + verificação do cliente
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def make_handler(tokens: int, delay: float, first_token_delay: float):
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, text: str):
+            self.wfile.write(text.encode("utf-8"))
+            self.wfile.flush()
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+
+            try:
+                # Comentário de keep-alive, como a OpenRouter faz enquanto pesquisa
+                self._send(": OPENROUTER PROCESSING\n\n")
+                time.sleep(first_token_delay)
+
+                for i in range(tokens):
+                    chunk = {"model": payload.get("model"), "choices": [{"delta": {"content": f"tok{i} "}}]}
+                    self._send(f"data: {json.dumps(chunk)}\n\n")
+                    time.sleep(delay)
+
+                usage = {"prompt_tokens": 10, "completion_tokens": tokens, "cost": 0.001 * tokens}
+                self._send(f"data: {json.dumps({'choices': [{'delta': {}}], 'usage': usage})}\n\n")
+                self._send("data: [DONE]\n\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # cliente desistiu (prazo estourado)
+
+    return StubHandler
+
+
+def start_server(port: int, tokens: int, delay: float, first_token_delay: float) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(tokens, delay, first_token_delay))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_check(url: str, tokens: int, delay: float):
+    """Stream completo e stream cortado pelo prazo, conferindo o parcial no disco."""
+    from collectors.streaming import stream_chat_completion_sync
+
+    payload = {"model": "stub/model", "messages": [{"role": "user", "content": "ping"}]}
+    partial_path = os.path.join(tempfile.mkdtemp(), "partial.md")
+    total_s = tokens * delay
+
+    full = stream_chat_completion_sync(payload, "stub", api_key="stub", url=url, partial_path=partial_path, timeout=total_s + 5)
+    assert full["complete"], full["error"]
+    assert full["completion_tokens"] == tokens
+    print(f"✅ Completo: {len(full['content'])} chars, TTFT {full['ttft_ms']} ms, {full['tokens_per_sec']} tok/s")
+
+    cut = stream_chat_completion_sync(payload, "stub", api_key="stub", url=url, partial_path=partial_path, timeout=total_s / 2)
+    with open(partial_path, "r", encoding="utf-8") as f:
+        on_disk = f.read()
+    assert not cut["complete"] and cut["content"], cut
+    assert on_disk == cut["content"] and full["content"].startswith(cut["content"])
+    print(f"✅ Prazo estourado em {cut['elapsed_ms']} ms: {len(cut['content'])} chars mantidos ({partial_path})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in SSE da OpenRouter")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tokens", type=int, default=40)
+    parser.add_argument("--delay", type=float, default=0.05, help="Segundos entre tokens")
+    parser.add_argument("--first-token-delay", type=float, default=0.3)
+    parser.add_argument("--check", action="store_true", help="Roda a verificação do cliente e sai")
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.tokens, args.delay, args.first_token_delay)
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v1/chat/completions"
+
+    if args.check:
+        run_check(url, args.tokens, args.delay)
+        server.shutdown()
+        return
+
+    print(f"📡 SSE stub em {url} (Ctrl+C para sair)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
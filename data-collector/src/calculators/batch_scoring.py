@@ -0,0 +1,134 @@
+"""
+Batch Scoring
+Caminho vetorizado (colunar) para preço médio, normalização de benchmarks
+e scores de custo-benefício de todo o catálogo em uma única passada.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Normalização por tipo de benchmark: (offset, escala) -> (score - offset) / escala
+BENCHMARK_NORMALIZATION = {
+    "coding": (0.0, 1.0),        # SWE-bench: 0-100%
+    "elo": (1200.0, 3.0),        # ELO: tipicamente 1200-1500 -> ~0-100
+    "intelligence": (0.0, 1.0),  # Intelligence score: 0-100
+}
+
+# Coluna de benchmark -> tipo de normalização
+BENCHMARK_COLUMNS = {
+    "swe_bench_full": "coding",
+    "arena_elo": "elo",
+    "intelligence_score": "intelligence",
+}
+
+# Categoria de custo-benefício -> coluna de benchmark usada
+COST_BENEFIT_CATEGORIES = {
+    "coding": "swe_bench_full",
+    "general": "intelligence_score",
+}
+
+
+def _as_float_array(values) -> np.ndarray:
+    """Converte lista/Series com None em array float64 com NaN."""
+    return pd.to_numeric(pd.Series(values, dtype="object"), errors="coerce").to_numpy(dtype=np.float64)
+
+
+def average_price(price_prompt: np.ndarray, price_completion: np.ndarray) -> np.ndarray:
+    """
+    Preço médio por 1M tokens.
+
+    Mesma regra de merge_model_data: média de prompt e completion,
+    ou só prompt quando não há preço de completion.
+    """
+    prompt = np.nan_to_num(np.asarray(price_prompt, dtype=np.float64))
+    completion = np.nan_to_num(np.asarray(price_completion, dtype=np.float64))
+    return np.where(completion > 0, (prompt + completion) / 2, prompt)
+
+
+def normalize_scores(scores: np.ndarray, benchmark_type: str) -> np.ndarray:
+    """Normaliza scores para ~0-100 conforme o tipo de benchmark."""
+    offset, scale = BENCHMARK_NORMALIZATION.get(benchmark_type, (0.0, 1.0))
+    return (np.asarray(scores, dtype=np.float64) - offset) / scale
+
+
+def cost_benefit_scores(
+    price_per_1m: np.ndarray,
+    benchmark_scores: np.ndarray,
+    benchmark_type: str = "coding",
+    decimals: Optional[int] = 2,
+) -> np.ndarray:
+    """
+    Versão vetorizada de calculate_cost_benefit_score.
+
+    Benchmark ausente (NaN) gera NaN; benchmark zero ou preço <= 0 gera 0.0,
+    como na versão escalar.
+    """
+    price = np.asarray(price_per_1m, dtype=np.float64)
+    scores = np.asarray(benchmark_scores, dtype=np.float64)
+
+    normalized = normalize_scores(scores, benchmark_type)
+    valid = (scores != 0) & (price > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(valid, normalized / np.where(price > 0, price, 1.0) * 100, 0.0)
+    result = np.where(np.isnan(scores), np.nan, result)
+
+    if decimals is not None:
+        result = np.round(result, decimals)
+    return result
+
+
+def score_columns(columns: Dict[str, np.ndarray], decimals: Optional[int] = 2) -> Dict[str, np.ndarray]:
+    """
+    Calcula todas as colunas derivadas a partir das colunas de entrada.
+
+    Entrada: price_prompt, price_completion e as colunas de BENCHMARK_COLUMNS
+    (ausentes são tratadas como NaN). Saída: avg_price, normalized_<tipo>
+    e cost_benefit_<categoria>.
+    """
+    size = len(columns["price_prompt"])
+    missing = np.full(size, np.nan)
+
+    avg_price = average_price(columns["price_prompt"], columns["price_completion"])
+    result = {"avg_price": avg_price}
+
+    for column, benchmark_type in BENCHMARK_COLUMNS.items():
+        scores = np.asarray(columns.get(column, missing), dtype=np.float64)
+        result[f"normalized_{benchmark_type}"] = normalize_scores(scores, benchmark_type)
+
+    for category, column in COST_BENEFIT_CATEGORIES.items():
+        scores = np.asarray(columns.get(column, missing), dtype=np.float64)
+        result[f"cost_benefit_{category}"] = cost_benefit_scores(
+            avg_price, scores, BENCHMARK_COLUMNS[column], decimals
+        )
+
+    return result
+
+
+def models_to_frame(merged_models: List[Dict]) -> pd.DataFrame:
+    """Converte o catálogo mesclado (lista de dicts) em DataFrame colunar."""
+    pricing = [m.get("pricing") or {} for m in merged_models]
+    benchmarks = [m.get("benchmarks") or {} for m in merged_models]
+
+    frame = pd.DataFrame({
+        "id": [m.get("id", "") for m in merged_models],
+        "context_length": _as_float_array([m.get("context_length") for m in merged_models]),
+        "price_prompt": _as_float_array([p.get("prompt") for p in pricing]),
+        "price_completion": _as_float_array([p.get("completion") for p in pricing]),
+    })
+    for column in BENCHMARK_COLUMNS:
+        frame[column] = _as_float_array([b.get(column) for b in benchmarks])
+
+    return frame
+
+
+def score_frame(frame: pd.DataFrame, decimals: Optional[int] = 2) -> pd.DataFrame:
+    """Retorna uma cópia do DataFrame com as colunas de score calculadas."""
+    numeric = frame.select_dtypes("number")
+    columns = {name: numeric[name].to_numpy(dtype=np.float64) for name in numeric.columns}
+    scored = frame.copy()
+    for name, values in score_columns(columns, decimals).items():
+        scored[name] = values
+    return scored
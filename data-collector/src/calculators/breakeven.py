@@ -0,0 +1,165 @@
+"""
+Plan Breakeven
+Volume mensal de tokens a partir do qual cada plano de assinatura sai
+mais barato que cada modelo via API, em cada perfil de uso.
+
+No perfil p, o modelo m custa c = cost_per_request / tokens por
+requisição (USD por token, de workloads.simulate), então a API custa
+V x c e o plano custa o preço fixo P: o breakeven é P / c. O plano só
+vence se esse volume couber nos seus limites (tokens_included e
+requests_per_day x 30). Todos os planos x modelos x perfis saem de uma
+divisão com broadcasting.
+
+A tabela publicada guarda, por perfil e plano, os breakevens em ordem
+crescente: para um volume V, uma busca binária separa os modelos em que
+o plano já compensa (breakeven <= V) dos que ainda são mais baratos via API.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+
+from calculators.workloads import DEFAULT_PROFILES, profile_matrix, simulate_models
+from publishers.shards import slugify
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BREAKEVEN_FORMAT = "breakeven-v1"
+DAYS_PER_MONTH = 30
+PLANS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "processed", "monthly_plans.json")
+
+# Planos de value.monthly_plans e os planos por modelo (plan_* da última linha
+# de value.benchmarks, já em value.latest_benchmarks: só modelos ativos)
+PLANS_SQL = """
+    SELECT provider, plan_name, price_monthly, price_annual, tokens_included, requests_per_day, url
+    FROM value.monthly_plans
+    WHERE is_active = TRUE
+    UNION ALL
+    SELECT provider, name, plan_price_monthly, plan_price_annual, plan_tokens_included,
+           plan_requests_per_day, NULL
+    FROM value.latest_benchmarks
+    WHERE plan_price_monthly IS NOT NULL
+    ORDER BY price_monthly, provider, plan_name
+"""
+
+
+def load_plans(conn=None, path: Optional[str] = None) -> List[Dict]:
+    """
+    Planos do banco (conn ou DATABASE_URL) ou, sem banco, de
+    data/processed/monthly_plans.json (mesmos planos de
+    database/insert_monthly_plans.sql).
+    """
+    if conn is None and not path and os.environ.get("DATABASE_URL"):
+        from storage.benchmarks_loader import connect
+
+        with connect() as conn:
+            return load_plans(conn)
+
+    if conn is not None:
+        cursor = conn.execute(PLANS_SQL)
+        names = [column.name for column in cursor.description]
+        return [
+            {name: float(value) if name.startswith("price") and value is not None else value for name, value in zip(names, row)}
+            for row in cursor.fetchall()
+        ]
+
+    with open(path or PLANS_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)["plans"]
+
+
+def plan_keys(plans: Sequence[Dict]) -> List[str]:
+    """"OpenAI" + "ChatGPT Plus" -> "openai/chatgpt-plus"; repetidos ganham sufixo."""
+    keys: List[str] = []
+    for plan in plans:
+        base = f"{slugify(plan.get('provider') or 'unknown')}/{slugify(plan.get('plan_name') or 'plan')}"
+        key, n = base, 2
+        while key in keys:
+            key = f"{base}-{n}"
+            n += 1
+        keys.append(key)
+    return keys
+
+
+def breakeven_matrix(
+    cost_per_request: np.ndarray,
+    workloads: Dict[str, np.ndarray],
+    plans: Sequence[Dict],
+) -> Dict[str, np.ndarray]:
+    """
+    breakeven_tokens (planos x modelos x perfis) em tokens/mês e capacity
+    (planos x perfis). breakeven = inf quando o plano nunca compensa
+    dentro dos limites (ou a API é grátis) e NaN para modelos sem preço.
+    """
+    tokens_per_request = workloads["input_tokens"] + workloads["output_tokens"]
+    price = np.array([float(plan.get("price_monthly") or 0) for plan in plans], dtype=np.float64)
+    tokens_cap = np.array([plan.get("tokens_included") or np.inf for plan in plans], dtype=np.float64)
+    requests_cap = np.array([plan.get("requests_per_day") or np.inf for plan in plans], dtype=np.float64)
+
+    # Capacidade por perfil: o menor entre tokens incluídos e requisições/dia x 30
+    capacity = np.minimum(tokens_cap[:, None], requests_cap[:, None] * DAYS_PER_MONTH * tokens_per_request[None, :])
+
+    per_token = cost_per_request / tokens_per_request[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        breakeven = np.where(price[:, None, None] > 0, price[:, None, None] / per_token[None, :, :], 0.0)
+    breakeven = np.where(breakeven > capacity[:, None, :], np.inf, breakeven)
+    breakeven = np.where(np.isnan(per_token)[None, :, :], np.nan, breakeven)
+    return {"breakeven_tokens": breakeven, "capacity": capacity}
+
+
+def breakeven_table(
+    models: List[Dict],
+    plans: Optional[Sequence[Dict]] = None,
+    profiles: Optional[Sequence[Dict]] = None,
+    updated_at: Optional[str] = None,
+) -> Dict:
+    """
+    Tabela publicada: por perfil e plano, model_ids e breakeven_tokens em
+    ordem crescente (empates pela posição no catálogo) e, em never, os
+    modelos em que o plano nunca compensa. Modelos sem preço ficam de fora.
+    """
+    plans = list(load_plans() if plans is None else plans)
+    profiles = list(DEFAULT_PROFILES if profiles is None else profiles)
+    workloads = profile_matrix(profiles)
+    result = breakeven_matrix(simulate_models(models, profiles)["cost_per_request"], workloads, plans)
+    breakeven, capacity = result["breakeven_tokens"], result["capacity"]
+    ids = [m.get("id", "") for m in models]
+    keys = plan_keys(plans)
+
+    tables = {}
+    for p, profile in enumerate(profiles):
+        by_plan = {}
+        for k, key in enumerate(keys):
+            column = breakeven[k, :, p]
+            finite = np.flatnonzero(np.isfinite(column))
+            order = finite[np.argsort(column[finite], kind="stable")]
+            by_plan[key] = {
+                "model_ids": [ids[i] for i in order.tolist()],
+                "breakeven_tokens": np.ceil(column[order]).astype(np.int64).tolist(),
+                "never": [ids[i] for i in np.flatnonzero(np.isinf(column)).tolist()],
+            }
+        tables[profile["name"]] = by_plan
+
+    logger.info(f"⚖️ Breakeven: {len(plans)} planos x {len(models)} modelos x {len(profiles)} perfis")
+    return {
+        "format": BREAKEVEN_FORMAT,
+        "updated_at": updated_at,
+        "plans": {
+            key: {
+                **{field: plan.get(field) for field in ("provider", "plan_name", "price_monthly", "tokens_included", "requests_per_day", "url")},
+                "capacity_tokens": {
+                    profile["name"]: None if np.isinf(capacity[k, p]) else int(capacity[k, p])
+                    for p, profile in enumerate(profiles)
+                },
+            }
+            for k, (key, plan) in enumerate(zip(keys, plans))
+        },
+        "profiles": {
+            profile["name"]: {field: profile[field] for field in ("input_tokens", "output_tokens", "cached_input_share", "requests_per_task")}
+            for profile in profiles
+        },
+        "tables": tables,
+    }
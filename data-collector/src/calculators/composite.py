@@ -0,0 +1,279 @@
+"""
+Composite Scoring
+Score composto por preset de pesos (value.ranking_weights): todos os
+presets x todos os modelos num único produto de matrizes. Benchmarks
+ausentes saem do cálculo e os pesos do modelo são renormalizados sobre
+os componentes disponíveis (coverage = fração do peso do preset usada).
+
+Componentes na escala 0-100, maior = melhor: benchmarks percentuais como
+estão, ELO pela normalização de batch_scoring e preços/plano em escala
+log entre o menor e o maior valor do catálogo.
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from calculators.batch_scoring import _as_float_array, normalize_scores
+from calculators.rankings import DEFAULT_TOP_K
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WEIGHTS_TABLE = "value.ranking_weights"
+CRITERION_PREFIX = "by_composite_"
+
+# Só entra no ranking quem tem ao menos esta fração da maior coverage do
+# catálogo no preset: um modelo com um único benchmark renormalizado não
+# passa na frente dos que têm todos (o score continua calculado)
+MIN_RELATIVE_COVERAGE = 0.5
+
+# Coluna de value.ranking_weights -> (coluna em value.benchmarks, transformação)
+# "percent": 0-100 como está; "elo": normalize_scores(..., "elo");
+# "log_low"/"log_high": escala log no catálogo, menor/maior = melhor
+WEIGHT_COLUMNS = {
+    "weight_intelligence_score": ("artificial_analysis_intelligence_score", "percent"),
+    "weight_swe_bench": ("swe_bench_verified", "percent"),
+    "weight_agentic_score": ("agentic_score", "percent"),
+    "weight_bfcl": ("bfcl_score", "percent"),
+    "weight_niah": ("niah_score", "percent"),
+    "weight_humanity_exam": ("humanity_last_exam_score", "percent"),
+    "weight_aider_polyglot": ("aider_polyglot_score", "percent"),
+    "weight_leaderboard_ai": ("leaderboard_ai_score", "elo"),
+    "weight_price_input": ("price_input", "log_low"),
+    "weight_price_output": ("price_output", "log_low"),
+    "weight_plan_price": ("plan_price_monthly", "log_low"),
+    "weight_plan_tokens": ("plan_tokens_included", "log_high"),
+}
+
+# Presets inseridos por database/schema_v2_agentic.sql (usados sem banco),
+# pesos na ordem de WEIGHT_COLUMNS
+_SEED_PRESETS = [
+    (1, "performance", True, (15, 20, 20, 10, 5, 10, 15, 5, 0, 0, 0, 0)),
+    (2, "value", False, (10, 15, 15, 8, 3, 7, 10, 3, 25, 25, 25, 25)),
+    (3, "balanced", False, (12, 18, 18, 9, 4, 8, 12, 4, 12, 12, 12, 12)),
+    (4, "agentic", False, (10, 10, 40, 25, 3, 5, 20, 3, 0, 0, 0, 0)),
+]
+DEFAULT_PRESETS = [
+    {"id": preset_id, "name": name, "is_default": is_default, **dict(zip(WEIGHT_COLUMNS, weights))}
+    for preset_id, name, is_default, weights in _SEED_PRESETS
+]
+
+# Categorias da tabela do site (ranking-table.tsx) -> preset que as
+# ordena; None = o preset is_default. Os compostos ficam gravados em
+# value.composite_rankings e no dataset: /api/models e os shards servem o
+# mesmo ranking em vez de repetir a fórmula. cost-savings é só o custo.
+SITE_CATEGORY_PRESETS = {
+    "best-performance": None,
+    "intermediate": "balanced",
+}
+COST_CATEGORY = "cost-savings"
+
+# Campo do dataset final (models.json) -> coluna em value.benchmarks
+DATASET_FIELDS = {
+    "artificial_analysis_intelligence_score": ("benchmarks", "intelligence_score"),
+    "swe_bench_verified": ("benchmarks", "swe_bench_verified"),
+    "leaderboard_ai_score": ("benchmarks", "arena_elo"),
+    "price_input": ("pricing", "prompt"),
+    "price_output": ("pricing", "completion"),
+}
+
+
+def load_presets(conn=None) -> List[Dict]:
+    """
+    Presets de value.ranking_weights (ordem por id). Sem conexão e sem
+    DATABASE_URL, usa DEFAULT_PRESETS.
+    """
+    if conn is None:
+        if not os.environ.get("DATABASE_URL"):
+            return [dict(preset) for preset in DEFAULT_PRESETS]
+        from storage.benchmarks_loader import connect
+
+        with connect() as conn:
+            return load_presets(conn)
+
+    columns = ", ".join(WEIGHT_COLUMNS)
+    cursor = conn.execute(f"SELECT id, name, is_default, {columns} FROM {WEIGHTS_TABLE} ORDER BY id")
+    names = [column.name for column in cursor.description]
+    presets = [dict(zip(names, row)) for row in cursor.fetchall()]
+    if not presets:
+        logger.warning(f"⚠️ {WEIGHTS_TABLE} vazia: usando os presets padrão")
+        return [dict(preset) for preset in DEFAULT_PRESETS]
+    return presets
+
+
+def weight_matrix(presets: Sequence[Dict]) -> np.ndarray:
+    """Pesos (presets x componentes), na ordem de WEIGHT_COLUMNS; NULL = 0."""
+    return np.array(
+        [[float(preset.get(column) or 0) for column in WEIGHT_COLUMNS] for preset in presets],
+        dtype=np.float64,
+    ).reshape(len(presets), len(WEIGHT_COLUMNS))
+
+
+def dataset_frame(models: List[Dict]) -> pd.DataFrame:
+    """Modelos do dataset final -> colunas de value.benchmarks (as que existem)."""
+    frame = pd.DataFrame({"id": [m.get("id", "") for m in models]})
+    for column, (group, field) in DATASET_FIELDS.items():
+        frame[column] = _as_float_array([(m.get(group) or {}).get(field) for m in models])
+    return frame
+
+
+def _log_scale(values: np.ndarray, higher_is_better: bool) -> np.ndarray:
+    """
+    0-100 em escala log entre o menor e o maior valor positivo do
+    catálogo. Zero (grátis / sem limite) é o extremo bom ou ruim.
+    """
+    positive = values[values > 0]
+    result = np.full(values.shape, np.nan)
+    if positive.size:
+        logs = np.log(np.where(values > 0, values, 1.0))
+        low, high = np.log(positive.min()), np.log(positive.max())
+        span = high - low
+        scaled = (logs - low) / span * 100 if span > 0 else np.full(values.shape, 100.0)
+        result = np.where(values > 0, scaled if higher_is_better else 100 - scaled, result)
+    result = np.where(values == 0, 0.0 if higher_is_better else 100.0, result)
+    return np.where(np.isnan(values) | (values < 0), np.nan, result)
+
+
+def component_matrix(frame: pd.DataFrame) -> np.ndarray:
+    """
+    Componentes 0-100 (modelos x WEIGHT_COLUMNS); NaN = ausente. Colunas
+    que o frame não tem contam como ausentes.
+    """
+    size = len(frame)
+    components = np.full((size, len(WEIGHT_COLUMNS)), np.nan)
+    for j, (column, kind) in enumerate(WEIGHT_COLUMNS.values()):
+        if column not in frame:
+            continue
+        values = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        if kind == "percent":
+            # Zero é "sem score", como no loader de benchmarks
+            components[:, j] = np.where(values > 0, np.clip(values, 0, 100), np.nan)
+        elif kind == "elo":
+            components[:, j] = np.where(values > 0, np.clip(normalize_scores(values, "elo"), 0, 100), np.nan)
+        else:
+            components[:, j] = _log_scale(values, higher_is_better=kind == "log_high")
+    return components
+
+
+def composite_scores(components: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scores (modelos x presets) e coverage. Para cada par, a média dos
+    componentes disponíveis ponderada pelos pesos do preset:
+    (X · Wᵀ) / (A · Wᵀ), com A = máscara de disponíveis. Sem nenhum
+    componente com peso, o score é NaN.
+    """
+    available = ~np.isnan(components)
+    weighted = np.nan_to_num(components) @ weights.T
+    used = available.astype(np.float64) @ weights.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(used > 0, weighted / used, np.nan)
+        coverage = used / weights.sum(axis=1)
+    return scores, np.nan_to_num(coverage)
+
+
+def criterion_name(preset: Dict) -> str:
+    return f"{CRITERION_PREFIX}{preset['name']}"
+
+
+def composite_rankings(
+    ids: Sequence[str],
+    scores: np.ndarray,
+    coverage: np.ndarray,
+    presets: Sequence[Dict],
+    k: Optional[int] = DEFAULT_TOP_K,
+    min_coverage: float = MIN_RELATIVE_COVERAGE,
+) -> Dict[str, List[Dict]]:
+    """
+    Ranking por preset ("by_composite_<nome>"): rank, model_id, score e
+    coverage. Ficam de fora modelos sem score ou com coverage abaixo de
+    min_coverage x a maior do preset; empates pela posição no catálogo,
+    como em RankingIndex. k=None mantém o ranking completo.
+    """
+    rankings = {}
+    for p, preset in enumerate(presets):
+        column = scores[:, p]
+        floor = min_coverage * coverage[:, p].max(initial=0.0)
+        eligible = np.flatnonzero(~np.isnan(column) & (coverage[:, p] >= floor))
+        order = eligible[np.argsort(-column[eligible], kind="stable")][:k]
+        rankings[criterion_name(preset)] = [
+            {
+                "rank": rank,
+                "model_id": ids[idx],
+                "score": round(float(column[idx]), 2),
+                "coverage": round(float(coverage[idx, p]), 2),
+            }
+            for rank, idx in enumerate(order.tolist(), 1)
+        ]
+    return rankings
+
+
+def rank_frame(
+    frame: pd.DataFrame,
+    presets: Optional[Sequence[Dict]] = None,
+    k: Optional[int] = DEFAULT_TOP_K,
+) -> Dict[str, List[Dict]]:
+    """Rankings compostos de um frame com id + colunas de value.benchmarks."""
+    presets = load_presets() if presets is None else presets
+    scores, coverage = composite_scores(component_matrix(frame), weight_matrix(presets))
+    return composite_rankings(frame["id"].tolist(), scores, coverage, presets, k)
+
+
+def rank_models(
+    models: List[Dict],
+    presets: Optional[Sequence[Dict]] = None,
+    k: Optional[int] = DEFAULT_TOP_K,
+) -> Dict[str, List[Dict]]:
+    """Rankings compostos dos modelos do dataset final."""
+    return rank_frame(dataset_frame(models), presets, k)
+
+
+def category_preset(presets: Sequence[Dict], category: str) -> Optional[Dict]:
+    """
+    Preset de uma categoria do site; sem o preset pelo nome, o is_default
+    (e, sem is_default, o de menor id), como em /api/models.
+    """
+    name = SITE_CATEGORY_PRESETS.get(category)
+    for preset in presets:
+        if name is not None and preset["name"] == name:
+            return preset
+    defaults = [preset for preset in presets if preset.get("is_default")]
+    return (defaults or list(presets) or [None])[0]
+
+
+def monthly_cost(model: Dict) -> Optional[float]:
+    """Custo mensal de value.latest_benchmarks: input * 1.0 + output * 0.5 (None sem preço)."""
+    pricing = model.get("pricing") or {}
+    prompt, completion = pricing.get("prompt"), pricing.get("completion")
+    if prompt is None or completion is None or prompt < 0 or completion < 0:
+        return None
+    return prompt * 1.0 + completion * 0.5
+
+
+def site_rankings(
+    models: List[Dict],
+    rankings: Dict[str, List[Dict]],
+    presets: Sequence[Dict],
+    k: Optional[int] = DEFAULT_TOP_K,
+) -> Dict[str, List[Dict]]:
+    """
+    Rankings das categorias do site: as de SITE_CATEGORY_PRESETS repetem o
+    ranking composto do preset (rankings = saída de rank_models) e
+    cost-savings ordena pelo custo mensal (empates pela posição no catálogo).
+    """
+    site = {}
+    for category in SITE_CATEGORY_PRESETS:
+        preset = category_preset(presets, category)
+        if preset is not None:
+            site[category] = rankings.get(criterion_name(preset), [])
+
+    costs = [(cost, idx) for idx, cost in enumerate(map(monthly_cost, models)) if cost is not None]
+    site[COST_CATEGORY] = [
+        {"rank": rank, "model_id": models[idx].get("id"), "monthly_cost": round(cost, 6)}
+        for rank, (cost, idx) in enumerate(sorted(costs, key=lambda item: item[0])[:k], 1)
+    ]
+    return site
@@ -4,10 +4,21 @@ Calcula índices de custo-benefício combinando preços e benchmarks.
 """
 
 import json
-from typing import Dict, List, Optional
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 import logging
 
+import numpy as np
+
+# Permite rodar como script (python src/calculators/cost_benefit.py --verify)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.batch_scoring import COST_BENEFIT_CATEGORIES, cost_benefit_scores, score_columns
+from calculators.rankings import DEFAULT_TOP_K, RankingIndex
+from normalizers.model_resolver import ModelResolver
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -23,53 +34,70 @@ def calculate_cost_benefit_score(
     Fórmula: (benchmark_score / price_per_1m) * 100
     
     Quanto maior o score, melhor o custo-benefício.
+    Wrapper escalar de batch_scoring.cost_benefit_scores; para o catálogo
+    inteiro use a versão vetorizada.
     """
     if not benchmark_score or price_per_1m <= 0:
         return 0.0
     
-    # Normaliza o score baseado no tipo de benchmark
-    if benchmark_type == "coding":
-        # SWE-bench: 0-100%
-        normalized_score = benchmark_score
-    elif benchmark_type == "elo":
-        # ELO: tipicamente 1200-1500
-        normalized_score = (benchmark_score - 1200) / 3  # Normaliza para ~0-100
-    elif benchmark_type == "intelligence":
-        # Intelligence score: 0-100
-        normalized_score = benchmark_score
-    else:
-        normalized_score = benchmark_score
-    
-    # Calcula custo-benefício
-    cost_benefit = (normalized_score / price_per_1m) * 100
-    
-    return round(cost_benefit, 2)
+    cost_benefit = cost_benefit_scores(
+        np.array([price_per_1m], dtype=np.float64),
+        np.array([benchmark_score], dtype=np.float64),
+        benchmark_type,
+        decimals=None
+    )[0]
+    
+    return round(float(cost_benefit), 2)
 
 
-def merge_model_data(
+# Fontes de benchmark na ordem dos argumentos de merge_model_data
+BENCHMARK_SOURCES = ("arena", "swebench", "artificial_analysis")
+
+Match = Optional[Tuple[Dict, float]]
+
+
+def resolve_benchmark_matches(
     openrouter_models: List[Dict],
     arena_models: List[Dict],
     swebench_models: List[Dict],
     artificial_models: List[Dict]
-) -> List[Dict]:
+) -> List[Dict[str, Match]]:
     """
-    Combina dados de todas as fontes em um dataset unificado.
+    Resolve, para cada modelo da OpenRouter, a entrada de cada fonte de
+    benchmark: {"arena": (entry, confidence) ou None, ...}.
+    """
+    # Indexa cada fonte uma única vez
+    resolvers = {
+        source: ModelResolver(models)
+        for source, models in zip(BENCHMARK_SOURCES, (arena_models, swebench_models, artificial_models))
+    }
+    
+    return [
+        {
+            source: resolver.resolve(model.get("id", ""), model.get("name", ""))
+            for source, resolver in resolvers.items()
+        }
+        for model in openrouter_models
+    ]
+
+
+def build_merged_models(openrouter_models: List[Dict], matches: List[Dict[str, Match]]) -> List[Dict]:
+    """
+    Monta os modelos mesclados a partir dos matches já resolvidos e
+    calcula os scores de custo-benefício em lote.
     """
     merged = []
     
-    for model in openrouter_models:
+    for model, model_matches in zip(openrouter_models, matches):
         model_id = model.get("id", "")
         model_name = model.get("name", "")
         
-        # Busca benchmarks correspondentes
-        arena_data = find_matching_model(model_id, model_name, arena_models)
-        swebench_data = find_matching_model(model_id, model_name, swebench_models)
-        artificial_data = find_matching_model(model_id, model_name, artificial_models)
-        
-        # Calcula scores de custo-benefício
-        price_prompt = model.get("pricing", {}).get("prompt", 0)
-        price_completion = model.get("pricing", {}).get("completion", 0)
-        avg_price = (price_prompt + price_completion) / 2 if price_completion > 0 else price_prompt
+        arena_match = model_matches["arena"]
+        swebench_match = model_matches["swebench"]
+        artificial_match = model_matches["artificial_analysis"]
+        arena_data = arena_match[0] if arena_match else None
+        swebench_data = swebench_match[0] if swebench_match else None
+        artificial_data = artificial_match[0] if artificial_match else None
         
         merged_model = {
             "id": model_id,
@@ -80,118 +108,86 @@ def merge_model_data(
             "benchmarks": {
                 "arena_elo": arena_data.get("elo_rating") if arena_data else None,
                 "swe_bench_full": swebench_data.get("swe_bench_full") if swebench_data else None,
+                "swe_bench_verified": swebench_data.get("swe_bench_verified") if swebench_data else None,
                 "intelligence_score": artificial_data.get("intelligence_score") if artificial_data else None,
             },
-            "cost_benefit_scores": {
-                "coding": calculate_cost_benefit_score(
-                    avg_price,
-                    swebench_data.get("swe_bench_full") if swebench_data else None,
-                    "coding"
-                ),
-                "general": calculate_cost_benefit_score(
-                    avg_price,
-                    artificial_data.get("intelligence_score") if artificial_data else None,
-                    "intelligence"
-                ),
-            }
+            "performance": {
+                "output_speed_tps": artificial_data.get("output_speed_tps") if artificial_data else None,
+                "latency_ttft": artificial_data.get("latency_ttft") if artificial_data else None,
+            },
+            "match_confidence": {
+                "arena": arena_match[1] if arena_match else None,
+                "swebench": swebench_match[1] if swebench_match else None,
+                "artificial_analysis": artificial_match[1] if artificial_match else None,
+            },
+            "cost_benefit_scores": {},
         }
         
         merged.append(merged_model)
     
+    # Calcula scores de custo-benefício do catálogo inteiro de uma vez
+    columns = {
+        "price_prompt": [m["pricing"].get("prompt", 0) for m in merged],
+        "price_completion": [m["pricing"].get("completion", 0) for m in merged],
+    }
+    for column in set(COST_BENEFIT_CATEGORIES.values()):
+        columns[column] = [m["benchmarks"][column] or np.nan for m in merged]
+    columns = {name: np.array(values, dtype=np.float64) for name, values in columns.items()}
+    
+    scores = score_columns(columns)
+    for category in COST_BENEFIT_CATEGORIES:
+        values = np.nan_to_num(scores[f"cost_benefit_{category}"], nan=0.0).tolist()
+        for merged_model, value in zip(merged, values):
+            merged_model["cost_benefit_scores"][category] = value
+    
     return merged
 
 
+def merge_model_data(
+    openrouter_models: List[Dict],
+    arena_models: List[Dict],
+    swebench_models: List[Dict],
+    artificial_models: List[Dict]
+) -> List[Dict]:
+    """
+    Combina dados de todas as fontes em um dataset unificado.
+    """
+    matches = resolve_benchmark_matches(openrouter_models, arena_models, swebench_models, artificial_models)
+    return build_merged_models(openrouter_models, matches)
+
+
 def find_matching_model(model_id: str, model_name: str, benchmark_list: List[Dict]) -> Optional[Dict]:
     """
     Encontra o modelo correspondente na lista de benchmarks.
-    """
-    model_id_lower = model_id.lower()
-    model_name_lower = model_name.lower()
-    
-    for bench_model in benchmark_list:
-        bench_name = bench_model.get("model_name", "").lower()
-        
-        # Tenta match por nome
-        if bench_name in model_id_lower or bench_name in model_name_lower:
-            return bench_model
-        
-        # Tenta match parcial
-        if any(part in bench_name for part in model_id_lower.split("/")[-1].split("-") if len(part) > 3):
-            return bench_model
     
-    return None
+    Para vários lookups na mesma lista, use ModelResolver diretamente.
+    """
+    return ModelResolver(benchmark_list).find(model_id, model_name)
 
 
-def calculate_rankings(merged_models: List[Dict]) -> Dict:
+def calculate_rankings(
+    merged_models: List[Dict],
+    k: int = DEFAULT_TOP_K,
+    criteria: Optional[Iterable[str]] = None
+) -> Dict:
     """
     Calcula rankings por diferentes critérios.
-    """
-    rankings = {
-        "by_price": [],
-        "by_coding_cost_benefit": [],
-        "by_general_cost_benefit": [],
-        "by_context_window": [],
-    }
-    
-    # Ranking por preço (input)
-    sorted_by_price = sorted(
-        [m for m in merged_models if m.get("pricing", {}).get("prompt", 0) > 0],
-        key=lambda x: x["pricing"]["prompt"]
-    )
-    rankings["by_price"] = [
-        {"rank": i+1, "model_id": m["id"], "price": m["pricing"]["prompt"]}
-        for i, m in enumerate(sorted_by_price[:50])
-    ]
-    
-    # Ranking por custo-benefício (coding)
-    sorted_by_coding_cb = sorted(
-        [m for m in merged_models if m.get("cost_benefit_scores", {}).get("coding", 0) > 0],
-        key=lambda x: x["cost_benefit_scores"]["coding"],
-        reverse=True
-    )
-    rankings["by_coding_cost_benefit"] = [
-        {"rank": i+1, "model_id": m["id"], "score": m["cost_benefit_scores"]["coding"]}
-        for i, m in enumerate(sorted_by_coding_cb[:50])
-    ]
     
-    # Ranking por custo-benefício (general)
-    sorted_by_general_cb = sorted(
-        [m for m in merged_models if m.get("cost_benefit_scores", {}).get("general", 0) > 0],
-        key=lambda x: x["cost_benefit_scores"]["general"],
-        reverse=True
-    )
-    rankings["by_general_cost_benefit"] = [
-        {"rank": i+1, "model_id": m["id"], "score": m["cost_benefit_scores"]["general"]}
-        for i, m in enumerate(sorted_by_general_cb[:50])
-    ]
-    
-    # Ranking por context window
-    sorted_by_context = sorted(
-        [m for m in merged_models if m.get("context_length", 0) > 0],
-        key=lambda x: x["context_length"],
-        reverse=True
-    )
-    rankings["by_context_window"] = [
-        {"rank": i+1, "model_id": m["id"], "context": m["context_length"]}
-        for i, m in enumerate(sorted_by_context[:50])
-    ]
-    
-    return rankings
+    Usa RankingIndex (top-K por seleção parcial); criteria=None gera
+    todos os critérios de RANKING_CRITERIA.
+    """
+    return RankingIndex(merged_models, criteria).rankings(k)
 
 
-def generate_final_dataset(
+def load_raw_sources(
     openrouter_path: str = "data/raw/openrouter_models.json",
     arena_path: str = "data/raw/arena_leaderboard.json",
     swebench_path: str = "data/raw/swebench_leaderboard.json",
-    artificial_path: str = "data/raw/artificial_leaderboard.json",
-    output_path: str = "data/processed/final_dataset.json"
-):
+    artificial_path: str = "data/raw/artificial_leaderboard.json"
+) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]:
     """
-    Gera o dataset final consolidado.
+    Carrega os arquivos brutos: (openrouter, arena, swebench, artificial).
     """
-    print("🔄 Gerando dataset final...")
-    
-    # Carrega dados
     with open(openrouter_path, "r") as f:
         openrouter_data = json.load(f)
     
@@ -220,16 +216,78 @@ def generate_final_dataset(
     except FileNotFoundError:
         logger.warning("Artificial Analysis data not found, using empty list")
     
-    # Merge dados
-    merged_models = merge_model_data(
-        openrouter_models,
-        arena_models,
-        swebench_models,
-        artificial_models
+    return openrouter_models, arena_models, swebench_models, artificial_models
+
+
+def generate_final_dataset(
+    openrouter_path: str = "data/raw/openrouter_models.json",
+    arena_path: str = "data/raw/arena_leaderboard.json",
+    swebench_path: str = "data/raw/swebench_leaderboard.json",
+    artificial_path: str = "data/raw/artificial_leaderboard.json",
+    output_path: str = "data/processed/final_dataset.json",
+    full: bool = False,
+    verify: bool = False,
+    state_path: Optional[str] = None,
+    sources: Optional[Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]] = None
+):
+    """
+    Gera o dataset final consolidado.
+    
+    Por padrão é incremental: com o estado da execução anterior
+    (hashes por modelo e por fonte), só os modelos com entradas novas
+    ou alteradas são mesclados e pontuados de novo, e os rankings são
+    atualizados a partir da ordem anterior. full=True recalcula tudo;
+    verify=True também recalcula do zero e falha se o resultado diferir.
+    sources (openrouter, arena, swebench, artificial) já coletadas em
+    memória dispensam os arquivos brutos (run_weekly).
+    """
+    import os
+    from calculators.composite import load_presets, rank_models, site_rankings
+    from calculators.incremental import build_dataset, load_state, save_state, state_path_for
+    from calculators.skyline import PARETO_FIELD, annotate_pareto, pareto_ranking
+    
+    print("🔄 Gerando dataset final...")
+    state_path = state_path or state_path_for(output_path)
+    
+    # Carrega dados
+    if sources is None:
+        sources = load_raw_sources(openrouter_path, arena_path, swebench_path, artificial_path)
+    
+    previous, state = None, None
+    if not full and os.path.exists(output_path):
+        with open(output_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        # Fronteira de Pareto depende do catálogo inteiro: recalculada abaixo
+        for model in previous.get("models", []):
+            model.pop(PARETO_FIELD, None)
+        state = load_state(state_path)
+    
+    # Merge, scores e rankings (só o que mudou, quando possível)
+    merged_models, rankings, new_state, stats = build_dataset(
+        *sources, k=DEFAULT_TOP_K, previous=previous, state=state
     )
+    mode = "incremental" if stats["incremental"] else "completo"
+    logger.info(f"♻️ Modo {mode}: {stats['recomputed']} de {stats['total']} modelos recalculados")
+    
+    if verify:
+        full_models, full_rankings, _, _ = build_dataset(*sources, k=DEFAULT_TOP_K)
+        if full_models != merged_models or full_rankings != rankings:
+            diff = [m["id"] for m, f in zip(merged_models, full_models) if m != f]
+            raise RuntimeError(
+                f"Resultado {mode} difere do cálculo completo "
+                f"(modelos: {diff[:10]}, rankings iguais: {full_rankings == rankings})"
+            )
+        logger.info("✅ Verificação: resultado idêntico ao cálculo completo")
+    
+    # Fronteira de Pareto (preço, coding, intelligence, velocidade, contexto) e by_pareto
+    rankings.update(pareto_ranking(merged_models, annotate_pareto(merged_models), DEFAULT_TOP_K))
     
-    # Calcula rankings
-    rankings = calculate_rankings(merged_models)
+    # Rankings compostos dos presets de value.ranking_weights (sempre completos: um produto de matrizes)
+    presets = load_presets()
+    rankings.update(rank_models(merged_models, presets, DEFAULT_TOP_K))
+    
+    # Categorias do site (ranking-table.tsx) a partir dos mesmos presets
+    rankings.update(site_rankings(merged_models, rankings, presets, DEFAULT_TOP_K))
     
     # Gera dataset final
     final_dataset = {
@@ -240,12 +298,14 @@ def generate_final_dataset(
     }
     
     # Salva
-    import os
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(final_dataset, f, indent=2, ensure_ascii=False)
     
+    new_state["dataset_updated_at"] = final_dataset["updated_at"]
+    save_state(new_state, state_path)
+    
     logger.info(f"✅ Dataset final salvo em: {output_path}")
     logger.info(f"   Total: {len(merged_models)} modelos")
     logger.info(f"   Rankings calculados: {len(rankings)}")
@@ -254,4 +314,11 @@ def generate_final_dataset(
 
 
 if __name__ == "__main__":
-    generate_final_dataset()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Gera o dataset final consolidado")
+    parser.add_argument("--full", action="store_true", help="Ignora o estado anterior e recalcula tudo")
+    parser.add_argument("--verify", action="store_true", help="Confere o resultado contra um cálculo completo")
+    args = parser.parse_args()
+    
+    generate_final_dataset(full=args.full, verify=args.verify)
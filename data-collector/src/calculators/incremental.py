@@ -0,0 +1,199 @@
+"""
+Incremental Dataset
+Recalcula só os modelos cujas entradas mudaram desde a última execução
+de generate_final_dataset, usando hashes de conteúdo por modelo e por
+fonte, e atualiza os rankings a partir da ordem anterior.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from calculators.cost_benefit import (
+    BENCHMARK_SOURCES,
+    build_merged_models,
+    resolve_benchmark_matches,
+)
+from calculators.rankings import RankingIndex
+from normalizers.model_resolver import ModelResolver
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATE_SUFFIX = ".state.json"
+# Incrementar quando a regra de merge mudar: o estado anterior é descartado
+# e a próxima execução recalcula tudo
+STATE_VERSION = 2
+
+# Campos que mudam a cada coleta sem mudar o dado
+VOLATILE_FIELDS = {"collected_at"}
+
+
+def state_path_for(output_path: str) -> str:
+    """
+    Estado ao lado do dataset (final_dataset.json -> final_dataset.state.json):
+    os dois resolvem do mesmo diretório, qualquer que seja o cwd.
+    """
+    root, _ = os.path.splitext(output_path)
+    return root + STATE_SUFFIX
+
+
+def content_hash(entry: Dict) -> str:
+    """Hash estável do conteúdo de uma entrada (sem campos voláteis)."""
+    stable = {k: v for k, v in entry.items() if k not in VOLATILE_FIELDS}
+    canonical = json.dumps(stable, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def names_hash(entries: List[Dict], name_field: str = "model_name") -> str:
+    """
+    Hash da lista ordenada de nomes de uma fonte.
+
+    O ModelResolver só olha os nomes (e a ordem, no desempate): se este
+    hash não mudou, os matches de um modelo inalterado também não mudaram.
+    """
+    names = [entry.get(name_field) or "" for entry in entries]
+    return hashlib.sha1(json.dumps(names, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def load_state(path: str) -> Optional[Dict]:
+    """Estado da execução anterior, ou None se ausente/incompatível."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get("version") == STATE_VERSION else None
+
+
+def save_state(state: Dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+
+
+class _SourceIndex:
+    """Entradas de uma fonte de benchmark com hashes e resolver sob demanda."""
+
+    def __init__(self, entries: List[Dict]):
+        self.entries = entries
+        self.hashes = [content_hash(entry) for entry in entries]
+        self.names = names_hash(entries)
+        self.positions = {id(entry): pos for pos, entry in enumerate(entries)}
+        self._resolver: Optional[ModelResolver] = None
+
+    def signature(self, match) -> Optional[List]:
+        """(entry, confidence) -> [posição, confidence, hash da entrada]."""
+        if not match:
+            return None
+        pos = self.positions[id(match[0])]
+        return [pos, match[1], self.hashes[pos]]
+
+    def resolve(self, model: Dict) -> Optional[List]:
+        if self._resolver is None:
+            self._resolver = ModelResolver(self.entries)
+        return self.signature(self._resolver.resolve(model.get("id", ""), model.get("name", "")))
+
+    def match(self, signature: Optional[List]):
+        return (self.entries[signature[0]], signature[1]) if signature else None
+
+
+def _orders(index: RankingIndex) -> Dict[str, List[str]]:
+    return {c: [index.ids[i] for i in index.order(c).tolist()] for c in index.criteria}
+
+
+def build_dataset(
+    openrouter_models: List[Dict],
+    arena_models: List[Dict],
+    swebench_models: List[Dict],
+    artificial_models: List[Dict],
+    k: int,
+    previous: Optional[Dict] = None,
+    state: Optional[Dict] = None,
+) -> Tuple[List[Dict], Dict, Dict, Dict]:
+    """
+    Monta modelos e rankings, incrementalmente quando possível.
+
+    previous é o dataset gravado na execução anterior e state o estado
+    salvo com ele; sem eles (ou se não batem) o cálculo é completo.
+    Retorna (models, rankings, novo estado, estatísticas).
+    """
+    sources = {
+        name: _SourceIndex(entries)
+        for name, entries in zip(BENCHMARK_SOURCES, (arena_models, swebench_models, artificial_models))
+    }
+    ids = [model.get("id", "") for model in openrouter_models]
+    openrouter_hashes = [content_hash(model) for model in openrouter_models]
+
+    previous_models = {m["id"]: m for m in (previous or {}).get("models", [])}
+    incremental = (
+        state is not None
+        and previous is not None
+        and state.get("dataset_updated_at") == previous.get("updated_at")
+        and len(set(ids)) == len(ids)
+    )
+
+    if not incremental:
+        matches = resolve_benchmark_matches(openrouter_models, arena_models, swebench_models, artificial_models)
+        signatures = [
+            {source: sources[source].signature(m[source]) for source in BENCHMARK_SOURCES}
+            for m in matches
+        ]
+        models = build_merged_models(openrouter_models, matches)
+        index = RankingIndex(models)
+        changed = set(ids)
+    else:
+        previous_signatures = state["models"]
+        signatures = []
+        changed = set()
+        for model_id, model, model_hash in zip(ids, openrouter_models, openrouter_hashes):
+            before = previous_signatures.get(model_id)
+            dirty = before is None or before["openrouter"] != model_hash or model_id not in previous_models
+            signature = {}
+            for source, source_index in sources.items():
+                if not dirty and state["sources"].get(source) == source_index.names:
+                    # Mesmos nomes na fonte: o match é o mesmo, só o conteúdo pode ter mudado
+                    pos = (before[source] or [None])[0]
+                    signature[source] = None if pos is None else [pos, before[source][1], source_index.hashes[pos]]
+                else:
+                    signature[source] = source_index.resolve(model)
+                dirty = dirty or signature[source] != before.get(source)
+            signatures.append(signature)
+            if dirty:
+                changed.add(model_id)
+
+        positions = [i for i, model_id in enumerate(ids) if model_id in changed]
+        rebuilt = iter(build_merged_models(
+            [openrouter_models[i] for i in positions],
+            [{s: sources[s].match(signatures[i][s]) for s in BENCHMARK_SOURCES} for i in positions],
+        ))
+        models = [next(rebuilt) if model_id in changed else previous_models[model_id] for model_id in ids]
+
+        index = RankingIndex(models)
+        # O desempate dos rankings é a posição no catálogo: se os modelos
+        # inalterados mudaram de ordem relativa, a ordem anterior não serve
+        kept = set(ids) - changed
+        same_order = [i for i in state["catalog"] if i in kept] == [i for i in ids if i in kept]
+        if same_order and set(state["orders"]) >= set(index.criteria):
+            for criterion in index.criteria:
+                index.patch_order(criterion, state["orders"][criterion], changed)
+
+    new_state = {
+        "version": STATE_VERSION,
+        "sources": {source: source_index.names for source, source_index in sources.items()},
+        "catalog": ids,
+        "models": {
+            model_id: {"openrouter": model_hash, **signature}
+            for model_id, model_hash, signature in zip(ids, openrouter_hashes, signatures)
+        },
+        "orders": _orders(index),
+    }
+    stats = {
+        "incremental": incremental,
+        "recomputed": len(changed),
+        "removed": len(set(previous_models) - set(ids)) if incremental else 0,
+        "total": len(models),
+    }
+    return models, index.rankings(k), new_state, stats
@@ -0,0 +1,217 @@
+"""
+Rankings
+Índice de rankings multi-critério com seleção parcial (top-K) e
+ordenação completa sob demanda, reaproveitada entre consultas.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+
+from calculators.batch_scoring import BENCHMARK_COLUMNS, average_price, normalize_scores
+
+DEFAULT_TOP_K = 50
+
+
+def _column(models: List[Dict], getter: Callable[[Dict], Optional[float]]) -> np.ndarray:
+    """Extrai uma coluna float (None -> NaN)."""
+    values = []
+    for m in models:
+        value = getter(m)
+        values.append(np.nan if value is None else value)
+    return np.array(values, dtype=np.float64)
+
+
+def _value_per_dollar(models: List[Dict]) -> np.ndarray:
+    """Média dos benchmarks normalizados disponíveis por dólar (preço médio/1M)."""
+    normalized = np.vstack([
+        normalize_scores(_column(models, lambda m, c=column: (m.get("benchmarks") or {}).get(c)), benchmark_type)
+        for column, benchmark_type in BENCHMARK_COLUMNS.items()
+    ])
+    available = ~np.isnan(normalized)
+    counts = available.sum(axis=0)
+    mean_score = np.where(counts > 0, np.nansum(normalized, axis=0) / np.maximum(counts, 1), np.nan)
+
+    avg_price = average_price(
+        _column(models, lambda m: (m.get("pricing") or {}).get("prompt")),
+        _column(models, lambda m: (m.get("pricing") or {}).get("completion")),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(avg_price > 0, mean_score / avg_price, np.nan)
+
+
+# Critério -> valor por modelo ("getter") ou coluna vetorizada ("column"),
+# direção e nome do campo publicado. Só entram no ranking valores > 0
+# (mesma regra dos rankings originais).
+RANKING_CRITERIA = {
+    "by_price": {
+        "getter": lambda m: (m.get("pricing") or {}).get("prompt"),
+        "descending": False,
+        "field": "price",
+    },
+    "by_coding_cost_benefit": {
+        "getter": lambda m: (m.get("cost_benefit_scores") or {}).get("coding"),
+        "descending": True,
+        "field": "score",
+    },
+    "by_general_cost_benefit": {
+        "getter": lambda m: (m.get("cost_benefit_scores") or {}).get("general"),
+        "descending": True,
+        "field": "score",
+    },
+    "by_context_window": {
+        "getter": lambda m: m.get("context_length"),
+        "descending": True,
+        "field": "context",
+    },
+    "by_arena_elo": {
+        "getter": lambda m: (m.get("benchmarks") or {}).get("arena_elo"),
+        "descending": True,
+        "field": "elo",
+    },
+    "by_speed": {
+        "getter": lambda m: (m.get("performance") or {}).get("output_speed_tps"),
+        "descending": True,
+        "field": "tokens_per_second",
+    },
+    "by_latency": {
+        "getter": lambda m: (m.get("performance") or {}).get("latency_ttft"),
+        "descending": False,
+        "field": "latency",
+    },
+    "by_value_per_dollar": {
+        "column": _value_per_dollar,
+        "descending": True,
+        "field": "score",
+    },
+}
+
+
+class RankingIndex:
+    """
+    Índice de rankings sobre o catálogo mesclado.
+
+    Cada coluna é extraída uma vez por critério. top_k() usa seleção
+    parcial (np.partition) e só ordena os K vencedores; order() faz a
+    ordenação completa uma única vez e a mantém em cache. Empates são
+    resolvidos pela posição no catálogo (ordenação estável).
+    """
+
+    def __init__(self, merged_models: List[Dict], criteria: Optional[Iterable[str]] = None):
+        self.models = merged_models
+        self.criteria = list(criteria) if criteria is not None else list(RANKING_CRITERIA)
+        unknown = [c for c in self.criteria if c not in RANKING_CRITERIA]
+        if unknown:
+            raise ValueError(f"Critérios de ranking desconhecidos: {', '.join(unknown)}")
+
+        self.ids = [m.get("id", "") for m in merged_models]
+        self._keys: Dict[str, np.ndarray] = {}
+        self._values: Dict[str, np.ndarray] = {}
+        self._eligible: Dict[str, np.ndarray] = {}
+        self._orders: Dict[str, np.ndarray] = {}
+        self._positions: Dict[str, Dict[str, int]] = {}
+
+    def _prepare(self, criterion: str):
+        """Extrai a coluna do critério (uma vez) e a chave de ordenação."""
+        if criterion in self._keys:
+            return
+        spec = RANKING_CRITERIA[criterion]
+        if "column" in spec:
+            values = spec["column"](self.models)
+        else:
+            values = _column(self.models, spec["getter"])
+        eligible = np.flatnonzero(np.nan_to_num(values, nan=0.0) > 0)
+
+        # Chave crescente: menor = melhor posição
+        self._values[criterion] = values
+        self._eligible[criterion] = eligible
+        self._keys[criterion] = -values[eligible] if spec["descending"] else values[eligible]
+
+    def order(self, criterion: str) -> np.ndarray:
+        """Índices dos modelos elegíveis, do melhor para o pior (cacheado)."""
+        if criterion not in self._orders:
+            self._prepare(criterion)
+            keys = self._keys[criterion]
+            self._orders[criterion] = self._eligible[criterion][np.argsort(keys, kind="stable")]
+        return self._orders[criterion]
+
+    def patch_order(self, criterion: str, previous_ids: Sequence[str], changed_ids: Set[str]) -> np.ndarray:
+        """
+        Atualiza a ordem completa de uma execução anterior em vez de reordenar.
+
+        previous_ids é a ordem anterior (ids); changed_ids são os modelos
+        novos ou alterados. Os demais mantêm a posição relativa e os
+        alterados elegíveis são inseridos por busca binária. Pressupõe
+        que os modelos não alterados têm os mesmos valores e a mesma
+        ordem relativa no catálogo (o desempate é a posição no catálogo).
+        """
+        self._prepare(criterion)
+        keys = np.empty(len(self.models), dtype=np.float64)
+        keys[self._eligible[criterion]] = self._keys[criterion]
+
+        position = {model_id: idx for idx, model_id in enumerate(self.ids)}
+        kept = np.array(
+            [position[i] for i in previous_ids if i not in changed_ids and i in position],
+            dtype=np.intp,
+        )
+        eligible = self._eligible[criterion]
+        added = eligible[np.isin(eligible, [position[i] for i in changed_ids if i in position])]
+        added = added[np.lexsort((added, keys[added]))]
+
+        kept_keys = keys[kept]
+        lo = np.searchsorted(kept_keys, keys[added], side="left")
+        hi = np.searchsorted(kept_keys, keys[added], side="right")
+        # Dentro de um bloco de empate, a posição no catálogo decide
+        slots = [
+            start + int(np.searchsorted(kept[start:end], idx))
+            for start, end, idx in zip(lo.tolist(), hi.tolist(), added.tolist())
+        ]
+
+        self._orders[criterion] = np.insert(kept, slots, added)
+        self._positions.pop(criterion, None)
+        return self._orders[criterion]
+
+    def top_indices(self, criterion: str, k: int = DEFAULT_TOP_K) -> np.ndarray:
+        """Índices dos K melhores modelos, em ordem."""
+        if criterion in self._orders:
+            return self._orders[criterion][:k]
+
+        self._prepare(criterion)
+        keys = self._keys[criterion]
+        eligible = self._eligible[criterion]
+        if k <= 0:
+            return eligible[:0]
+        if k >= len(keys):
+            return self.order(criterion)[:k]
+
+        # Limiar do K-ésimo e todos que empatam com ele: resultado determinístico
+        threshold = np.partition(keys, k - 1)[k - 1]
+        candidates = np.flatnonzero(keys <= threshold)
+        ranked = candidates[np.argsort(keys[candidates], kind="stable")][:k]
+        return eligible[ranked]
+
+    def top_k(self, criterion: str, k: int = DEFAULT_TOP_K) -> List[Dict]:
+        """Entradas publicadas do ranking: rank, model_id e o valor do critério."""
+        spec = RANKING_CRITERIA[criterion]
+        indices = self.top_indices(criterion, k).tolist()
+        if "getter" in spec:
+            # Valor original do modelo (preserva int/float do catálogo)
+            values = [spec["getter"](self.models[idx]) for idx in indices]
+        else:
+            values = [round(float(self._values[criterion][idx]), 2) for idx in indices]
+        return [
+            {"rank": rank, "model_id": self.ids[idx], spec["field"]: value}
+            for rank, (idx, value) in enumerate(zip(indices, values), 1)
+        ]
+
+    def rank_of(self, criterion: str, model_id: str) -> Optional[int]:
+        """Posição (1-based) de um modelo no ranking completo, ou None."""
+        if criterion not in self._positions:
+            self._positions[criterion] = {
+                self.ids[idx]: rank for rank, idx in enumerate(self.order(criterion).tolist(), 1)
+            }
+        return self._positions[criterion].get(model_id)
+
+    def rankings(self, k: int = DEFAULT_TOP_K) -> Dict[str, List[Dict]]:
+        """Top-K de todos os critérios do índice."""
+        return {criterion: self.top_k(criterion, k) for criterion in self.criteria}
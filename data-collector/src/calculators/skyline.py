@@ -0,0 +1,241 @@
+"""
+Skyline (Fronteira de Pareto)
+Fronteira de Pareto do catálogo mesclado entre preço, SWE-bench,
+Intelligence, velocidade e contexto. Um modelo está na fronteira se
+nenhum outro é pelo menos tão bom em todas as dimensões e melhor em
+alguma; barato e fraco pode estar, dominado nunca está.
+
+2-D (preço x um benchmark): ordenação + varredura, O(n log n).
+N-D: sort-filter-skyline (block-nested-loop com pré-ordenação
+lexicográfica, então a janela só contém pontos da fronteira).
+Contagens de dominância: comparação em blocos vetorizados, O(n² · d).
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from calculators.batch_scoring import average_price
+from calculators.rankings import DEFAULT_TOP_K, _column
+
+PARETO_FIELD = "pareto"
+PARETO_CRITERION = "by_pareto"
+
+# Dimensão -> (valor por modelo, maior = melhor). O preço é o preço médio
+# por 1M tokens (mesma regra de batch_scoring.average_price).
+PARETO_DIMENSIONS = {
+    "price": (None, False),
+    "coding": (lambda m: (m.get("benchmarks") or {}).get("swe_bench_full"), True),
+    "intelligence": (lambda m: (m.get("benchmarks") or {}).get("intelligence_score"), True),
+    "speed": (lambda m: (m.get("performance") or {}).get("output_speed_tps"), True),
+    "context": (lambda m: m.get("context_length"), True),
+}
+
+# Fronteiras 2-D publicadas: preço x cada uma destas dimensões
+FRONTIERS_2D = ("coding", "intelligence")
+
+# Memória da comparação em blocos (elementos booleanos por matriz do bloco)
+_BLOCK_ELEMENTS = 1 << 22
+
+
+def dimension_matrix(models: List[Dict], dimensions: Sequence[str] = tuple(PARETO_DIMENSIONS)) -> np.ndarray:
+    """
+    Matriz (modelos x dimensões) orientada para "maior = melhor" (preço
+    negado). Valores ausentes ou <= 0 ficam NaN, exceto preço zero (grátis).
+    """
+    columns = []
+    for dimension in dimensions:
+        getter, higher_is_better = PARETO_DIMENSIONS[dimension]
+        if dimension == "price":
+            prompt = _column(models, lambda m: (m.get("pricing") or {}).get("prompt"))
+            completion = _column(models, lambda m: (m.get("pricing") or {}).get("completion"))
+            values = np.where(np.isnan(prompt), np.nan, average_price(prompt, completion))
+            values = np.where(values < 0, np.nan, values)
+        else:
+            values = _column(models, getter)
+            values = np.where(values > 0, values, np.nan)
+        columns.append(values if higher_is_better else -values)
+    return np.column_stack(columns) if columns else np.empty((len(models), 0))
+
+
+def _fill_missing(points: np.ndarray) -> np.ndarray:
+    """Ausente = pior que qualquer valor presente na dimensão (mínimo - 1)."""
+    filled = points.copy()
+    for j in range(points.shape[1]):
+        column = points[:, j]
+        present = column[~np.isnan(column)]
+        filled[np.isnan(column), j] = (present.min() if present.size else 0.0) - 1.0
+    return filled
+
+
+def frontier_2d(cost: np.ndarray, benefit: np.ndarray) -> np.ndarray:
+    """
+    Máscara da fronteira entre custo (menor = melhor) e benefício (maior
+    = melhor), por ordenação + varredura. Ordenando por custo crescente e
+    benefício decrescente, um ponto é dominado sse algum ponto anterior
+    (fora do seu grupo de pontos idênticos) tem benefício >= o seu.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    benefit = np.asarray(benefit, dtype=np.float64)
+    size = len(cost)
+    if size == 0:
+        return np.zeros(0, dtype=bool)
+
+    order = np.lexsort((-benefit, cost))
+    c, b = cost[order], benefit[order]
+
+    # Início do grupo de pontos idênticos de cada posição
+    new_group = np.ones(size, dtype=bool)
+    new_group[1:] = (c[1:] != c[:-1]) | (b[1:] != b[:-1])
+    group_start = np.maximum.accumulate(np.where(new_group, np.arange(size), 0))
+
+    # Maior benefício antes do grupo (exclusivo)
+    prefix = np.concatenate(([-np.inf], np.maximum.accumulate(b)))
+    on_front = prefix[group_start] < b
+
+    mask = np.zeros(size, dtype=bool)
+    mask[order] = on_front
+    return mask
+
+
+def _lexicographic_order(points: np.ndarray) -> np.ndarray:
+    """Ordem lexicográfica decrescente: quem domina vem antes de quem é dominado."""
+    return np.lexsort(-points.T[::-1])
+
+
+def frontier_nd(points: np.ndarray) -> np.ndarray:
+    """
+    Máscara da fronteira N-D (maior = melhor em todas as colunas, sem NaN)
+    por sort-filter-skyline: em ordem lexicográfica decrescente, ninguém
+    domina um ponto anterior, então cada ponto só é comparado com a
+    fronteira já encontrada (a janela do block-nested-loop).
+    """
+    size = len(points)
+    mask = np.zeros(size, dtype=bool)
+    if size == 0:
+        return mask
+
+    order = _lexicographic_order(points)
+    window = np.empty_like(points)
+    count = 0
+    for idx in order.tolist():
+        point = points[idx]
+        candidates = window[:count]
+        if count and ((candidates >= point).all(axis=1) & (candidates > point).any(axis=1)).any():
+            continue
+        window[count] = point
+        count += 1
+        mask[idx] = True
+    return mask
+
+
+def dominance_counts(points: np.ndarray) -> tuple:
+    """
+    (dominated_by, dominates) por ponto: quantos o dominam e quantos ele
+    domina. Na ordem lexicográfica, cada bloco de linhas só é comparado
+    com os pontos dali em diante (metade da matriz de pares).
+    """
+    size, dims = points.shape
+    order = _lexicographic_order(points)
+    ordered = points[order]
+    dominated_by = np.zeros(size, dtype=np.int64)
+    dominates = np.zeros(size, dtype=np.int64)
+    block = max(1, _BLOCK_ELEMENTS // max(size, 1))
+
+    for start in range(0, size, block):
+        rows, rest = ordered[start:start + block], ordered[start:]
+        # beats[i, j]: a linha i domina o ponto start+j (>= em todas, > em
+        # alguma), acumulado dimensão a dimensão em matrizes contíguas
+        at_least = np.ones((len(rows), len(rest)), dtype=bool)
+        better = np.zeros((len(rows), len(rest)), dtype=bool)
+        for j in range(dims):
+            mine, theirs = rows[:, j, None], rest[None, :, j]
+            at_least &= mine >= theirs
+            better |= mine > theirs
+        beats = at_least & better
+        dominates[start:start + len(rows)] = beats.sum(axis=1)
+        dominated_by[start:] += beats.sum(axis=0)
+
+    result_by, result_of = np.empty_like(dominated_by), np.empty_like(dominates)
+    result_by[order], result_of[order] = dominated_by, dominates
+    return result_by, result_of
+
+
+def pareto_analysis(models: List[Dict], dimensions: Sequence[str] = tuple(PARETO_DIMENSIONS)) -> Dict:
+    """
+    Fronteira N-D, contagens de dominância e fronteiras 2-D do catálogo.
+
+    Entram os modelos com preço conhecido; benchmark/velocidade/contexto
+    ausentes contam como o pior valor da dimensão. Nas fronteiras 2-D só
+    entram modelos com preço e o benchmark. Retorna arrays por modelo
+    (eligible, frontier, dominated_by, dominates, frontier_2d[dimensão]).
+    """
+    dimensions = list(dimensions)
+    matrix = dimension_matrix(models, dimensions)
+    size = len(models)
+
+    price = dimensions.index("price")
+    eligible = ~np.isnan(matrix[:, price])
+    points = _fill_missing(matrix[eligible])
+
+    frontier = np.zeros(size, dtype=bool)
+    dominated_by = np.full(size, -1, dtype=np.int64)
+    dominates = np.full(size, -1, dtype=np.int64)
+    frontier[eligible] = frontier_nd(points)
+    dominated_by[eligible], dominates[eligible] = dominance_counts(points)
+
+    fronts = {}
+    for dimension in FRONTIERS_2D:
+        if dimension not in dimensions:
+            continue
+        column = matrix[:, dimensions.index(dimension)]
+        pair = eligible & ~np.isnan(column)
+        fronts[dimension] = np.zeros(size, dtype=bool)
+        fronts[dimension][pair] = frontier_2d(-matrix[pair, price], column[pair])
+
+    return {
+        "eligible": eligible,
+        "frontier": frontier,
+        "dominated_by": dominated_by,
+        "dominates": dominates,
+        "frontier_2d": fronts,
+    }
+
+
+def annotate_pareto(models: List[Dict], analysis: Optional[Dict] = None) -> Dict:
+    """
+    Grava em cada modelo o campo "pareto": frontier, dominated_by,
+    dominates (None fora da análise) e frontier_2d. Retorna a análise.
+    """
+    analysis = analysis or pareto_analysis(models)
+    for idx, model in enumerate(models):
+        counted = bool(analysis["eligible"][idx])
+        model[PARETO_FIELD] = {
+            "frontier": bool(analysis["frontier"][idx]),
+            "dominated_by": int(analysis["dominated_by"][idx]) if counted else None,
+            "dominates": int(analysis["dominates"][idx]) if counted else None,
+            "frontier_2d": {dimension: bool(mask[idx]) for dimension, mask in analysis["frontier_2d"].items()},
+        }
+    return analysis
+
+
+def pareto_ranking(models: List[Dict], analysis: Dict, k: int = DEFAULT_TOP_K) -> Dict[str, List[Dict]]:
+    """
+    Ranking "by_pareto": menos modelos que o dominam primeiro (a fronteira
+    empata em 0), depois mais modelos dominados; empates pela posição no
+    catálogo, como em RankingIndex.
+    """
+    eligible = np.flatnonzero(analysis["eligible"])
+    order = eligible[np.lexsort((-analysis["dominates"][eligible], analysis["dominated_by"][eligible]))][:k]
+    return {
+        PARETO_CRITERION: [
+            {
+                "rank": rank,
+                "model_id": models[idx].get("id", ""),
+                "frontier": bool(analysis["frontier"][idx]),
+                "dominated_by": int(analysis["dominated_by"][idx]),
+                "dominates": int(analysis["dominates"][idx]),
+            }
+            for rank, idx in enumerate(order.tolist(), 1)
+        ]
+    }
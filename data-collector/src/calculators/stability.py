@@ -0,0 +1,347 @@
+"""
+Rank Stability
+Estabilidade dos rankings por Monte Carlo: os scores de benchmark, a
+normalização do ELO ((score - 1200) / 3) e os pesos dos presets são
+perturbados com ruído configurável e o catálogo é reordenado milhares de
+vezes, em lotes de iterações com NumPy.
+
+Muitos números do catálogo são esparsos ou estimados (known_scores do
+SWE-bench, fallback do Artificial Analysis): um modelo em 3º lugar com
+intervalo [2, 15] não está à frente de um 4º com intervalo [3, 5].
+
+Rankings analisados: os compostos de cada preset (calculators/composite.py)
+e os de custo-benefício (by_coding_cost_benefit, by_general_cost_benefit).
+Em cada iteração, benchmarks ausentes de modelos do ranking saem do
+cálculo com os pesos renormalizados, como no ranking publicado
+(missing="renormalize", o padrão), ou são sorteados entre os valores
+observados no catálogo (missing="resample"). As posições de cada modelo
+são acumuladas em histogramas, de onde saem mediana, intervalo e P(top K).
+
+Com ruído zero e missing="renormalize", cada intervalo colapsa no rank
+publicado. Com "resample" isso não vale: o sorteio dos ausentes já move
+os modelos, e num catálogo esparso os intervalos refletem sobretudo a
+imputação, não a incerteza dos números medidos.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from calculators.batch_scoring import BENCHMARK_COLUMNS, BENCHMARK_NORMALIZATION, COST_BENEFIT_CATEGORIES, average_price, cost_benefit_scores
+from calculators.composite import (
+    MIN_RELATIVE_COVERAGE,
+    WEIGHT_COLUMNS,
+    component_matrix,
+    composite_scores,
+    criterion_name,
+    dataset_frame,
+    load_presets,
+    weight_matrix,
+)
+from calculators.rankings import _column
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STABILITY_FORMAT = "rank-stability-v1"
+DEFAULT_ITERATIONS = 10_000
+DEFAULT_STABILITY_TOP_K = 10
+DEFAULT_INTERVAL = (0.05, 0.95)
+DEFAULT_SEED = 42
+
+# Memória de um lote (elementos float por matriz modelos x componentes)
+_BATCH_ELEMENTS = 1 << 21
+
+# Desvios padrão do ruído. Benchmarks e componentes em pontos (0-100);
+# ELO bruto em pontos de ELO; elo_offset/elo_scale perturbam a normalização
+# (score - 1200) / 3; weights é o sigma log-normal multiplicativo dos pesos
+# dos presets. Uma coluna de value.benchmarks (ex.: "swe_bench_verified")
+# ou de benchmarks do dataset (ex.: "swe_bench_full") sobrescreve o tipo.
+DEFAULT_NOISE = {
+    "percent": 2.0,
+    "elo": 15.0,
+    "elo_offset": 50.0,
+    "elo_scale": 0.3,
+    "log_low": 0.0,
+    "log_high": 0.0,
+    "weights": 0.2,
+}
+
+# Ranking de custo-benefício -> categoria de cost_benefit_scores
+COST_BENEFIT_CRITERIA = {
+    f"by_{category}_cost_benefit": category for category in COST_BENEFIT_CATEGORIES
+}
+
+MISSING_MODES = ("resample", "renormalize")
+
+# Um sampler devolve os scores de um lote, por critério: (iterações x
+# elegíveis do critério), elegíveis na ordem do catálogo
+Sampler = Callable[[np.random.Generator, int], List[np.ndarray]]
+
+
+def _noise(noise: Dict, column: str, kind: str) -> float:
+    return float(noise.get(column, noise.get(kind, 0.0)))
+
+
+def _perturb(
+    values: np.ndarray,
+    kind: str,
+    sd: float,
+    rng: np.random.Generator,
+    noise: Dict,
+) -> np.ndarray:
+    """
+    Valores perturbados (lote x modelos), já na escala 0-100. "elo"
+    recebe o ELO bruto e aplica a normalização com offset e escala
+    sorteados por iteração; os demais tipos já estão em 0-100.
+    """
+    batch = values.shape[0]
+    perturbed = values + sd * rng.standard_normal(values.shape, dtype=np.float32) if sd > 0 else values
+    if kind == "elo":
+        offset, scale = BENCHMARK_NORMALIZATION["elo"]
+        offsets = offset + noise["elo_offset"] * rng.standard_normal((batch, 1))
+        scales = np.maximum(scale + noise["elo_scale"] * rng.standard_normal((batch, 1)), 0.1)
+        perturbed = (perturbed - offsets) / scales
+    return np.clip(perturbed, 0, 100)
+
+
+def _resample_missing(values: np.ndarray, rng: np.random.Generator, batch: int) -> np.ndarray:
+    """(lote x modelos): ausentes sorteados entre os valores observados."""
+    result = np.broadcast_to(values, (batch, len(values))).copy()
+    observed = values[~np.isnan(values)]
+    missing = np.flatnonzero(np.isnan(values))
+    if observed.size and missing.size:
+        result[:, missing] = observed[rng.integers(observed.size, size=(batch, missing.size))]
+    return result
+
+
+def composite_sampler(
+    models: List[Dict],
+    presets: Sequence[Dict],
+    noise: Dict,
+    missing: str = "renormalize",
+) -> Tuple[List[str], np.ndarray, np.ndarray, Sampler]:
+    """
+    Critérios, scores publicados e elegíveis (modelos x presets) e o
+    sampler dos rankings compostos. Elegíveis são os modelos do ranking
+    publicado (score e coverage mínima); só eles são reordenados.
+    """
+    frame = dataset_frame(models)
+    components = component_matrix(frame)
+    weights = weight_matrix(presets)
+    scores, coverage = composite_scores(components, weights)
+    floor = MIN_RELATIVE_COVERAGE * coverage.max(axis=0, initial=0.0)
+    eligible = ~np.isnan(scores) & (coverage >= floor[None, :])
+    rows = np.flatnonzero(eligible.any(axis=1))
+
+    # Base de cada componente: ELO bruto (normalizado no sorteio) ou 0-100
+    columns = []
+    for j, (column, kind) in enumerate(WEIGHT_COLUMNS.values()):
+        base = components[:, j]
+        if kind == "elo" and column in frame:
+            raw = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            base = np.where(raw > 0, raw, np.nan)
+        # Sem nenhum valor observado ou sem peso em nenhum preset: fica de fora
+        if np.isnan(base[rows]).all() or not weights[:, j].any():
+            continue
+        columns.append((j, base[rows], kind, _noise(noise, column, kind)))
+
+    sigma = float(noise.get("weights", 0.0))
+    # Posições dos elegíveis de cada preset dentro de rows
+    members = [np.searchsorted(rows, np.flatnonzero(eligible[:, p])) for p in range(len(presets))]
+
+    def sample(rng: np.random.Generator, batch: int) -> List[np.ndarray]:
+        # Pesos log-normais com média preservada; peso zero continua zero
+        batch_weights = np.broadcast_to(weights, (batch, *weights.shape))
+        if sigma > 0:
+            batch_weights = batch_weights * np.exp(sigma * rng.standard_normal(batch_weights.shape) - sigma ** 2 / 2)
+
+        # (W · X) / (W · A) por iteração, só com os componentes usados
+        matrix = np.empty((batch, len(columns), rows.size))
+        for c, (_, base, kind, sd) in enumerate(columns):
+            if missing == "resample":
+                values = _resample_missing(base, rng, batch)
+            else:
+                values = np.broadcast_to(base, (batch, base.size))
+            matrix[:, c, :] = _perturb(values, kind, sd, rng, noise)
+        available = ~np.isnan(matrix)
+        batch_weights = batch_weights[:, :, [j for j, *_ in columns]]
+        weighted = batch_weights @ np.where(available, matrix, 0.0)
+        used = batch_weights @ available.astype(np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = np.where(used > 0, weighted / used, np.nan)
+        return [result[:, p, idx] for p, idx in enumerate(members)]
+
+    return [criterion_name(preset) for preset in presets], scores, eligible, sample
+
+
+def cost_benefit_sampler(models: List[Dict], noise: Dict) -> Tuple[List[str], np.ndarray, np.ndarray, Sampler]:
+    """
+    Critérios, scores publicados e elegíveis (modelos x categorias) e o
+    sampler dos rankings de custo-benefício: benchmark perturbado,
+    normalizado e dividido pelo preço médio (calculate_cost_benefit_score).
+    Scores e elegíveis (score > 0, como em RankingIndex) vêm de
+    batch_scoring.cost_benefit_scores, os mesmos de merge_model_data.
+    """
+    avg_price = average_price(
+        _column(models, lambda m: (m.get("pricing") or {}).get("prompt")),
+        _column(models, lambda m: (m.get("pricing") or {}).get("completion")),
+    )
+    criteria, columns = [], []
+    scores = np.empty((len(models), len(COST_BENEFIT_CRITERIA)))
+    for p, (criterion, category) in enumerate(COST_BENEFIT_CRITERIA.items()):
+        benchmark = COST_BENEFIT_CATEGORIES[category]
+        benchmark_type = BENCHMARK_COLUMNS[benchmark]
+        kind = "elo" if benchmark_type == "elo" else "percent"
+        raw = _column(models, lambda m, b=benchmark: (m.get("benchmarks") or {}).get(b))
+        scores[:, p] = cost_benefit_scores(avg_price, raw, benchmark_type)
+        criteria.append(criterion)
+        columns.append((raw, kind, _noise(noise, benchmark, kind)))
+    eligible = np.nan_to_num(scores) > 0
+
+    members = [np.flatnonzero(eligible[:, p]) for p in range(len(columns))]
+
+    def sample(rng: np.random.Generator, batch: int) -> List[np.ndarray]:
+        return [
+            _perturb(np.broadcast_to(raw[idx], (batch, idx.size)), kind, sd, rng, noise) / avg_price[idx] * 100
+            for (raw, kind, sd), idx in zip(columns, members)
+        ]
+
+    return criteria, scores, eligible, sample
+
+
+def batch_order(scores: np.ndarray, stable: bool = True) -> np.ndarray:
+    """
+    (lote x posições): índice do modelo em cada posição, por score
+    decrescente; NaN vai para o fim. stable=True desempata pela posição
+    no catálogo, como em RankingIndex; com ruído, empates praticamente
+    não ocorrem e o sort padrão (bem mais rápido) basta.
+    """
+    return np.argsort(-scores, axis=1, kind="stable" if stable else None)
+
+
+def rank_histograms(
+    sample: Sampler,
+    eligible: np.ndarray,
+    iterations: int,
+    rng: np.random.Generator,
+    batch: Optional[int] = None,
+    stable: bool = False,
+) -> List[np.ndarray]:
+    """
+    Para cada critério, contagens (elegíveis x posições): quantas vezes
+    cada modelo elegível terminou em cada posição entre os elegíveis.
+    stable=True desempata como o ranking publicado (sem ruído, os empates
+    são reais e a ordem não pode variar entre iterações). Com ruído, empates
+    exatos (componentes sem ruído, como o preço) caem em ordem arbitrária.
+    """
+    size, criteria = eligible.shape
+    batch = batch or max(1, min(iterations, _BATCH_ELEMENTS // max(size * criteria, 1)))
+    sizes = eligible.sum(axis=0).tolist()
+    counts = [np.zeros(n * n, dtype=np.int64) for n in sizes]
+
+    done = 0
+    while done < iterations:
+        current = min(batch, iterations - done)
+        for p, scores in enumerate(sample(rng, current)):
+            n = sizes[p]
+            if not n:
+                continue
+            # Modelo i na posição r -> célula i * n + r
+            cells = (batch_order(scores, stable=stable) * n + np.arange(n)[None, :]).ravel()
+            counts[p] += np.bincount(cells, minlength=n * n)
+        done += current
+
+    return [c.reshape(n, n) for c, n in zip(counts, sizes)]
+
+
+def summarize_histogram(
+    counts: np.ndarray,
+    k: int = DEFAULT_STABILITY_TOP_K,
+    interval: Tuple[float, float] = DEFAULT_INTERVAL,
+) -> Dict[str, np.ndarray]:
+    """
+    Por modelo (1-based): rank_median, rank_low/rank_high (quantis de
+    interval), mean_rank e top_k_probability.
+    """
+    size = counts.shape[0]
+    total = counts.sum(axis=1, keepdims=True)
+    cdf = np.cumsum(counts, axis=1)
+
+    def quantile(q):
+        return (cdf >= q * total).argmax(axis=1) + 1
+
+    positions = np.arange(1, size + 1, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "rank_median": quantile(0.5),
+            "rank_low": quantile(interval[0]),
+            "rank_high": quantile(interval[1]),
+            "mean_rank": (counts @ positions) / total[:, 0],
+            "top_k_probability": cdf[:, min(k, size) - 1] / total[:, 0] if size else np.zeros(0),
+        }
+
+
+def rank_stability(
+    models: List[Dict],
+    presets: Optional[Sequence[Dict]] = None,
+    iterations: int = DEFAULT_ITERATIONS,
+    k: int = DEFAULT_STABILITY_TOP_K,
+    noise: Optional[Dict] = None,
+    interval: Tuple[float, float] = DEFAULT_INTERVAL,
+    missing: str = "renormalize",
+    seed: Optional[int] = DEFAULT_SEED,
+    updated_at: Optional[str] = None,
+) -> Dict:
+    """
+    Análise completa do catálogo mesclado: para cada ranking, os modelos
+    na ordem publicada com rank, mediana, intervalo, rank médio e P(top K).
+    """
+    if missing not in MISSING_MODES:
+        raise ValueError(f"missing deve ser um de {MISSING_MODES}: {missing}")
+    noise = {**DEFAULT_NOISE, **(noise or {})}
+    presets = load_presets() if presets is None else presets
+    rng = np.random.default_rng(seed)
+    ids = [m.get("id", "") for m in models]
+
+    started = datetime.utcnow()
+    criteria = {}
+    for names, scores, eligible, sample in (
+        composite_sampler(models, presets, noise, missing),
+        cost_benefit_sampler(models, noise),
+    ):
+        histograms = rank_histograms(sample, eligible, iterations, rng, stable=not any(noise.values()))
+        for p, (criterion, counts) in enumerate(zip(names, histograms)):
+            idx = np.flatnonzero(eligible[:, p])
+            summary = summarize_histogram(counts, k, interval)
+            baseline = np.empty(idx.size, dtype=np.int64)
+            baseline[batch_order(scores[None, idx, p])[0]] = np.arange(idx.size)
+            criteria[criterion] = [
+                {
+                    "rank": int(baseline[i]) + 1,
+                    "model_id": ids[idx[i]],
+                    "rank_median": int(summary["rank_median"][i]),
+                    "rank_low": int(summary["rank_low"][i]),
+                    "rank_high": int(summary["rank_high"][i]),
+                    "mean_rank": round(float(summary["mean_rank"][i]), 2),
+                    "top_k_probability": round(float(summary["top_k_probability"][i]), 4),
+                }
+                for i in np.argsort(baseline).tolist()
+            ]
+
+    elapsed = (datetime.utcnow() - started).total_seconds()
+    logger.info(f"🎲 Estabilidade: {len(criteria)} rankings x {iterations} iterações em {elapsed:.1f}s")
+    return {
+        "format": STABILITY_FORMAT,
+        "updated_at": updated_at,
+        "iterations": iterations,
+        "top_k": k,
+        "interval": list(interval),
+        "missing": missing,
+        "seed": seed,
+        "noise": noise,
+        "criteria": criteria,
+    }
@@ -0,0 +1,170 @@
+"""
+Workload Cost Simulator
+Custo mensal e tempo por tarefa de cada modelo em cada perfil de uso.
+
+Os preços de referência do site não descrevem uso real: merge_model_data
+usa (prompt + completion) / 2 e /api/models usa input + 0.5 x output.
+Aqui cada perfil define tokens por requisição, fração do input servida
+do cache, requisições por mês e por tarefa; o custo de todos os modelos
+em todos os perfis sai de um produto de matrizes (preços x tokens) mais
+a taxa por requisição (pricing.request), com broadcasting.
+"""
+
+import json
+from typing import Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+
+from calculators.rankings import _column
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WORKLOADS_FORMAT = "workloads-v1"
+TOKENS_PER_PRICE_UNIT = 1_000_000  # pricing.prompt/completion são por 1M tokens
+DEFAULT_TOP = 10
+
+# Campos de um perfil (todos por requisição, exceto os contadores)
+PROFILE_FIELDS = ("input_tokens", "output_tokens", "cached_input_share", "requests_per_month", "requests_per_task")
+
+DEFAULT_PROFILES = [
+    {"name": "chat", "description": "Perguntas avulsas no chat",
+     "input_tokens": 2_000, "output_tokens": 600, "cached_input_share": 0.0,
+     "requests_per_month": 600, "requests_per_task": 1},
+    {"name": "autocomplete", "description": "Autocomplete no editor",
+     "input_tokens": 1_500, "output_tokens": 80, "cached_input_share": 0.5,
+     "requests_per_month": 20_000, "requests_per_task": 1},
+    {"name": "agentic-coding", "description": "Agente de código (loop de ferramentas, contexto reaproveitado)",
+     "input_tokens": 30_000, "output_tokens": 1_500, "cached_input_share": 0.7,
+     "requests_per_month": 3_000, "requests_per_task": 25},
+    {"name": "code-review", "description": "Revisão de PRs",
+     "input_tokens": 12_000, "output_tokens": 1_200, "cached_input_share": 0.2,
+     "requests_per_month": 400, "requests_per_task": 3},
+    {"name": "long-context", "description": "Análise de repositório inteiro",
+     "input_tokens": 150_000, "output_tokens": 4_000, "cached_input_share": 0.5,
+     "requests_per_month": 100, "requests_per_task": 4},
+]
+
+
+def load_profiles(path: Optional[str] = None) -> List[Dict]:
+    """Perfis de um JSON (lista ou {"profiles": [...]}); sem path, DEFAULT_PROFILES."""
+    if not path:
+        return [dict(profile) for profile in DEFAULT_PROFILES]
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    profiles = data.get("profiles", []) if isinstance(data, dict) else data
+    missing = [p.get("name", "?") for p in profiles if any(field not in p for field in PROFILE_FIELDS)]
+    if missing:
+        raise ValueError(f"Perfis sem todos os campos {PROFILE_FIELDS}: {', '.join(missing)}")
+    return profiles
+
+
+def profile_matrix(profiles: Sequence[Dict]) -> Dict[str, np.ndarray]:
+    """Perfis -> um vetor por campo de PROFILE_FIELDS (tamanho = nº de perfis)."""
+    return {
+        field: np.array([float(profile[field]) for profile in profiles], dtype=np.float64)
+        for field in PROFILE_FIELDS
+    }
+
+
+def model_matrix(models: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Preços e velocidade por modelo. Sem preço de cache, o input em cache
+    paga o preço normal; sem taxa por requisição, zero. Preço negativo
+    (roteadores como openrouter/auto publicam -1) é desconhecido: prompt
+    ou completion < 0 deixam o modelo sem preço, como em
+    skyline.dimension_matrix; cache ou taxa negativos caem no padrão.
+    """
+    def pricing(key):
+        return _column(models, lambda m: (m.get("pricing") or {}).get(key))
+
+    prompt, completion = pricing("prompt"), pricing("completion")
+    prompt = np.where((prompt < 0) | (completion < 0), np.nan, prompt)
+    cache_read, request = pricing("input_cache_read"), pricing("request")
+    return {
+        "prompt": prompt,
+        "completion": np.where(completion > 0, completion, 0.0),
+        "cache_read": np.where(cache_read >= 0, cache_read, prompt),
+        "request": np.where(request > 0, request, 0.0),
+        "tps": _column(models, lambda m: (m.get("performance") or {}).get("output_speed_tps")),
+        "ttft": _column(models, lambda m: (m.get("performance") or {}).get("latency_ttft")),
+    }
+
+
+def simulate(prices: Dict[str, np.ndarray], workloads: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Matrizes (modelos x perfis): cost_per_request, monthly_cost,
+    cost_per_task e seconds_per_task (TTFT + output / tokens por segundo,
+    vezes as requisições da tarefa; NaN sem dados de velocidade).
+    Modelos sem preço de prompt ficam NaN.
+    """
+    input_tokens = workloads["input_tokens"]
+    cached = workloads["cached_input_share"]
+
+    # Tokens (3 x perfis) em milhões: input sem cache, input em cache, output
+    tokens = np.vstack([
+        input_tokens * (1 - cached),
+        input_tokens * cached,
+        workloads["output_tokens"],
+    ]) / TOKENS_PER_PRICE_UNIT
+    rates = np.column_stack([prices["prompt"], prices["cache_read"], prices["completion"]])
+
+    per_request = rates @ tokens + prices["request"][:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        seconds = prices["ttft"][:, None] + workloads["output_tokens"][None, :] / prices["tps"][:, None]
+    seconds = np.where(prices["tps"][:, None] > 0, seconds, np.nan)
+
+    return {
+        "cost_per_request": per_request,
+        "monthly_cost": per_request * workloads["requests_per_month"][None, :],
+        "cost_per_task": per_request * workloads["requests_per_task"][None, :],
+        "seconds_per_task": seconds * workloads["requests_per_task"][None, :],
+    }
+
+
+def simulate_models(models: List[Dict], profiles: Sequence[Dict]) -> Dict[str, np.ndarray]:
+    """simulate() a partir do catálogo mesclado e da lista de perfis."""
+    return simulate(model_matrix(models), profile_matrix(profiles))
+
+
+def workloads_payload(
+    models: List[Dict],
+    profiles: Optional[Sequence[Dict]] = None,
+    top: int = DEFAULT_TOP,
+    updated_at: Optional[str] = None,
+) -> Dict:
+    """
+    Artefato pré-calculado para o site: para cada perfil, os `top` modelos
+    mais baratos no mês com custo por tarefa e segundos por tarefa.
+    Empates pela posição no catálogo.
+    """
+    profiles = list(DEFAULT_PROFILES if profiles is None else profiles)
+    result = simulate_models(models, profiles)
+    ids = [m.get("id", "") for m in models]
+
+    entries = {}
+    for p, profile in enumerate(profiles):
+        monthly = result["monthly_cost"][:, p]
+        priced = np.flatnonzero(~np.isnan(monthly))
+        order = priced[np.argsort(monthly[priced], kind="stable")][:top]
+        entries[profile["name"]] = {
+            **profile,
+            "top": [
+                {
+                    "rank": rank,
+                    "model_id": ids[idx],
+                    "monthly_cost": round(float(monthly[idx]), 4),
+                    "cost_per_task": round(float(result["cost_per_task"][idx, p]), 4),
+                    "seconds_per_task": _rounded(result["seconds_per_task"][idx, p]),
+                }
+                for rank, idx in enumerate(order.tolist(), 1)
+            ],
+        }
+
+    logger.info(f"🧾 Workloads: {len(profiles)} perfis x {len(models)} modelos")
+    return {"format": WORKLOADS_FORMAT, "updated_at": updated_at, "profiles": entries}
+
+
+def _rounded(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 1)
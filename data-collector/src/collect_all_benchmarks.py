@@ -11,6 +11,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from collectors.artificial_analysis import fetch_intelligence_index
 from collectors.arena import fetch_arena_elo
 from collectors.swe_bench import fetch_swe_bench
+from storage.benchmarks_loader import benchmark_rows, connect, load_benchmarks
+from storage.composite_rankings import refresh_composite_rankings
 from datetime import datetime
 import logging
 
@@ -101,11 +103,21 @@ WHERE llm_id = '{model_id}';"""
 
 def main():
     """
-    Executa coleta completa e gera SQL.
+    Executa coleta completa e grava no banco.
+    
+    Com DATABASE_URL definido, carrega direto em value.benchmarks
+    (COPY + merge numa transação) e recalcula os rankings compostos
+    dos presets; sem ele, gera o SQL para aplicar manualmente com psql.
     """
     # Coletar
     data = collect_all_benchmarks()
     
+    if os.environ.get("DATABASE_URL"):
+        with connect() as conn:
+            load_benchmarks(conn, benchmark_rows(data))
+            refresh_composite_rankings(conn)
+        return data
+    
     # Gerar SQL
     sql = generate_sql_updates(data)
     
@@ -59,6 +59,32 @@ def fetch_arena_elo():
         return {}
 
 
+def fetch_arena_leaderboard() -> List[Dict]:
+    """
+    Retorna o leaderboard do Arena como lista ordenada por ELO.
+    """
+    elo_scores = fetch_arena_elo()
+    ordered = sorted(elo_scores.items(), key=lambda item: item[1], reverse=True)
+    
+    return [
+        {"model": model_id, "rank": rank, "elo_rating": elo}
+        for rank, (model_id, elo) in enumerate(ordered, 1)
+    ]
+
+
+def normalize_arena_model(model: Dict) -> Dict:
+    """
+    Normaliza dados do Chatbot Arena.
+    """
+    return {
+        "source": "arena",
+        "model_name": model.get("model", ""),
+        "rank": model.get("rank"),
+        "elo_rating": model.get("elo_rating"),
+        "collected_at": datetime.utcnow().isoformat() + "Z"
+    }
+
+
 def collect_and_save(output_path: str = "data/raw/arena_elo.json"):
     """
     Coleta e salva dados do Chatbot Arena.
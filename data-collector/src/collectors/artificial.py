@@ -4,20 +4,44 @@ Busca dados de intelligence, price, performance e speed.
 """
 
 import json
-import asyncio
 from typing import Dict, List
 from datetime import datetime
 import logging
 
+from collectors.browser_pool import get_shared_pool, run_with_shared_pool
+from collectors.page_readiness import wait_for_rows
+from collectors.response_capture import ResponseCapture, extract_records
+from collectors.strategies import fetch_static_html, parse_embedded_json, parse_number, parse_table_rows, run_strategies
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 ARTIFICIAL_URL = "https://artificialanalysis.ai/leaderboards/models"
+ARTIFICIAL_ROW_SELECTOR = '[data-testid*="row"], tr, .model-row'
+
+# Campos do JSON da página -> formato bruto usado por normalize_artificial_model
+ARTIFICIAL_FIELD_ALIASES = {
+    "model": ["name", "model_name", "model.name", "model", "slug"],
+    "intelligence": [
+        "artificial_analysis_intelligence_index",
+        "evaluations.artificial_analysis_intelligence_index",
+        "intelligence_index",
+        "intelligence",
+    ],
+    "price_input": ["price_1m_input_tokens", "pricing.price_1m_input_tokens", "input_price", "price_input"],
+    "price_output": ["price_1m_output_tokens", "pricing.price_1m_output_tokens", "output_price", "price_output"],
+    "speed": ["median_output_tokens_per_second", "output_speed", "output_tokens_per_second", "speed"],
+    "latency": ["median_time_to_first_token_seconds", "time_to_first_token", "ttft", "latency"],
+    "context": ["context_window", "context_window_tokens", "context_length", "context"],
+}
 
 
 async def fetch_artificial_leaderboard() -> List[Dict]:
     """
-    Busca dados da leaderboard Artificial Analysis usando Playwright.
+    Busca dados da leaderboard Artificial Analysis.
+    
+    Tenta HTTP + lxml primeiro e só abre o Chromium se a página estática
+    não tiver linhas.
     
     Métricas disponíveis:
     - Intelligence score
@@ -26,28 +50,73 @@ async def fetch_artificial_leaderboard() -> List[Dict]:
     - Latency (TTFT)
     - Context window
     """
-    try:
-        from playwright.async_api import async_playwright
+    models = await run_strategies("artificial_analysis", [
+        ("http", _fetch_artificial_static),
+        ("browser", _fetch_artificial_browser),
+    ])
+    
+    if models:
+        logger.info(f"✅ Artificial Analysis: {len(models)} modelos coletados")
+        return models
+    
+    logger.warning("⚠️ Artificial Analysis: nenhum dado encontrado, usando fallback")
+    return get_fallback_data()
+
+
+async def _fetch_artificial_static() -> List[Dict]:
+    """
+    Estratégia HTTP + lxml: dados embutidos no HTML (__NEXT_DATA__ e afins)
+    ou, se não houver, a tabela estática.
+    """
+    tree = await fetch_static_html(ARTIFICIAL_URL)
+    
+    models = extract_records(
+        parse_embedded_json(tree), ARTIFICIAL_FIELD_ALIASES, required=("model", "intelligence")
+    )
+    if models:
+        return models
+    
+    for cells in parse_table_rows(tree, min_cells=4):
+        if cells[0]:
+            models.append({
+                "model": cells[0],
+                "intelligence": int(parse_number(cells[1]) or 0) or None,
+                "price_input": parse_number(cells[2]) or None,
+                "speed": int(parse_number(cells[3]) or 0) or None,
+            })
+    
+    return models
+
+
+async def _fetch_artificial_browser() -> List[Dict]:
+    """
+    Estratégia Playwright: respostas JSON da página, depois o DOM renderizado.
+    """
+    pool = await get_shared_pool()
+    
+    async with pool.page() as page:
+        capture = ResponseCapture(page)
+        logger.info("🌐 Acessando Artificial Analysis...")
+        await page.goto(ARTIFICIAL_URL, wait_until="domcontentloaded", timeout=60000)
+        
+        # Tenta primeiro os dados JSON que a própria página carrega
+        models = await capture.wait_for_records(ARTIFICIAL_FIELD_ALIASES, required=("model", "intelligence"))
+        
+        if models:
+            logger.info(f"📦 Artificial Analysis: {len(models)} modelos via respostas JSON")
+        else:
+            # Fallback: scraping do DOM, após a tabela renderizar
+            await wait_for_rows(page, ARTIFICIAL_ROW_SELECTOR, key="artificial_analysis", min_rows=10)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            logger.info("🌐 Acessando Artificial Analysis...")
-            await page.goto(ARTIFICIAL_URL, wait_until="networkidle", timeout=60000)
-            
-            # Aguarda o conteúdo carregar
-            await page.wait_for_timeout(5000)
-            
             # Extrai dados da leaderboard
             models = await page.evaluate("""
                 () => {
                     const data = [];
-                    
+                
                     // Procura por elementos com dados de modelos
                     // Artificial Analysis usa React, então procuramos por atributos específicos
                     const rows = document.querySelectorAll('[data-testid*="row"], tr, .model-row');
-                    
+                
                     rows.forEach(row => {
                         const cells = row.querySelectorAll('td, [data-testid*="cell"]');
                         if (cells.length >= 4) {
@@ -55,7 +124,7 @@ async def fetch_artificial_leaderboard() -> List[Dict]:
                             const intelligence = cells[1]?.textContent?.trim();
                             const price = cells[2]?.textContent?.trim();
                             const speed = cells[3]?.textContent?.trim();
-                            
+                        
                             if (modelName) {
                                 data.push({
                                     model: modelName,
@@ -66,26 +135,12 @@ async def fetch_artificial_leaderboard() -> List[Dict]:
                             }
                         }
                     });
-                    
+                
                     return data;
                 }
             """)
-            
-            await browser.close()
-            
-            if models and len(models) > 0:
-                logger.info(f"✅ Artificial Analysis: {len(models)} modelos coletados")
-                return models
-            else:
-                logger.warning("⚠️ Artificial Analysis: nenhum dado encontrado, usando fallback")
-                return get_fallback_data()
-                
-    except ImportError:
-        logger.warning("⚠️ Playwright não instalado, usando fallback")
-        return get_fallback_data()
-    except Exception as e:
-        logger.error(f"❌ Erro ao buscar Artificial Analysis: {e}")
-        return get_fallback_data()
+    
+    return models
 
 
 def normalize_artificial_model(model: Dict) -> Dict:
@@ -109,7 +164,7 @@ def collect_and_save(output_path: str = "data/raw/artificial_leaderboard.json"):
     """
     Coleta e salva dados do Artificial Analysis.
     """
-    models = asyncio.run(fetch_artificial_leaderboard())
+    models = run_with_shared_pool(fetch_artificial_leaderboard())
     
     normalized = [normalize_artificial_model(m) for m in models]
     
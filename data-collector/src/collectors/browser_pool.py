@@ -0,0 +1,213 @@
+"""
+Browser Pool
+Um único processo Chromium (Playwright) compartilhado pelos collectors,
+com contextos reutilizáveis, limite de páginas simultâneas e bloqueio
+de recursos pesados (imagens, fontes, analytics).
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from typing import List, Optional
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PAGES = 4
+DEFAULT_MAX_CONTEXTS = 2
+
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_URL_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "segment.io",
+    "segment.com",
+    "hotjar.com",
+    "plausible.io",
+    "mixpanel.com",
+    "posthog.com",
+    "clarity.ms",
+    "vercel-insights",
+    "/_vercel/insights",
+)
+
+
+async def install_chromium() -> bool:
+    """
+    Baixa o Chromium do Playwright (python -m playwright install chromium).
+    Só chamado quando o browser é necessário e ainda não está instalado,
+    em execuções locais: o download conta no timeout da fonte que pediu o
+    browser (orchestrator). O CI instala antes, num passo do workflow.
+    """
+    logger.info("📥 Chromium não instalado: executando playwright install chromium")
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "playwright", "install", "chromium",
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+    )
+    output, _ = await process.communicate()
+    if process.returncode != 0:
+        logger.error(f"❌ playwright install chromium falhou: {output.decode(errors='replace')[-500:]}")
+    return process.returncode == 0
+
+
+async def _block_heavy_requests(route):
+    """Aborta imagens, fontes, mídia e scripts de analytics."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        pattern in request.url for pattern in BLOCKED_URL_PATTERNS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    Pool de páginas sobre um único browser.
+
+    Contextos são criados sob demanda (até max_contexts) e reutilizados
+    em round-robin; páginas são abertas e fechadas a cada checkout, com
+    no máximo max_pages abertas ao mesmo tempo.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_contexts: int = DEFAULT_MAX_CONTEXTS,
+        headless: bool = True,
+        block_resources: bool = True,
+    ):
+        self.max_pages = max_pages
+        self.max_contexts = max_contexts
+        self.headless = headless
+        self.block_resources = block_resources
+
+        self._playwright = None
+        self._browser = None
+        self._contexts: List = []
+        self._next_context = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._context_lock: Optional[asyncio.Lock] = None
+        self.pages_served = 0
+
+    async def start(self):
+        """
+        Inicia o Playwright e o Chromium (levanta ImportError sem
+        Playwright); sem o executável do Chromium, instala e tenta de novo.
+        """
+        if self._browser:
+            return
+        from playwright.async_api import async_playwright
+
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._context_lock = asyncio.Lock()
+        self._playwright = await async_playwright().start()
+        try:
+            try:
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            except Exception as e:
+                if "Executable doesn't exist" not in str(e) or not await install_chromium():
+                    raise
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        except Exception:
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+        logger.info(f"🌐 Chromium iniciado (até {self.max_pages} páginas simultâneas)")
+
+    async def close(self):
+        """Fecha contextos, browser e Playwright."""
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Erro ao fechar contexto: {e}")
+        self._contexts = []
+
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _get_context(self):
+        """Próximo contexto em round-robin, criando até max_contexts."""
+        async with self._context_lock:
+            if len(self._contexts) < self.max_contexts:
+                context = await self._browser.new_context()
+                if self.block_resources:
+                    await context.route("**/*", _block_heavy_requests)
+                self._contexts.append(context)
+                return context
+
+            context = self._contexts[self._next_context % len(self._contexts)]
+            self._next_context += 1
+            return context
+
+    @asynccontextmanager
+    async def page(self):
+        """Checkout de uma página; fechada automaticamente na saída."""
+        await self.start()
+        async with self._semaphore:
+            context = await self._get_context()
+            page = await context.new_page()
+            self.pages_served += 1
+            try:
+                yield page
+            finally:
+                await page.close()
+
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_loop = None
+_shared_start: Optional[asyncio.Task] = None
+
+
+async def get_shared_pool() -> BrowserPool:
+    """
+    Pool compartilhado do processo, iniciado uma vez por event loop.
+
+    Collectors que rodam em paralelo no mesmo loop recebem o mesmo browser.
+    """
+    global _shared_pool, _shared_loop, _shared_start
+    loop = asyncio.get_running_loop()
+
+    if _shared_loop is not loop or _shared_pool is None:
+        _shared_pool = BrowserPool()
+        _shared_loop = loop
+        _shared_start = loop.create_task(_shared_pool.start())
+
+    pool = _shared_pool
+    await asyncio.shield(_shared_start)
+    return pool
+
+
+async def close_shared_pool():
+    """Fecha o pool compartilhado, se existir no loop atual."""
+    global _shared_pool, _shared_loop, _shared_start
+    pool, loop = _shared_pool, _shared_loop
+    _shared_pool = _shared_loop = _shared_start = None
+
+    if pool and loop is asyncio.get_running_loop():
+        await pool.close()
+
+
+def run_with_shared_pool(coro):
+    """asyncio.run() que fecha o pool compartilhado ao final."""
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await close_shared_pool()
+
+    return asyncio.run(runner())
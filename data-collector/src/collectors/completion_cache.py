@@ -0,0 +1,193 @@
+"""
+Completion Cache
+Cache persistente de chat completions (deep research é lento e caro),
+endereçado pelo hash de (model, messages, parâmetros). Cada chamada,
+hit ou miss, é registrada com latência e custo em calls.jsonl.
+"""
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+from collectors.openrouter import achat_completion, chat_completion
+from collectors.streaming import stream_chat_completion, stream_chat_completion_sync
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# data-collector/data/cache/llm: free_tier_hunter e fetch_monthly_plans
+# compartilham o cache rodando de qualquer diretório
+DEFAULT_CACHE_DIR = str(Path(__file__).parent.parent.parent / "data" / "cache" / "llm")
+DEFAULT_TTL_SECONDS = 24 * 3600
+CALL_LOG_FILE = "calls.jsonl"
+
+
+def completion_key(payload: Dict) -> str:
+    """
+    Hash estável do request: model, messages e demais parâmetros.
+    A ordem das chaves do dict não muda o hash.
+    """
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _cost(data: Dict) -> Optional[float]:
+    """Custo em USD informado pela OpenRouter em usage.cost, se houver."""
+    return (data.get("usage") or {}).get("cost")
+
+
+def _streamed_response(result: Dict) -> Dict:
+    """Resultado do streaming no formato de resposta do chat completions."""
+    return {
+        "choices": [{"message": {"role": "assistant", "content": result["content"]}}],
+        "usage": result["usage"],
+        "stream": {key: result[key] for key in ("complete", "error", "ttft_ms", "tokens_per_sec", "completion_tokens")},
+    }
+
+
+class CompletionCache:
+    """
+    Cache de respostas de chat por conteúdo do request.
+
+    - Hit dentro do TTL: retorna a resposta salva sem chamar a API.
+    - refresh=True: ignora a entrada e paga a chamada de novo.
+    - Erros da API e streams incompletos não são cacheados.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0, "cost": 0.0}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, payload: Dict) -> Optional[Dict]:
+        """Entrada válida (dentro do TTL) para o payload, ou None."""
+        try:
+            with open(self._path(completion_key(payload)), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created_at", 0) >= self.ttl_seconds:
+            return None
+        return entry
+
+    def _store(self, payload: Dict, title: str, data: Dict, latency_ms: int) -> Dict:
+        entry = {
+            "key": completion_key(payload),
+            "model": payload.get("model"),
+            "title": title,
+            "created_at": time.time(),
+            "latency_ms": latency_ms,
+            "usage": data.get("usage"),
+            "cost": _cost(data),
+            "response": data,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(entry["key"])
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(f"{path}.tmp", path)
+        return entry
+
+    def invalidate(self, payload: Dict) -> bool:
+        """Remove a entrada do payload; retorna True se existia."""
+        try:
+            os.remove(self._path(completion_key(payload)))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _record_miss(self, payload: Dict, title: str, data: Dict, latency_ms: int):
+        if data.get("stream", {}).get("complete") is False:
+            entry = {"key": completion_key(payload), "model": payload.get("model"), "title": title, "cost": _cost(data)}
+        else:
+            entry = self._store(payload, title, data, latency_ms)
+        self._log_call(entry, hit=False, latency_ms=latency_ms)
+
+    def _log_call(self, entry: Dict, hit: bool, latency_ms: int):
+        if hit:
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            self.stats["cost"] += entry.get("cost") or 0.0
+
+        record = {
+            "at": datetime.utcnow().isoformat() + "Z",
+            "key": entry["key"],
+            "model": entry["model"],
+            "title": entry["title"],
+            "hit": hit,
+            "latency_ms": latency_ms,
+            "cost": 0.0 if hit else entry.get("cost"),
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, CALL_LOG_FILE), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        if hit:
+            logger.info(f"♻️ Cache hit {entry['key'][:12]} ({entry['title']}), economizou {entry['latency_ms']} ms")
+        else:
+            cost = f"${entry['cost']:.4f}" if entry.get("cost") is not None else "custo n/d"
+            logger.info(f"💸 {entry['model']} ({entry['title']}): {latency_ms} ms, {cost}")
+
+    def _lookup(self, payload: Dict, refresh: bool) -> Optional[Dict]:
+        start = time.perf_counter()
+        entry = None if refresh else self.get(payload)
+        if entry:
+            self._log_call(entry, hit=True, latency_ms=round((time.perf_counter() - start) * 1000))
+        return entry
+
+    def chat_completion(
+        self,
+        payload: Dict,
+        title: str,
+        refresh: bool = False,
+        stream_path: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        chat_completion() da OpenRouter com cache.
+
+        Com stream_path a chamada é feita em streaming e o conteúdo vai
+        sendo gravado nesse arquivo; a resposta traz "stream" com
+        complete/ttft_ms/tokens_per_sec.
+        """
+        entry = self._lookup(payload, refresh)
+        if entry:
+            return entry["response"]
+
+        start = time.perf_counter()
+        if stream_path:
+            data = _streamed_response(stream_chat_completion_sync(payload, title, partial_path=stream_path, **kwargs))
+        else:
+            data = chat_completion(payload, title=title, **kwargs)
+        self._record_miss(payload, title, data, round((time.perf_counter() - start) * 1000))
+        return data
+
+    async def achat_completion(
+        self,
+        payload: Dict,
+        title: str,
+        refresh: bool = False,
+        stream_path: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """Versão assíncrona de chat_completion()."""
+        entry = self._lookup(payload, refresh)
+        if entry:
+            return entry["response"]
+
+        start = time.perf_counter()
+        if stream_path:
+            data = _streamed_response(await stream_chat_completion(payload, title, partial_path=stream_path, **kwargs))
+        else:
+            data = await achat_completion(payload, title=title, **kwargs)
+        self._record_miss(payload, title, data, round((time.perf_counter() - start) * 1000))
+        return data
@@ -4,20 +4,39 @@ Free Tier Hunter - Busca LLM free tiers temporários na internet
 Usa Perplexity Sonar via OpenRouter para encontrar promoções atuais
 """
 
+import asyncio
 import json
 import os
 import sys
-import urllib.request
-import urllib.error
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional
 
+import httpx
+
+# Permite rodar como script (python3 src/collectors/free_tier_hunter.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from collectors.http_client import close_async_client
+from collectors.completion_cache import DEFAULT_TTL_SECONDS, CompletionCache
+from collectors.openrouter import completion_content
+from collectors.rate_limiter import TokenBucket
+
 # Config - Usa OpenRouter para acessar Perplexity
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
-OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 PERPLEXITY_MODEL = "perplexity/sonar-deep-research"
 OUTPUT_FILE = "data/processed/free_tiers_temp.json"
 
+# Varredura por plataforma: chamadas simultâneas e ritmo de novas chamadas
+# (abaixo do limite de requisições/s da OpenRouter)
+MAX_CONCURRENCY = 24
+REQUESTS_PER_SECOND = 2
+RATE_LIMIT_BURST = 10
+
+# Nome da consulta geral em --refresh (as demais são os nomes em PLATFORMS)
+GENERAL_QUERY = "general"
+
 # Modelos para monitorar
 TARGET_MODELS = [
     "GLM-5",
@@ -67,9 +86,23 @@ PLATFORMS = [
 ]
 
 
-def search_free_tiers_with_perplexity() -> List[Dict]:
+def _should_refresh(name: str, refresh: Optional[List[str]]) -> bool:
+    """refresh=None: usa o cache; []: refaz tudo; lista: só os nomes escolhidos."""
+    if refresh is None:
+        return False
+    return not refresh or name.lower() in {r.lower() for r in refresh}
+
+
+def search_free_tiers_with_perplexity(
+    cache: Optional[CompletionCache] = None,
+    refresh: Optional[List[str]] = None,
+    stream_path: Optional[str] = None
+) -> List[Dict]:
     """
     Usa Perplexity Sonar via OpenRouter para buscar free tiers atuais.
+    
+    Com stream_path a resposta é recebida em streaming e gravada nesse
+    arquivo conforme chega; se o prazo estourar, o parcial é mantido.
     """
     if not OPENROUTER_API_KEY:
         print("❌ OPENROUTER_API_KEY não configurada")
@@ -88,7 +121,7 @@ Specifically look for:
 4. Free API credits for specific models
 5. "Powered by" free access (e.g., "GLM-5 free on Opencode Zen")
 
-Models to check: {', '.join(TARGET_MODELS[:10])}
+Models to check: {', '.join(TARGET_MODELS)}
 
 For each free tier found, provide:
 - Model name
@@ -114,106 +147,180 @@ Be specific and current. Focus on February 2026 active offers."""
                 }
             ],
             "max_tokens": 2000,
-            "temperature": 0.1
+            "temperature": 0.1,
+            "usage": {"include": True}
         }
         
-        req = urllib.request.Request(
-            OPENROUTER_API_URL,
-            data=json.dumps(payload).encode('utf-8'),
-            headers={
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://value.ai-foil.com",
-                "X-Title": "Free Tier Hunter"
-            },
-            method='POST'
+        cache = cache or CompletionCache()
+        data = cache.chat_completion(
+            payload,
+            title="Free Tier Hunter",
+            refresh=_should_refresh(GENERAL_QUERY, refresh),
+            stream_path=stream_path,
+            api_key=OPENROUTER_API_KEY
         )
+        content = completion_content(data)
+        stream = data.get("stream", {})
         
-        with urllib.request.urlopen(req, timeout=120) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-            
+        if stream.get("complete") is False:
+            print(f"⚠️ Resposta parcial ({len(content)} chars): {stream.get('error')}")
+        else:
             print(f"✅ Perplexity via OpenRouter respondeu ({len(content)} chars)")
-            
+        if stream.get("ttft_ms") is not None:
+            print(f"   TTFT {stream['ttft_ms']} ms, {stream['tokens_per_sec']} tokens/s")
+        
+        if content:
             free_tiers.append({
                 "source": "perplexity_sonar_deep_research",
                 "query_date": datetime.utcnow().isoformat() + "Z",
                 "raw_content": content,
+                "complete": stream.get("complete", True),
                 "parsed": False
             })
         
-    except urllib.error.HTTPError as e:
-        print(f"❌ Erro na API OpenRouter: HTTP {e.code}")
-        print(f"   Response: {e.read().decode('utf-8')[:200]}")
+    except httpx.HTTPStatusError as e:
+        print(f"❌ Erro na API OpenRouter: HTTP {e.response.status_code}")
+        print(f"   Response: {e.response.text[:200]}")
     except Exception as e:
         print(f"❌ Erro na API OpenRouter: {e}")
     
     return free_tiers
 
 
-def search_specific_platform_promos() -> List[Dict]:
-    """
-    Busca promoções específicas por plataforma via OpenRouter.
-    """
-    if not OPENROUTER_API_KEY:
-        return []
-    
-    promotions = []
+def _platform_query(platform: str) -> str:
+    return (
+        f"What free LLM models or free tiers does {platform} offer in February 2026? "
+        f"Any promotions or temporary free access? "
+        f"Models of interest: {', '.join(TARGET_MODELS)}."
+    )
+
+
+def _unique_platforms(platforms: List[str]) -> List[str]:
+    """Remove duplicados ignorando maiúsculas ("OpenCode" / "Opencode")."""
+    seen = set()
+    unique = []
+    for platform in platforms:
+        if platform.lower() not in seen:
+            seen.add(platform.lower())
+            unique.append(platform)
+    return unique
+
+
+async def _query_platform(
+    platform: str,
+    bucket: TokenBucket,
+    semaphore: asyncio.Semaphore,
+    cache: CompletionCache,
+    refresh: bool
+) -> Dict:
+    payload = {
+        "model": PERPLEXITY_MODEL,
+        "messages": [
+            {
+                "role": "user",
+                "content": _platform_query(platform)
+            }
+        ],
+        "max_tokens": 1000,
+        "temperature": 0.1,
+        "usage": {"include": True}
+    }
     
-    # Busca por plataforma específica conhecida
-    platforms_to_check = [
-        "Opencode",
-        "Cursor",
-        "Windsurf",
-        "Zed IDE",
-        "GitHub Copilot free",
-        "Amazon CodeWhisperer free"
-    ]
+    # Hits do cache não passam pelo rate limit
+    cached = not refresh and cache.get(payload) is not None
     
-    for platform in platforms_to_check[:3]:  # Limita para não gastar muitos tokens
-        query = f"What free LLM models or free tiers does {platform} offer in February 2026? Any promotions or temporary free access?"
-        
+    async with semaphore:
+        if not cached:
+            await bucket.acquire()
+        start = time.perf_counter()
         try:
-            payload = {
-                "model": PERPLEXITY_MODEL,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": query
-                    }
-                ],
-                "max_tokens": 1000,
-                "temperature": 0.1
+            data = await cache.achat_completion(
+                payload,
+                title="Free Tier Hunter",
+                refresh=refresh,
+                api_key=OPENROUTER_API_KEY
+            )
+            return {
+                "platform": platform,
+                "content": completion_content(data),
+                "date": datetime.utcnow().isoformat() + "Z",
+                "elapsed_s": round(time.perf_counter() - start, 1),
+                "cached": cached
             }
+        except Exception as e:
+            return {"platform": platform, "error": str(e), "elapsed_s": round(time.perf_counter() - start, 1)}
+
+
+async def sweep_platform_promos(
+    platforms: List[str] = PLATFORMS,
+    concurrency: int = MAX_CONCURRENCY,
+    requests_per_second: float = REQUESTS_PER_SECOND,
+    progress_file: Optional[str] = None,
+    cache: Optional[CompletionCache] = None,
+    refresh: Optional[List[str]] = None
+) -> List[Dict]:
+    """
+    Consulta todas as plataformas em paralelo.
+    
+    A concorrência é limitada por um semáforo e o ritmo de novas chamadas
+    por um token bucket (limite da OpenRouter). Cada resultado é gravado
+    em progress_file (JSONL) assim que chega, então uma execução
+    interrompida não perde o que já foi pago.
+    """
+    platforms = _unique_platforms(platforms)
+    cache = cache or CompletionCache()
+    bucket = TokenBucket(rate=requests_per_second, capacity=RATE_LIMIT_BURST)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    if progress_file:
+        os.makedirs(os.path.dirname(progress_file) or ".", exist_ok=True)
+        open(progress_file, "w").close()
+    
+    results = {}
+    try:
+        tasks = [
+            _query_platform(platform, bucket, semaphore, cache, _should_refresh(platform, refresh))
+            for platform in platforms
+        ]
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            results[result["platform"]] = result
             
-            req = urllib.request.Request(
-                OPENROUTER_API_URL,
-                data=json.dumps(payload).encode('utf-8'),
-                headers={
-                    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://value.ai-foil.com",
-                    "X-Title": "Free Tier Hunter"
-                },
-                method='POST'
-            )
+            if "error" in result:
+                print(f"⚠️ Erro buscando {result['platform']}: {result['error']}")
+            else:
+                origin = "cache" if result["cached"] else f"{result['elapsed_s']}s"
+                print(f"✅ {result['platform']}: encontrado info ({origin})")
             
-            with urllib.request.urlopen(req, timeout=120) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                
-                promotions.append({
-                    "platform": platform,
-                    "content": content,
-                    "date": datetime.utcnow().isoformat() + "Z"
-                })
-                
-                print(f"✅ {platform}: encontrado info")
-                
-        except Exception as e:
-            print(f"⚠️ Erro buscando {platform}: {e}")
+            if progress_file:
+                with open(progress_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        await close_async_client()
     
-    return promotions
+    # Ordem estável (a de PLATFORMS), só os que responderam
+    return [results[p] for p in platforms if p in results and "error" not in results[p]]
+
+
+def search_specific_platform_promos(
+    concurrency: int = MAX_CONCURRENCY,
+    progress_file: Optional[str] = None,
+    cache: Optional[CompletionCache] = None,
+    refresh: Optional[List[str]] = None
+) -> List[Dict]:
+    """
+    Busca promoções específicas por plataforma via OpenRouter.
+    Cobre toda a lista PLATFORMS (ver sweep_platform_promos).
+    """
+    if not OPENROUTER_API_KEY:
+        return []
+    
+    return asyncio.run(sweep_platform_promos(
+        concurrency=concurrency,
+        progress_file=progress_file,
+        cache=cache,
+        refresh=refresh
+    ))
 
 
 def save_results(free_tiers: List[Dict], promotions: List[Dict], output_file: str):
@@ -225,7 +332,7 @@ def save_results(free_tiers: List[Dict], promotions: List[Dict], output_file: st
         "source": "perplexity_sonar_deep_research_via_openrouter",
         "search_summary": {
             "models_checked": len(TARGET_MODELS),
-            "platforms_checked": len(PLATFORMS),
+            "platforms_checked": len(_unique_platforms(PLATFORMS)),
             "free_tiers_found": len(free_tiers),
             "platform_promos_found": len(promotions)
         },
@@ -282,6 +389,11 @@ def main():
     parser.add_argument("--api-key", help="OpenRouter API Key")
     parser.add_argument("--quick", action="store_true", help="Busca rápida (só geral)")
     parser.add_argument("--output", default=OUTPUT_FILE, help="Arquivo de saída")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="Consultas simultâneas por plataforma")
+    parser.add_argument("--refresh", nargs="*", metavar="NOME",
+                        help=f"Ignora o cache: sem nomes refaz tudo; ou '{GENERAL_QUERY}' e/ou plataformas")
+    parser.add_argument("--cache-ttl-hours", type=float, default=DEFAULT_TTL_SECONDS / 3600,
+                        help="Validade das respostas em cache (horas)")
     
     args = parser.parse_args()
     
@@ -294,14 +406,18 @@ def main():
     print("=" * 60)
     print()
     
+    cache = CompletionCache(ttl_seconds=args.cache_ttl_hours * 3600)
+    
     # Busca geral
     print("🌐 Buscando free tiers atuais...")
-    free_tiers = search_free_tiers_with_perplexity()
+    stream_path = os.path.splitext(args.output)[0] + "_general.partial.md"
+    free_tiers = search_free_tiers_with_perplexity(cache, args.refresh, stream_path)
     
     promotions = []
     if not args.quick:
         print("\n🔍 Buscando promoções por plataforma...")
-        promotions = search_specific_platform_promos()
+        progress_file = os.path.splitext(args.output)[0] + "_platforms.jsonl"
+        promotions = search_specific_platform_promos(args.concurrency, progress_file, cache, args.refresh)
     
     # Salva resultados
     save_results(free_tiers, promotions, args.output)
@@ -309,6 +425,7 @@ def main():
     # Gera frontend JSON
     generate_frontend_json(args.output)
     
+    print(f"\n💰 Cache: {cache.stats['hits']} hits, {cache.stats['misses']} chamadas pagas (${cache.stats['cost']:.4f})")
     print("\n✅ Busca completa!")
     print("⚠️  IMPORTANTE: Revise os resultados manualmente antes de publicar")
     print("📝 Edite o arquivo JSON para estruturar os free tiers encontrados")
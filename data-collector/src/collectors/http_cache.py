@@ -0,0 +1,155 @@
+"""
+HTTP Cache
+Cache em disco para endpoints JSON com revalidação condicional
+(ETag / Last-Modified), TTL e single-flight dentro do processo.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+import httpx
+
+from collectors.http_client import request
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# data-collector/data/cache/http, qualquer que seja o cwd (o workflow roda da raiz)
+DEFAULT_CACHE_DIR = str(Path(__file__).parent.parent.parent / "data" / "cache" / "http")
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_TIMEOUT = 30
+
+
+class HttpCache:
+    """
+    Cache de respostas JSON por URL.
+
+    - Dentro do TTL: serve do disco sem tocar a rede.
+    - Fora do TTL: GET condicional; 304 renova o TTL e reaproveita o corpo.
+    - Erro de rede com entrada em cache: serve a versão antiga (stale).
+    - Chamadas simultâneas para a mesma URL no processo fazem um único
+      request; depois disso a resposta fica em memória pelo resto do
+      processo (uma execução do pipeline busca o catálogo uma vez).
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self._memory: Dict[str, Dict] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {"memory": 0, "fresh": 0, "revalidated": 0, "fetched": 0, "stale": 0}
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _lock(self, url: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(url, threading.Lock())
+
+    def _load(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            return entry if entry.get("url") == url else None
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, entry: Dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(entry["url"])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get("validated_at", 0) < self.ttl_seconds
+
+    def _request(self, url: str, headers: Dict[str, str], timeout: float) -> httpx.Response:
+        return request("GET", url, headers=headers, timeout=timeout)
+
+    def get_json(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        force_refresh: bool = False,
+    ) -> Any:
+        """
+        Retorna o JSON da URL, usando o cache quando possível.
+
+        force_refresh ignora o TTL (mas ainda revalida com ETag).
+        """
+        with self._lock(url):
+            entry = self._memory.get(url)
+            if entry and not force_refresh:
+                self.stats["memory"] += 1
+                return entry["body"]
+
+            entry = entry or self._load(url)
+            if entry and not force_refresh and self._is_fresh(entry):
+                self.stats["fresh"] += 1
+                self._memory[url] = entry
+                return entry["body"]
+
+            request_headers = dict(headers or {})
+            if entry:
+                if entry.get("etag"):
+                    request_headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    request_headers["If-Modified-Since"] = entry["last_modified"]
+
+            try:
+                response = self._request(url, request_headers, timeout)
+                if response.status_code == 304 and entry:
+                    entry["validated_at"] = time.time()
+                    self.stats["revalidated"] += 1
+                    logger.info(f"♻️ Cache revalidado (304): {url}")
+                else:
+                    response.raise_for_status()
+                    entry = {
+                        "url": url,
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "validated_at": time.time(),
+                        "body": response.json(),
+                    }
+                    self.stats["fetched"] += 1
+                self._store(entry)
+
+            except (httpx.HTTPError, ValueError) as e:
+                if not entry:
+                    raise
+                self.stats["stale"] += 1
+                logger.warning(f"⚠️ Falha ao revalidar {url} ({e}); usando cache antigo")
+
+            self._memory[url] = entry
+            return entry["body"]
+
+    def invalidate(self, url: str):
+        """Remove a URL do cache (memória e disco)."""
+        with self._lock(url):
+            self._memory.pop(url, None)
+            try:
+                os.remove(self._path(url))
+            except FileNotFoundError:
+                pass
+
+
+_default_cache: Optional[HttpCache] = None
+
+
+def get_default_cache() -> HttpCache:
+    """Cache compartilhado do processo."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = HttpCache()
+    return _default_cache
@@ -0,0 +1,182 @@
+"""
+HTTP Client
+Cliente HTTP compartilhado (httpx) com pool de conexões keep-alive,
+HTTP/2 quando o pacote h2 está instalado e uma política única de
+timeout/retry. Fachadas síncrona e assíncrona; todos os collectors e
+scripts usam este módulo em vez de abrir uma conexão por chamada.
+"""
+
+import asyncio
+import random
+import time
+from typing import Optional
+import logging
+
+import httpx
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+# httpx loga toda requisição em INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+DEFAULT_TIMEOUT = 30
+CONNECT_TIMEOUT = 10
+DEFAULT_RETRIES = 2
+BACKOFF_BASE_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+USER_AGENT = "ia-custo-beneficio-collector/1.0"
+
+LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _timeout(timeout: Optional[float]) -> httpx.Timeout:
+    total = DEFAULT_TIMEOUT if timeout is None else timeout
+    return httpx.Timeout(total, connect=min(CONNECT_TIMEOUT, total))
+
+
+def _client_kwargs() -> dict:
+    return {
+        "http2": HTTP2_AVAILABLE,
+        "limits": LIMITS,
+        "timeout": _timeout(None),
+        "headers": {"User-Agent": USER_AGENT},
+        "follow_redirects": True,
+    }
+
+
+def _should_retry(method: str, response: Optional[httpx.Response], error: Optional[Exception]) -> bool:
+    """
+    Retry em 429/5xx e falhas de conexão; timeout de leitura só em
+    métodos idempotentes (um POST de chat pode já ter sido cobrado).
+    """
+    if response is not None:
+        return response.status_code in RETRY_STATUSES
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    return isinstance(error, httpx.TransportError) and method.upper() in IDEMPOTENT_METHODS
+
+
+def _backoff_seconds(attempt: int, response: Optional[httpx.Response]) -> float:
+    """Respeita Retry-After (em segundos); senão backoff exponencial com jitter."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(MAX_BACKOFF_SECONDS, float(retry_after))
+    delay = BACKOFF_BASE_SECONDS * (2 ** attempt)
+    return min(MAX_BACKOFF_SECONDS, delay + random.uniform(0, delay / 2))
+
+
+_client: Optional[httpx.Client] = None
+
+
+def get_client() -> httpx.Client:
+    """Cliente síncrono do processo (criado na primeira chamada)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.Client(**_client_kwargs())
+    return _client
+
+
+def close_client():
+    """Fecha o cliente síncrono compartilhado, se existir."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def request(
+    method: str,
+    url: str,
+    timeout: Optional[float] = None,
+    retries: int = DEFAULT_RETRIES,
+    **kwargs,
+) -> httpx.Response:
+    """
+    Request síncrono pelo cliente compartilhado, com retry.
+
+    Não chama raise_for_status: status de erro que não é retentável (ou
+    que esgotou as tentativas) volta para quem chamou decidir.
+    """
+    client = get_client()
+    for attempt in range(retries + 1):
+        response, error = None, None
+        try:
+            response = client.request(method, url, timeout=_timeout(timeout), **kwargs)
+        except httpx.TransportError as e:
+            error = e
+
+        if attempt < retries and _should_retry(method, response, error):
+            delay = _backoff_seconds(attempt, response)
+            reason = response.status_code if response is not None else type(error).__name__
+            logger.warning(f"🔁 {method} {url}: {reason}, nova tentativa em {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        if error is not None:
+            raise error
+        return response
+
+
+_async_client: Optional[httpx.AsyncClient] = None
+_async_loop = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Cliente assíncrono compartilhado, um por event loop.
+
+    Deve ser chamado de dentro de uma coroutine.
+    """
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    if _async_loop is not loop or _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(**_client_kwargs())
+        _async_loop = loop
+    return _async_client
+
+
+async def close_async_client():
+    """Fecha o cliente assíncrono compartilhado, se existir no loop atual."""
+    global _async_client, _async_loop
+    client, loop = _async_client, _async_loop
+    _async_client = _async_loop = None
+
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+async def arequest(
+    method: str,
+    url: str,
+    timeout: Optional[float] = None,
+    retries: int = DEFAULT_RETRIES,
+    **kwargs,
+) -> httpx.Response:
+    """Versão assíncrona de request(), com a mesma política de retry."""
+    client = get_async_client()
+    for attempt in range(retries + 1):
+        response, error = None, None
+        try:
+            response = await client.request(method, url, timeout=_timeout(timeout), **kwargs)
+        except httpx.TransportError as e:
+            error = e
+
+        if attempt < retries and _should_retry(method, response, error):
+            delay = _backoff_seconds(attempt, response)
+            reason = response.status_code if response is not None else type(error).__name__
+            logger.warning(f"🔁 {method} {url}: {reason}, nova tentativa em {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        if error is not None:
+            raise error
+        return response
@@ -4,37 +4,80 @@ Busca dados de preços e capabilities de todos os modelos disponíveis.
 """
 
 import json
-import requests
+import os
+import httpx
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
+from collectors.http_cache import get_default_cache
+from collectors.http_client import arequest, request
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/models"
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+OPENROUTER_REFERER = "https://value.ai-foil.com"
+CHAT_TIMEOUT = 120
 
 
-def fetch_openrouter_models() -> List[Dict]:
+def fetch_openrouter_models(force_refresh: bool = False) -> List[Dict]:
     """
     Busca todos os modelos da OpenRouter API.
     Retorna lista de modelos com preços e metadata.
+    
+    Usa o cache HTTP (ETag/Last-Modified + TTL): dentro do mesmo processo
+    o catálogo é baixado uma única vez.
     """
     try:
-        response = requests.get(OPENROUTER_API_URL, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = get_default_cache().get_json(OPENROUTER_API_URL, timeout=30, force_refresh=force_refresh)
         
         models = data.get("data", [])
         logger.info(f"✅ OpenRouter: {len(models)} modelos encontrados")
         
         return models
         
-    except requests.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         logger.error(f"❌ Erro ao buscar OpenRouter: {e}")
         return []
 
 
+def openrouter_headers(title: str, api_key: Optional[str] = None) -> Dict[str, str]:
+    """
+    Headers das chamadas autenticadas à OpenRouter.
+    A chave é lida do ambiente na hora da chamada se não for passada.
+    """
+    return {
+        "Authorization": f"Bearer {api_key or os.getenv('OPENROUTER_API_KEY', '')}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": OPENROUTER_REFERER,
+        "X-Title": title,
+    }
+
+
+def chat_completion(payload: Dict, title: str, timeout: float = CHAT_TIMEOUT, api_key: Optional[str] = None) -> Dict:
+    """
+    POST em /chat/completions pelo cliente HTTP compartilhado.
+    Levanta httpx.HTTPStatusError em respostas de erro.
+    """
+    response = request("POST", OPENROUTER_CHAT_URL, json=payload, headers=openrouter_headers(title, api_key), timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+async def achat_completion(payload: Dict, title: str, timeout: float = CHAT_TIMEOUT, api_key: Optional[str] = None) -> Dict:
+    """Versão assíncrona de chat_completion()."""
+    response = await arequest("POST", OPENROUTER_CHAT_URL, json=payload, headers=openrouter_headers(title, api_key), timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def completion_content(data: Dict) -> str:
+    """Texto da primeira escolha de uma resposta de chat."""
+    return data.get("choices", [{}])[0].get("message", {}).get("content", "")
+
+
 def normalize_model(model: Dict) -> Dict:
     """
     Normaliza os dados de um modelo da OpenRouter.
@@ -49,6 +92,7 @@ def normalize_model(model: Dict) -> Dict:
         "pricing": {
             "prompt": float(pricing.get("prompt", 0)) * 1_000_000,  # por 1M tokens
             "completion": float(pricing.get("completion", 0)) * 1_000_000,
+            "input_cache_read": float(pricing["input_cache_read"]) * 1_000_000 if pricing.get("input_cache_read") else None,
             "image": float(pricing.get("image", 0)) if pricing.get("image") else None,
             "request": float(pricing.get("request", 0)) if pricing.get("request") else None,
         },
@@ -0,0 +1,156 @@
+"""
+Collector Orchestrator
+Roda todos os collectors em paralelo com asyncio, com timeout e
+cancelamento por fonte e um registro de status de cada execução.
+"""
+
+import asyncio
+import inspect
+import time
+from typing import Dict, Iterable, Optional
+import logging
+
+from collectors import arena, artificial, openrouter, swebench
+from collectors.browser_pool import close_shared_pool
+from collectors.http_client import close_async_client
+from collectors.strategies import strategy_reports
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_FALLBACK = "fallback"
+STATUS_FAILED = "failed"
+
+# Fonte -> função de coleta, normalização, dados de fallback e timeout (s)
+COLLECTORS = {
+    "openrouter": {
+        "fetch": openrouter.fetch_openrouter_models,
+        "normalize": openrouter.normalize_model,
+        "fallback": None,
+        "timeout": 60,
+    },
+    "arena": {
+        "fetch": arena.fetch_arena_leaderboard,
+        "normalize": arena.normalize_arena_model,
+        "fallback": None,
+        "timeout": 30,
+    },
+    "swebench": {
+        "fetch": swebench.fetch_swebench_leaderboard,
+        "normalize": swebench.normalize_swebench_model,
+        "fallback": swebench.get_fallback_data,
+        "timeout": 120,
+    },
+    "artificial_analysis": {
+        "fetch": artificial.fetch_artificial_leaderboard,
+        "normalize": artificial.normalize_artificial_model,
+        "fallback": artificial.get_fallback_data,
+        "timeout": 120,
+    },
+}
+
+
+async def run_collector(name: str, spec: Dict, timeout: Optional[float] = None) -> Dict:
+    """
+    Executa um collector e retorna modelos normalizados + status.
+
+    No timeout a espera é cancelada e, se a fonte tiver fallback, ele é
+    usado. Só collectors async são de fato interrompidos: os síncronos
+    rodam em thread (asyncio.to_thread), que não pode ser cancelada, e
+    continuam até terminar em segundo plano. Eles devem limitar o próprio
+    tempo (openrouter: timeout de 30 s no cliente HTTP, abaixo dos 60 s da
+    fonte; arena: dados estáticos).
+    """
+    timeout = timeout if timeout is not None else spec["timeout"]
+    fallback = spec.get("fallback")
+    start = time.perf_counter()
+    error = None
+
+    try:
+        if inspect.iscoroutinefunction(spec["fetch"]):
+            call = spec["fetch"]()
+        else:
+            # wait_for não interrompe a thread: só deixa de esperar por ela
+            call = asyncio.to_thread(spec["fetch"])
+        models = await asyncio.wait_for(call, timeout=timeout)
+
+        # Os collectors de scraping devolvem o fallback internamente em caso de erro
+        if not models:
+            status = STATUS_FAILED
+        elif fallback and models == fallback():
+            status = STATUS_FALLBACK
+        else:
+            status = STATUS_OK
+
+    except asyncio.TimeoutError:
+        error = f"timeout após {timeout}s"
+        models, status = None, STATUS_FAILED
+    except Exception as e:
+        error = str(e)
+        models, status = None, STATUS_FAILED
+
+    if status == STATUS_FAILED and fallback:
+        models, status = fallback(), STATUS_FALLBACK
+
+    normalized = [spec["normalize"](m) for m in (models or [])]
+    elapsed_ms = round((time.perf_counter() - start) * 1000)
+
+    if error:
+        logger.warning(f"⚠️ {name}: {error} ({status})")
+    elif status != STATUS_OK:
+        logger.warning(f"⚠️ {name}: {len(normalized)} modelos ({status}, {elapsed_ms} ms)")
+    else:
+        logger.info(f"✅ {name}: {len(normalized)} modelos ({status}, {elapsed_ms} ms)")
+
+    result = {
+        "models": normalized,
+        "status": status,
+        "elapsed_ms": elapsed_ms,
+    }
+    if error:
+        result["error"] = error
+    if name in strategy_reports:
+        result["strategies"] = strategy_reports.pop(name)
+    return result
+
+
+async def collect_all(
+    sources: Optional[Iterable[str]] = None,
+    timeouts: Optional[Dict[str, float]] = None
+) -> Dict[str, Dict]:
+    """
+    Coleta todas as fontes em paralelo.
+
+    O tempo total é o da fonte mais lenta (limitado pelo seu timeout),
+    não a soma das fontes. Os scrapers dividem um único Chromium
+    (browser_pool) e um cliente HTTP (http_client), fechados ao final.
+    """
+    names = list(sources) if sources is not None else list(COLLECTORS)
+    timeouts = timeouts or {}
+
+    try:
+        results = await asyncio.gather(*(
+            run_collector(name, COLLECTORS[name], timeouts.get(name))
+            for name in names
+        ))
+    finally:
+        await close_shared_pool()
+        await close_async_client()
+    return dict(zip(names, results))
+
+
+def source_status(results: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Bloco "sources" do dataset a partir dos resultados da coleta."""
+    status = {}
+    for name, result in results.items():
+        entry = {
+            "models_count": len(result["models"]),
+            "status": result["status"],
+            "elapsed_ms": result["elapsed_ms"],
+        }
+        for key in ("error", "strategies"):
+            if key in result:
+                entry[key] = result[key]
+        status[name] = entry
+    return status
@@ -0,0 +1,141 @@
+"""
+Page Readiness
+Espera a leaderboard renderizar (contagem mínima de linhas ou tabela
+estável) em vez de sleeps fixos, com limite superior adaptativo
+calculado a partir dos tempos observados em execuções anteriores.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Dentro de data-collector/data/ (commitado pelo workflow semanal), qualquer que seja o cwd
+DEFAULT_TIMINGS_PATH = str(Path(__file__).parent.parent.parent / "data" / "cache" / "readiness_timings.json")
+DEFAULT_MAX_WAIT_MS = 15000
+MIN_MAX_WAIT_MS = 3000
+MAX_MAX_WAIT_MS = 30000
+POLL_INTERVAL_MS = 100
+STABLE_MS = 500          # tabela com min_rows sem mudar por este tempo = pronta
+SMALL_TABLE_STABLE_MS = 2000  # tabela abaixo de min_rows, mas parada há este tempo
+HISTORY_SIZE = 20
+
+# Conta só linhas de dados: <tr> dentro de <thead> ou sem <td> (cabeçalho) não
+# contam, então uma tabela só com cabeçalho nunca fica "estável com linhas"
+COUNT_ROWS_JS = """(sel) => Array.from(document.querySelectorAll(sel)).filter(
+    (row) => row.tagName !== "TR" || (!row.closest("thead") && row.querySelector("td"))
+).length"""
+
+
+class ReadinessTracker:
+    """
+    Histórico de tempos até a página ficar pronta, por página.
+
+    O limite de espera é 2x o p90 dos tempos recentes, entre
+    MIN_MAX_WAIT_MS e MAX_MAX_WAIT_MS; timeouts entram no histórico
+    com o tempo esperado, então o limite cresce se a página ficar lenta.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_TIMINGS_PATH):
+        self.path = path
+        self.history: Dict[str, List[Dict]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.history = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"⚠️ Histórico de readiness ignorado: {e}")
+
+    def max_wait_ms(self, key: str) -> int:
+        """Limite superior adaptativo para a página."""
+        samples = sorted(entry["elapsed_ms"] for entry in self.history.get(key, []))
+        if not samples:
+            return DEFAULT_MAX_WAIT_MS
+        p90 = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+        return int(min(MAX_MAX_WAIT_MS, max(MIN_MAX_WAIT_MS, p90 * 2)))
+
+    def record(self, key: str, result: Dict):
+        """Registra uma medição e persiste o histórico."""
+        entries = self.history.setdefault(key, [])
+        entries.append({
+            "elapsed_ms": result["elapsed_ms"],
+            "rows": result["rows"],
+            "reason": result["reason"],
+        })
+        del entries[:-HISTORY_SIZE]
+
+        if self.path:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.history, f, indent=2, ensure_ascii=False)
+
+
+_default_tracker: Optional[ReadinessTracker] = None
+
+
+def get_tracker() -> ReadinessTracker:
+    """Tracker padrão do processo (carregado na primeira chamada)."""
+    global _default_tracker
+    if _default_tracker is None:
+        _default_tracker = ReadinessTracker()
+    return _default_tracker
+
+
+async def wait_for_rows(
+    page,
+    selector: str,
+    key: str,
+    min_rows: int = 5,
+    tracker: Optional[ReadinessTracker] = None,
+) -> Dict:
+    """
+    Espera as linhas da tabela aparecerem e pararem de mudar.
+
+    Pronta quando há pelo menos min_rows linhas de dados estáveis por
+    STABLE_MS, ou qualquer quantidade > 0 estável por SMALL_TABLE_STABLE_MS
+    (linhas de cabeçalho não contam, ver COUNT_ROWS_JS). Retorna
+    {"ready", "rows", "elapsed_ms", "reason"} e registra o tempo no tracker.
+    """
+    tracker = tracker or get_tracker()
+    max_wait_ms = tracker.max_wait_ms(key)
+    start = time.perf_counter()
+
+    last_count = -1
+    last_change = start
+    reason = "timeout"
+
+    while True:
+        count = await page.evaluate(COUNT_ROWS_JS, selector)
+        now = time.perf_counter()
+        if count != last_count:
+            last_count, last_change = count, now
+
+        stable_ms = (now - last_change) * 1000
+        if count >= min_rows and stable_ms >= STABLE_MS:
+            reason = "min_rows"
+            break
+        if count > 0 and stable_ms >= SMALL_TABLE_STABLE_MS:
+            reason = "stable"
+            break
+        if (now - start) * 1000 >= max_wait_ms:
+            break
+
+        await page.wait_for_timeout(POLL_INTERVAL_MS)
+
+    result = {
+        "ready": reason != "timeout",
+        "rows": last_count,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000),
+        "reason": reason,
+        "max_wait_ms": max_wait_ms,
+    }
+    tracker.record(key, result)
+
+    log = logger.info if result["ready"] else logger.warning
+    log(f"⏱️ {key}: {result['rows']} linhas em {result['elapsed_ms']} ms ({reason}, limite {max_wait_ms} ms)")
+    return result
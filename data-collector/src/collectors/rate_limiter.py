@@ -0,0 +1,41 @@
+"""
+Rate Limiter
+Token bucket assíncrono para espaçar chamadas a APIs com limite de
+requisições (OpenRouter).
+"""
+
+import asyncio
+import time
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Libera até `capacity` chamadas de uma vez e depois `rate` por segundo.
+
+    acquire() espera até haver um token; as esperas são servidas em
+    ordem de chegada.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1):
+        async with self._lock:
+            self._refill()
+            while self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
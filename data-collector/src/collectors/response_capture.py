@@ -0,0 +1,164 @@
+"""
+Response Capture
+Intercepta as respostas JSON (XHR/fetch) que as leaderboards usam para
+carregar seus dados e extrai as linhas direto do payload, sem depender
+da posição das células no DOM renderizado.
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WAIT_MS = 5000
+QUIET_MS = 300           # sem novas respostas por este tempo = captura completa
+POLL_INTERVAL_MS = 100
+MIN_LIST_SIZE = 3
+CAPTURED_RESOURCE_TYPES = {"xhr", "fetch"}
+
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Converte 72.3, "72.3%", "$1.25" em float; outros valores em None."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        match = _NUMBER_RE.search(value.replace(",", ""))
+        return float(match.group()) if match else None
+    return None
+
+
+def _get_path(record: Dict, path: str) -> Any:
+    """Lê "a.b.c" de dicts aninhados."""
+    value: Any = record
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def iter_record_lists(payload: Any, min_size: int = MIN_LIST_SIZE) -> Iterator[List[Dict]]:
+    """Percorre o JSON e devolve toda lista de objetos com min_size ou mais itens."""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            dicts = [item for item in node if isinstance(item, dict)]
+            if len(dicts) >= min_size:
+                yield dicts
+            stack.extend(node)
+
+
+def extract_records(
+    payloads: Sequence[Any],
+    field_aliases: Dict[str, Sequence[str]],
+    required: Sequence[str],
+    text_fields: Sequence[str] = ("model",),
+) -> List[Dict]:
+    """
+    Mapeia registros dos payloads para o formato bruto do collector.
+
+    field_aliases: campo de saída -> caminhos possíveis no JSON (o primeiro
+    presente vence). Usa a lista de registros com mais linhas válidas.
+    """
+    best: List[Dict] = []
+    for payload in payloads:
+        for records in iter_record_lists(payload):
+            rows = []
+            for record in records:
+                row = {}
+                for field, aliases in field_aliases.items():
+                    for alias in aliases:
+                        raw = _get_path(record, alias)
+                        if raw is None:
+                            continue
+                        value = str(raw).strip() if field in text_fields else _to_number(raw)
+                        if value not in (None, ""):
+                            row[field] = value
+                            break
+                if all(field in row for field in required):
+                    rows.append(row)
+            if len(rows) > len(best):
+                best = rows
+
+    # Remove duplicados mantendo a primeira ocorrência
+    seen = set()
+    unique = []
+    for row in best:
+        if row["model"] not in seen:
+            seen.add(row["model"])
+            unique.append(row)
+    return unique
+
+
+class ResponseCapture:
+    """
+    Escuta as respostas JSON de uma página do Playwright.
+
+    Deve ser criado antes de page.goto() para não perder as primeiras
+    requisições.
+    """
+
+    def __init__(self, page, url_pattern: Optional[str] = None):
+        self.page = page
+        self.url_pattern = re.compile(url_pattern) if url_pattern else None
+        self.payloads: List[Any] = []
+        self._pending: List[asyncio.Task] = []
+        self._last_response = time.perf_counter()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        request = response.request
+        if request.resource_type not in CAPTURED_RESOURCE_TYPES:
+            return
+        if self.url_pattern and not self.url_pattern.search(response.url):
+            return
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        self._last_response = time.perf_counter()
+        self._pending.append(asyncio.ensure_future(self._read(response)))
+
+    async def _read(self, response):
+        try:
+            self.payloads.append(await response.json())
+        except Exception as e:
+            logger.debug(f"Resposta ignorada ({response.url}): {e}")
+
+    async def wait_for_records(
+        self,
+        field_aliases: Dict[str, Sequence[str]],
+        required: Sequence[str],
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+    ) -> List[Dict]:
+        """
+        Espera respostas com registros válidos e a rede ficar quieta.
+
+        Retorna [] se nada utilizável chegar em max_wait_ms (o collector
+        então cai para o scraping do DOM).
+        """
+        start = time.perf_counter()
+        records: List[Dict] = []
+        while (time.perf_counter() - start) * 1000 < max_wait_ms:
+            if self._pending:
+                await asyncio.gather(*self._pending)
+                self._pending = []
+            records = extract_records(self.payloads, field_aliases, required)
+            quiet_ms = (time.perf_counter() - self._last_response) * 1000
+            if records and quiet_ms >= QUIET_MS:
+                break
+            await asyncio.sleep(POLL_INTERVAL_MS / 1000)
+
+        self.page.remove_listener("response", self._on_response)
+        for task in self._pending:
+            task.cancel()
+        return records
@@ -0,0 +1,98 @@
+"""
+Extraction Strategies
+Cada collector declara estratégias em ordem de custo (HTTP + lxml antes
+do Playwright); a primeira que retorna linhas vence. O tempo de cada
+tentativa fica registrado por fonte.
+"""
+
+import json
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+from lxml import html as lxml_html
+
+from collectors.http_client import arequest
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATIC_FETCH_TIMEOUT = 20
+USER_AGENT = "Mozilla/5.0 (compatible; ia-custo-beneficio-collector/1.0)"
+
+Strategy = Tuple[str, Callable[[], Awaitable[List[Dict]]]]
+
+# Fonte -> tentativas da última execução (lido pelo orchestrator)
+strategy_reports: Dict[str, List[Dict]] = {}
+
+
+async def run_strategies(source: str, strategies: Sequence[Strategy]) -> List[Dict]:
+    """
+    Tenta as estratégias em ordem e para na primeira com linhas.
+
+    Erros de uma estratégia (inclusive ImportError do Playwright) só
+    escalam para a próxima; o relatório fica em strategy_reports[source].
+    """
+    report = []
+    strategy_reports[source] = report
+
+    for name, strategy in strategies:
+        start = time.perf_counter()
+        entry = {"strategy": name}
+        try:
+            rows = await strategy()
+        except Exception as e:
+            rows = []
+            message = str(e).strip().splitlines()
+            entry["error"] = f"{type(e).__name__}: {message[0] if message else ''}"
+
+        entry["rows"] = len(rows or [])
+        entry["elapsed_ms"] = round((time.perf_counter() - start) * 1000)
+        report.append(entry)
+        logger.info(f"⏱️ {source}/{name}: {entry['rows']} linhas em {entry['elapsed_ms']} ms")
+
+        if rows:
+            return rows
+
+    return []
+
+
+async def fetch_static_html(url: str):
+    """Baixa a página sem browser e retorna a árvore lxml."""
+    response = await arequest("GET", url, timeout=STATIC_FETCH_TIMEOUT, headers={"User-Agent": USER_AGENT})
+    response.raise_for_status()
+    return lxml_html.fromstring(response.text)
+
+
+def parse_table_rows(tree, min_cells: int = 2) -> List[List[str]]:
+    """Texto das células de cada linha (<tr> com <td>) de todas as tabelas."""
+    rows = []
+    for tr in tree.xpath("//table//tr[td]"):
+        cells = [" ".join(td.text_content().split()) for td in tr.xpath("./td")]
+        if len(cells) >= min_cells:
+            rows.append(cells)
+    return rows
+
+
+def parse_embedded_json(tree) -> List:
+    """Payloads JSON embutidos no HTML (__NEXT_DATA__, application/json, ld+json)."""
+    payloads = []
+    for script in tree.xpath(
+        '//script[@id="__NEXT_DATA__" or @type="application/json" or @type="application/ld+json"]'
+    ):
+        try:
+            payloads.append(json.loads(script.text_content()))
+        except ValueError:
+            continue
+    return payloads
+
+
+def parse_number(text: Optional[str]) -> Optional[float]:
+    """"72.3%" / "$1.25" / "1,234" -> float (como parseFloat no scraping do DOM)."""
+    if not text:
+        return None
+    cleaned = text.replace("%", "").replace("$", "").replace(",", "").strip()
+    try:
+        return float(cleaned.split()[0])
+    except (ValueError, IndexError):
+        return None
@@ -0,0 +1,151 @@
+"""
+Streaming Chat Client
+Chat completions via server-sent events (stream=true): o conteúdo é
+gravado em disco conforme chega, com tempo até o primeiro token e
+tokens/s. Se o prazo estourar, o que já chegou é devolvido em vez de
+perdido.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import AsyncIterator, Dict, Optional
+import logging
+
+import httpx
+
+from collectors.http_client import close_async_client, get_async_client
+from collectors.openrouter import CHAT_TIMEOUT, OPENROUTER_CHAT_URL, openrouter_headers
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+READ_TIMEOUT = 60  # máximo sem nenhum byte (a OpenRouter manda comentários de keep-alive)
+
+
+async def iter_sse_data(lines: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Dados de cada evento SSE.
+
+    Linhas "data:" consecutivas formam um evento; linha vazia o encerra;
+    linhas ":" são comentários (": OPENROUTER PROCESSING").
+    """
+    data = []
+    async for line in lines:
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+        elif line.startswith(":"):
+            continue
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip(" "))
+    if data:
+        yield "\n".join(data)
+
+
+async def stream_chat_completion(
+    payload: Dict,
+    title: str,
+    partial_path: Optional[str] = None,
+    timeout: float = CHAT_TIMEOUT,
+    api_key: Optional[str] = None,
+    url: str = OPENROUTER_CHAT_URL,
+) -> Dict:
+    """
+    Faz o chat completion em streaming.
+
+    timeout é o prazo total da chamada. Retorna:
+    {"content", "complete", "error", "usage", "ttft_ms", "elapsed_ms",
+     "completion_tokens", "tokens_per_sec"}; complete=False quando o
+    prazo estourou ou a conexão caiu no meio (content tem o parcial).
+    """
+    start = time.perf_counter()
+    parts = []
+    usage = None
+    first_token_at = None
+    chunks = 0
+    error = None
+    complete = False
+
+    partial = None
+    if partial_path:
+        os.makedirs(os.path.dirname(partial_path) or ".", exist_ok=True)
+        partial = open(partial_path, "w", encoding="utf-8")
+
+    request_timeout = httpx.Timeout(timeout, connect=min(10, timeout), read=READ_TIMEOUT)
+    try:
+        async with asyncio.timeout(timeout):
+            async with get_async_client().stream(
+                "POST",
+                url,
+                json={**payload, "stream": True},
+                headers=openrouter_headers(title, api_key),
+                timeout=request_timeout,
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                async for data in iter_sse_data(response.aiter_lines()):
+                    if data == "[DONE]":
+                        complete = True
+                        break
+                    chunk = json.loads(data)
+                    if chunk.get("error"):
+                        error = str(chunk["error"].get("message", chunk["error"]))
+                        break
+                    usage = chunk.get("usage") or usage
+
+                    delta = (chunk.get("choices") or [{}])[0].get("delta", {}).get("content")
+                    if delta:
+                        if first_token_at is None:
+                            first_token_at = time.perf_counter()
+                        chunks += 1
+                        parts.append(delta)
+                        if partial:
+                            partial.write(delta)
+                            partial.flush()
+
+    except TimeoutError:
+        error = f"prazo de {timeout}s estourado"
+    except (httpx.TransportError, ValueError) as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        if partial:
+            partial.close()
+
+    end = time.perf_counter()
+    completion_tokens = (usage or {}).get("completion_tokens") or chunks
+    generation_s = end - first_token_at if first_token_at else 0
+    result = {
+        "content": "".join(parts),
+        "complete": complete and error is None,
+        "error": error,
+        "usage": usage,
+        "ttft_ms": round((first_token_at - start) * 1000) if first_token_at else None,
+        "elapsed_ms": round((end - start) * 1000),
+        "completion_tokens": completion_tokens,
+        "tokens_per_sec": round(completion_tokens / generation_s, 1) if generation_s > 0 else None,
+    }
+
+    if result["complete"]:
+        logger.info(
+            f"📡 {title}: {len(result['content'])} chars, TTFT {result['ttft_ms']} ms, "
+            f"{result['tokens_per_sec']} tok/s"
+        )
+    else:
+        logger.warning(f"⚠️ {title}: stream incompleto ({error}); mantidos {len(result['content'])} chars")
+    return result
+
+
+def stream_chat_completion_sync(payload: Dict, title: str, **kwargs) -> Dict:
+    """stream_chat_completion() para scripts síncronos."""
+    async def runner():
+        try:
+            return await stream_chat_completion(payload, title, **kwargs)
+        finally:
+            await close_async_client()
+
+    return asyncio.run(runner())
@@ -4,20 +4,36 @@ Busca resultados de benchmarks de software engineering.
 """
 
 import json
-import asyncio
 from typing import Dict, List
 from datetime import datetime
 import logging
 
+from collectors.browser_pool import get_shared_pool, run_with_shared_pool
+from collectors.page_readiness import wait_for_rows
+from collectors.response_capture import ResponseCapture
+from collectors.strategies import fetch_static_html, parse_number, parse_table_rows, run_strategies
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 SWEBENCH_URL = "https://www.swebench.com/"
+SWEBENCH_ROW_SELECTOR = 'table tr'
+
+# Campos do JSON da página -> formato bruto usado por normalize_swebench_model
+SWEBENCH_FIELD_ALIASES = {
+    "model": ["name", "model", "model_name", "system"],
+    "swe_bench_full": ["swe_bench_full", "resolved", "percent_resolved", "score"],
+    "swe_bench_verified": ["swe_bench_verified", "verified"],
+    "swe_bench_lite": ["swe_bench_lite", "lite"],
+}
 
 
 async def fetch_swebench_leaderboard() -> List[Dict]:
     """
-    Busca dados da leaderboard SWE-bench usando Playwright.
+    Busca dados da leaderboard SWE-bench.
+    
+    Tenta HTTP + lxml primeiro e só abre o Chromium se a página estática
+    não tiver linhas.
     
     SWE-bench tem várias categorias:
     - Full (2294 instâncias)
@@ -26,37 +42,71 @@ async def fetch_swebench_leaderboard() -> List[Dict]:
     - Multimodal (517 instâncias)
     - Bash Only (500 instâncias)
     """
-    try:
-        from playwright.async_api import async_playwright
+    models = await run_strategies("swebench", [
+        ("http", _fetch_swebench_static),
+        ("browser", _fetch_swebench_browser),
+    ])
+    
+    if models:
+        logger.info(f"✅ SWE-bench: {len(models)} modelos coletados")
+        return models
+    
+    logger.warning("⚠️ SWE-bench: nenhum dado encontrado, usando fallback")
+    return get_fallback_data()
+
+
+async def _fetch_swebench_static() -> List[Dict]:
+    """
+    Estratégia HTTP + lxml: a leaderboard do swebench.com vem no HTML estático.
+    """
+    tree = await fetch_static_html(SWEBENCH_URL)
+    
+    models = []
+    for cells in parse_table_rows(tree, min_cells=2):
+        if cells[0] and cells[1]:
+            models.append({"model": cells[0], "swe_bench_full": parse_number(cells[1]) or None})
+    
+    return models
+
+
+async def _fetch_swebench_browser() -> List[Dict]:
+    """
+    Estratégia Playwright: respostas JSON da página, depois o DOM renderizado.
+    """
+    pool = await get_shared_pool()
+    
+    async with pool.page() as page:
+        capture = ResponseCapture(page)
+        logger.info("🌐 Acessando SWE-bench...")
+        await page.goto(SWEBENCH_URL, wait_until="domcontentloaded", timeout=60000)
+        
+        # Tenta primeiro os dados JSON que a própria página carrega
+        models = await capture.wait_for_records(SWEBENCH_FIELD_ALIASES, required=("model", "swe_bench_full"))
+        
+        if models:
+            logger.info(f"📦 SWE-bench: {len(models)} modelos via respostas JSON")
+        else:
+            # Fallback: scraping do DOM, após a tabela renderizar
+            await wait_for_rows(page, SWEBENCH_ROW_SELECTOR, key="swebench", min_rows=5)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            logger.info("🌐 Acessando SWE-bench...")
-            await page.goto(SWEBENCH_URL, wait_until="networkidle", timeout=60000)
-            
-            # Aguarda o conteúdo carregar
-            await page.wait_for_timeout(3000)
-            
             # Extrai dados da leaderboard
             models = await page.evaluate("""
                 () => {
                     const data = [];
-                    
+                
                     // Procura por tabelas ou elementos com dados de modelos
                     const tables = document.querySelectorAll('table');
-                    
+                
                     tables.forEach(table => {
                         const rows = table.querySelectorAll('tr');
                         rows.forEach((row, index) => {
                             if (index === 0) return; // Skip header
-                            
+                        
                             const cells = row.querySelectorAll('td');
                             if (cells.length >= 2) {
                                 const modelName = cells[0]?.textContent?.trim();
                                 const score = cells[1]?.textContent?.trim();
-                                
+                            
                                 if (modelName && score) {
                                     data.push({
                                         model: modelName,
@@ -66,26 +116,12 @@ async def fetch_swebench_leaderboard() -> List[Dict]:
                             }
                         });
                     });
-                    
+                
                     return data;
                 }
             """)
-            
-            await browser.close()
-            
-            if models and len(models) > 0:
-                logger.info(f"✅ SWE-bench: {len(models)} modelos coletados")
-                return models
-            else:
-                logger.warning("⚠️ SWE-bench: nenhum dado encontrado, usando fallback")
-                return get_fallback_data()
-                
-    except ImportError:
-        logger.warning("⚠️ Playwright não instalado, usando fallback")
-        return get_fallback_data()
-    except Exception as e:
-        logger.error(f"❌ Erro ao buscar SWE-bench: {e}")
-        return get_fallback_data()
+    
+    return models
 
 
 def normalize_swebench_model(model: Dict) -> Dict:
@@ -106,7 +142,7 @@ def collect_and_save(output_path: str = "data/raw/swebench_leaderboard.json"):
     """
     Coleta e salva dados do SWE-bench.
     """
-    models = asyncio.run(fetch_swebench_leaderboard())
+    models = run_with_shared_pool(fetch_swebench_leaderboard())
     
     normalized = [normalize_swebench_model(m) for m in models]
     
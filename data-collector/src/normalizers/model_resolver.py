@@ -0,0 +1,224 @@
+"""
+Model Resolver
+Resolve nomes de modelos entre fontes (OpenRouter x leaderboards) usando
+um índice invertido de tokens normalizados, construído uma vez por fonte.
+"""
+
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Sufixos de variante: mesmo modelo base, configuração diferente
+VARIANT_SUFFIXES = {
+    "thinking": "thinking",
+    "reasoning": "thinking",
+    "high": "high",
+    "instant": "instant",
+    "preview": "preview",
+}
+
+# Tokens que não mudam a identidade do modelo
+NOISE_TOKENS = {"latest", "chat", "instruct", "it", "exp", "online", "free", "beta", "fp8"}
+
+# Tokens que distinguem modelos da mesma família (nunca podem divergir)
+TIER_TOKENS = {
+    "mini", "nano", "micro", "small", "medium", "large", "pro", "flash", "lite",
+    "max", "plus", "ultra", "turbo", "opus", "sonnet", "haiku", "scout",
+    "maverick", "coder", "vision", "codex", "fast",
+}
+
+# Aliases exatos: nome usado por uma fonte -> nome canônico
+MODEL_ALIASES = {
+    "deepseek-chat": "DeepSeek V3",
+    "deepseek-reasoner": "DeepSeek R1",
+    "chatgpt-4o-latest": "ChatGPT-4o",
+}
+
+# Confiança atribuída a cada tipo de match
+CONFIDENCE_EXACT = 1.0
+CONFIDENCE_BASE_VARIANT = 0.85
+CONFIDENCE_FUZZY_MAX = 0.8
+FUZZY_MIN_SCORE = 0.5
+
+# Só datas completas (2024-10-22, 20241022): "2411"/"2507" são versões
+_DATE_RE = re.compile(r"\b20\d{2}-[01]\d-[0-3]\d\b|\b20\d{2}[01]\d[0-3]\d\b")
+_SPLIT_RE = re.compile(r"[\s/_:\-,()]+")
+_LETTER_DIGIT_RE = re.compile(r"(?<=[a-z])(?=\d)")
+
+ModelKey = Tuple[Tuple[str, ...], Optional[str]]
+
+
+def tokenize_model_name(name: str) -> ModelKey:
+    """
+    Normaliza um id/nome de modelo em (tokens base, variante).
+
+    "anthropic/claude-opus-4-6:thinking" e "Claude Opus 4.6 Thinking"
+    geram a mesma chave: (("claude", "opus", "4.6"), "thinking").
+    """
+    text = name.lower().strip()
+    variant = None
+
+    # Remove provider ("openai/...", "Anthropic: ...") e sufixo ":free", ":thinking"
+    if "/" in text:
+        text = text.split("/", 1)[1]
+    if ": " in text:
+        text = text.split(": ", 1)[1]
+    if ":" in text:
+        text, suffix = text.split(":", 1)
+        variant = VARIANT_SUFFIXES.get(suffix)
+
+    text = _DATE_RE.sub(" ", text)
+
+    raw_tokens = []
+    for part in _SPLIT_RE.split(text):
+        raw_tokens.extend(t for t in _LETTER_DIGIT_RE.split(part) if t)
+
+    # Junta versões separadas por hífen: "4-6" -> "4.6"
+    tokens: List[str] = []
+    for token in raw_tokens:
+        if (
+            tokens
+            and token.isdigit()
+            and len(token) <= 2
+            and re.fullmatch(r"\d+(\.\d+)?", tokens[-1])
+            and "." not in tokens[-1]
+        ):
+            tokens[-1] = f"{tokens[-1]}.{token}"
+        else:
+            tokens.append(token)
+
+    base = []
+    for token in tokens:
+        if token in VARIANT_SUFFIXES:
+            variant = variant or VARIANT_SUFFIXES[token]
+        elif token not in NOISE_TOKENS:
+            base.append(token)
+
+    return tuple(base), variant
+
+
+def _signature(tokens: Tuple[str, ...]) -> FrozenSet[str]:
+    """Tokens discriminativos: versões e tiers."""
+    return frozenset(t for t in tokens if t in TIER_TOKENS or any(c.isdigit() for c in t))
+
+
+class ModelResolver:
+    """
+    Índice de uma fonte de benchmarks para lookup de modelos.
+
+    Construído uma vez por execução; cada lookup é O(1) para matches
+    exatos e proporcional à menor posting list para matches aproximados.
+    """
+
+    def __init__(self, benchmark_list: List[Dict], name_field: str = "model_name"):
+        self.entries = benchmark_list
+        self.exact: Dict[ModelKey, int] = {}
+        self.by_base: Dict[Tuple[str, ...], List[int]] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self.keys: List[ModelKey] = []
+
+        for idx, entry in enumerate(benchmark_list):
+            key = tokenize_model_name(entry.get(name_field) or "")
+            self.keys.append(key)
+            if not key[0]:
+                continue
+
+            # Primeira ocorrência vence (fontes vêm ordenadas por rank)
+            self.exact.setdefault(key, idx)
+            self.by_base.setdefault(key[0], []).append(idx)
+            for token in set(key[0]):
+                self.postings.setdefault(token, []).append(idx)
+
+        self.aliases = {
+            tokenize_model_name(alias): tokenize_model_name(canonical)
+            for alias, canonical in MODEL_ALIASES.items()
+        }
+
+    def _lookup_key(self, key: ModelKey) -> Optional[Tuple[int, float]]:
+        """Match exato, com fallback de variante."""
+        base, variant = key
+        if not base:
+            return None
+
+        if key in self.exact:
+            return self.exact[key], CONFIDENCE_EXACT
+
+        # Variante pedida não existe na fonte: usa o modelo base
+        if variant and (base, None) in self.exact:
+            return self.exact[(base, None)], CONFIDENCE_BASE_VARIANT
+
+        # Modelo base pedido, mas a fonte só tem variantes
+        if not variant and base in self.by_base:
+            return self.by_base[base][0], CONFIDENCE_BASE_VARIANT
+
+        return None
+
+    def _lookup_fuzzy(self, key: ModelKey) -> Optional[Tuple[int, float]]:
+        """Match aproximado via índice invertido (Jaccard sobre tokens)."""
+        base, variant = key
+        if not base:
+            return None
+
+        signature = _signature(base)
+        anchor = signature or set(base)
+        posting_lists = [self.postings.get(t, []) for t in anchor]
+        if signature:
+            # Todos os tokens discriminativos precisam estar presentes
+            posting_lists.sort(key=len)
+            candidates = set(posting_lists[0])
+            for posting in posting_lists[1:]:
+                candidates &= set(posting)
+        else:
+            candidates = set().union(*posting_lists)
+
+        query = set(base)
+        best: Optional[Tuple[float, int, int]] = None
+        for idx in candidates:
+            cand_base, cand_variant = self.keys[idx]
+            if _signature(cand_base) != signature:
+                continue
+            cand = set(cand_base)
+            score = len(query & cand) / len(query | cand)
+            if score < FUZZY_MIN_SCORE:
+                continue
+            # Maior score, depois mesma variante, depois ordem da fonte
+            rank = (score, int(cand_variant == variant), -idx)
+            if best is None or rank > best:
+                best = rank
+
+        if best is None:
+            return None
+        return -best[2], round(best[0] * CONFIDENCE_FUZZY_MAX, 3)
+
+    def resolve(self, model_id: str, model_name: str = "") -> Optional[Tuple[Dict, float]]:
+        """
+        Encontra o modelo correspondente na fonte.
+
+        Retorna (entrada do benchmark, confiança entre 0 e 1) ou None.
+        """
+        keys = []
+        for text in (model_id, model_name):
+            if text:
+                key = tokenize_model_name(text)
+                keys.append(self.aliases.get(key, key))
+
+        best: Optional[Tuple[int, float]] = None
+        for lookup in (self._lookup_key, self._lookup_fuzzy):
+            for key in keys:
+                hit = lookup(key)
+                if hit and (best is None or hit[1] > best[1]):
+                    best = hit
+            if best:
+                break
+
+        if best is None:
+            return None
+        return self.entries[best[0]], best[1]
+
+    def find(self, model_id: str, model_name: str = "") -> Optional[Dict]:
+        """Como resolve(), mas retorna apenas a entrada."""
+        match = self.resolve(model_id, model_name)
+        return match[0] if match else None
@@ -0,0 +1,134 @@
+"""
+Publish Artifacts
+Grava datasets para o site estático: JSON minificado com nome
+endereçado por conteúdo (models.<hash>.json), irmãos pré-comprimidos
+.gz/.br e um manifest.json pequeno apontando para a versão atual.
+Arquivos com hash no nome nunca mudam, então podem ter cache longo
+(immutable) no CDN; só o manifest precisa ser revalidado.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+import logging
+
+try:
+    import brotli
+except ImportError:  # .br é opcional; o .gz sempre é gerado
+    brotli = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+HASH_LENGTH = 12
+KEEP_VERSIONS = 3  # versão atual + anteriores (HTML antigo em cache ainda aponta para elas)
+ENCODING_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+def minify(data: Any) -> bytes:
+    """JSON sem espaços nem indentação."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+
+def compress(payload: bytes) -> Dict[str, bytes]:
+    """Versões pré-comprimidas por Content-Encoding (determinísticas)."""
+    encoded = {"gzip": gzip.compress(payload, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(payload, quality=11)
+    else:
+        logger.warning("⚠️ brotli não instalado: pulando .br")
+    return encoded
+
+
+def load_manifest(out_dir: str) -> Dict:
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"artifacts": {}}
+
+
+def _write(path: str, payload: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def write_hashed(payload: bytes, out_dir: str, name: str, extension: str = "json") -> Dict:
+    """
+    Grava <out_dir>/<name>.<hash>.<extension> e os irmãos .gz/.br.
+    Retorna {"path", "hash", "bytes", "encodings"} (paths relativos a out_dir).
+    """
+    digest = content_hash(payload)
+    filename = f"{name}.{digest}.{extension}"
+    os.makedirs(os.path.dirname(os.path.join(out_dir, filename)), exist_ok=True)
+
+    entry = {
+        "path": filename,
+        "hash": digest,
+        "bytes": len(payload),
+        "encodings": {},
+    }
+    _write(os.path.join(out_dir, filename), payload)
+    for encoding, encoded in compress(payload).items():
+        encoded_name = filename + ENCODING_SUFFIXES[encoding]
+        _write(os.path.join(out_dir, encoded_name), encoded)
+        entry["encodings"][encoding] = {"path": encoded_name, "bytes": len(encoded)}
+    return entry
+
+
+def remove_artifact(out_dir: str, path: str):
+    """Apaga um artefato e seus irmãos comprimidos (se existirem)."""
+    for name in [path] + [path + suffix for suffix in ENCODING_SUFFIXES.values()]:
+        try:
+            os.remove(os.path.join(out_dir, name))
+        except FileNotFoundError:
+            pass
+
+
+def publish_json(
+    data: Any,
+    name: str,
+    out_dir: str,
+    keep: int = KEEP_VERSIONS,
+    payload: Optional[bytes] = None,
+    extension: str = "json",
+) -> Dict:
+    """
+    Publica um dataset como <name>.<hash>.<extension> (+ .gz/.br) e
+    atualiza o manifest.
+
+    payload permite publicar bytes já serializados (outro formato);
+    senão data é minificado. Versões além de `keep` são apagadas.
+    Retorna a entrada do manifest.
+    """
+    payload = minify(data) if payload is None else payload
+    entry = write_hashed(payload, out_dir, name, extension)
+    filename = entry["path"]
+
+    manifest = load_manifest(out_dir)
+    current = manifest["artifacts"].get(name)
+    history = [] if current is None else [current["path"]] + current.get("previous", [])
+    history = [path for path in history if path != filename]
+    entry["previous"] = history[:keep - 1]
+
+    # Remove versões antigas que saíram da janela
+    for old in history[keep - 1:]:
+        remove_artifact(out_dir, old)
+
+    manifest["artifacts"][name] = entry
+    manifest["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    _write(os.path.join(out_dir, MANIFEST_FILE), json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    sizes = ", ".join(f"{enc} {info['bytes']:,} B" for enc, info in entry["encodings"].items())
+    logger.info(f"📦 {filename}: {entry['bytes']:,} B ({sizes})")
+    return entry
@@ -0,0 +1,116 @@
+"""
+Columnar Wire Format
+Exporta o catálogo em colunas (um array por campo) em vez de um array
+de objetos: chaves não se repetem por modelo, provider/família viram
+índices de dicionário e números são quantizados para a precisão exibida
+no site (inteiros + escala). Decodificado por src/lib/columnar.ts.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from normalizers.model_resolver import tokenize_model_name
+
+COLUMNAR_FORMAT = "columnar-v1"
+
+# Coluna -> (caminho no modelo mesclado, tipo, escala)
+# tipo: "str" (texto), "dict" (índice em dictionaries[coluna]),
+#       "num" (round(valor * escala), null se ausente), "bool"
+# Escalas = casas exibidas em ranking-table.tsx (benchmarks com 1 casa,
+# ELO inteiro); preços ficam com 4 casas porque entram na ordenação.
+COLUMNAR_FIELDS: List[Tuple[str, Optional[str], str, Optional[int]]] = [
+    ("id", "id", "str", None),
+    ("name", "name", "str", None),
+    ("provider", "provider", "dict", None),
+    ("family", None, "dict", None),
+    ("context_length", "context_length", "num", 1),
+    ("price_prompt", "pricing.prompt", "num", 10000),
+    ("price_completion", "pricing.completion", "num", 10000),
+    ("swe_bench", "benchmarks.swe_bench_verified", "num", 10),  # performance.swe_bench da API
+    ("swe_bench_full", "benchmarks.swe_bench_full", "num", 10),
+    ("intelligence", "benchmarks.intelligence_score", "num", 10),
+    ("arena_elo", "benchmarks.arena_elo", "num", 1),
+    ("cost_benefit_coding", "cost_benefit_scores.coding", "num", 100),
+    ("cost_benefit_general", "cost_benefit_scores.general", "num", 100),
+    ("pareto_frontier", "pareto.frontier", "bool", None),
+    ("dominated_by", "pareto.dominated_by", "num", 1),
+]
+
+
+def _get_path(model: Dict, path: str) -> Any:
+    value: Any = model
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def model_family(model: Dict) -> str:
+    """Família do modelo: primeiro token do nome normalizado ("claude", "llama")."""
+    tokens, _ = tokenize_model_name(model.get("name") or model.get("id") or "")
+    return tokens[0] if tokens else ""
+
+
+def encode_columnar(dataset: Dict) -> Dict:
+    """
+    Converte um dataset {"models": [...], "rankings": {...}} para o
+    formato colunar. Rankings viram listas de índices de linha.
+    """
+    models = dataset.get("models", [])
+    columns: Dict[str, List] = {}
+    dictionaries: Dict[str, List[str]] = {}
+    scales: Dict[str, int] = {}
+
+    for column, path, kind, scale in COLUMNAR_FIELDS:
+        raw = [model_family(m) if column == "family" else _get_path(m, path) for m in models]
+
+        if kind == "dict":
+            codes: Dict[str, int] = {}
+            columns[column] = [codes.setdefault(value or "", len(codes)) for value in raw]
+            dictionaries[column] = list(codes)
+        elif kind == "num":
+            scales[column] = scale
+            columns[column] = [None if value is None else int(round(value * scale)) for value in raw]
+        elif kind == "bool":
+            columns[column] = [1 if value else 0 for value in raw]
+        else:
+            columns[column] = [value or "" for value in raw]
+
+    row_of = {model_id: row for row, model_id in enumerate(columns["id"])}
+    rankings = {
+        criterion: [row_of[entry["model_id"]] for entry in entries if entry.get("model_id") in row_of]
+        for criterion, entries in (dataset.get("rankings") or {}).items()
+    }
+
+    return {
+        "format": COLUMNAR_FORMAT,
+        "updated_at": dataset.get("updated_at"),
+        "count": len(models),
+        "dictionaries": dictionaries,
+        "scales": scales,
+        "columns": columns,
+        "rankings": rankings,
+    }
+
+
+def decode_columnar(payload: Dict) -> List[Dict]:
+    """
+    Decodificação de referência (mesmo contrato de src/lib/columnar.ts):
+    uma linha plana por modelo, com números já divididos pela escala.
+    """
+    columns = payload["columns"]
+    dictionaries = payload["dictionaries"]
+    scales = payload["scales"]
+
+    decoded = {}
+    for column, values in columns.items():
+        if column in dictionaries:
+            decoded[column] = [dictionaries[column][code] for code in values]
+        elif column in scales:
+            scale = scales[column]
+            decoded[column] = [None if value is None else value / scale for value in values]
+        else:
+            decoded[column] = values
+
+    names = list(decoded)
+    return [dict(zip(names, row)) for row in zip(*(decoded[name] for name in names))]
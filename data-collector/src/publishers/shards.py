@@ -0,0 +1,143 @@
+"""
+Sharded Static API
+Divide o dataset final em arquivos pequenos para carregamento sob
+demanda: um índice, um shard por ranking (só o top-K), um por provider e
+um de detalhe por modelo. Shards têm hash no nome (cache immutable) e
+não carregam updated_at, que fica só no índice: shard cujo dado não
+mudou mantém o hash entre execuções. O índice é publicado pelo
+manifest, então a primeira carga não cresce com o catálogo.
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Dict, List, Set
+import logging
+
+from calculators.rankings import DEFAULT_TOP_K
+from publishers.artifacts import KEEP_VERSIONS, minify, publish_json, remove_artifact, write_hashed
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SHARD_DIR = "api"
+SHARD_HISTORY_FILE = ".published.json"  # paths por geração, para limpeza
+INDEX_NAME = "models-index"
+
+
+def slugify(value: str) -> str:
+    """"meta-llama/llama-3.1-8b:free" -> "meta-llama--llama-3.1-8b-free"."""
+    slug = re.sub(r"[^a-z0-9._-]+", "-", value.lower().replace("/", "--")).strip("-.")
+    return slug or "unknown"
+
+
+def _unique_slugs(values: List[str]) -> Dict[str, str]:
+    """Slug por valor; colisões ganham sufixo numérico (ordem estável)."""
+    slugs: Dict[str, str] = {}
+    used: Set[str] = set()
+    for value in values:
+        if value in slugs:
+            continue
+        slug, n = slugify(value), 2
+        while slug in used:
+            slug = f"{slugify(value)}-{n}"
+            n += 1
+        slugs[value] = slug
+        used.add(slug)
+    return slugs
+
+
+def _summary(model: Dict, detail_path: str) -> Dict:
+    """Campos que uma linha de tabela/ranking exibe, sem o modelo inteiro."""
+    return {
+        "id": model.get("id"),
+        "name": model.get("name"),
+        "provider": model.get("provider"),
+        "context_length": model.get("context_length"),
+        "pricing": model.get("pricing"),
+        "benchmarks": model.get("benchmarks"),
+        "cost_benefit_scores": model.get("cost_benefit_scores"),
+        "pareto": model.get("pareto"),
+        "detail": detail_path,
+    }
+
+
+def publish_shards(dataset: Dict, out_dir: str, k: int = DEFAULT_TOP_K, keep: int = KEEP_VERSIONS) -> Dict:
+    """
+    Publica os shards de um dataset {"models", "rankings", "updated_at"}
+    (rankings de generate_final_dataset, incluindo as categorias do site)
+    em <out_dir>/api/ e o índice no manifest como "models-index".
+
+    Shards que nenhuma das últimas `keep` gerações referencia são apagados.
+    Retorna a entrada do índice no manifest.
+    """
+    models = dataset.get("models", [])
+    written: List[str] = []
+
+    def write(name: str, data: Dict) -> str:
+        entry = write_hashed(minify(data), out_dir, f"{SHARD_DIR}/{name}")
+        written.append(entry["path"])
+        return entry["path"]
+
+    # Detalhe por modelo
+    model_slugs = _unique_slugs([m.get("id", "") for m in models])
+    summaries = {}
+    for model in models:
+        detail = write(f"models/{model_slugs[model.get('id', '')]}", {"model": model})
+        summaries[model.get("id")] = _summary(model, detail)
+
+    # Top-K por ranking, com o resumo de cada modelo embutido
+    rankings_index = {}
+    for criterion, entries in (dataset.get("rankings") or {}).items():
+        top = [
+            {**entry, "model": summaries[entry["model_id"]]}
+            for entry in entries[:k] if entry.get("model_id") in summaries
+        ]
+        path = write(f"rankings/{slugify(criterion)}", {"criterion": criterion, "entries": top})
+        rankings_index[criterion] = {"path": path, "count": len(top)}
+
+    # Modelos por provider
+    by_provider: Dict[str, List[Dict]] = defaultdict(list)
+    for model in models:
+        by_provider[model.get("provider") or "unknown"].append(summaries[model.get("id")])
+    provider_slugs = _unique_slugs(list(by_provider))
+    providers_index = {}
+    for provider, rows in sorted(by_provider.items()):
+        path = write(f"providers/{provider_slugs[provider]}", {"provider": provider, "models": rows})
+        providers_index[provider] = {"path": path, "count": len(rows)}
+
+    index = {
+        "updated_at": dataset.get("updated_at"),
+        "total_models": len(models),
+        "rankings": rankings_index,
+        "providers": providers_index,
+    }
+    entry = publish_json(index, INDEX_NAME, out_dir, keep=keep)
+
+    removed = _prune(out_dir, written, keep)
+    logger.info(
+        f"🧩 Shards: {len(rankings_index)} rankings, {len(providers_index)} providers, "
+        f"{len(models)} modelos ({removed} antigos removidos)"
+    )
+    return entry
+
+
+def _prune(out_dir: str, written: List[str], keep: int) -> int:
+    """Mantém os shards das últimas `keep` gerações e apaga o resto."""
+    history_path = os.path.join(out_dir, SHARD_DIR, SHARD_HISTORY_FILE)
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            generations = json.load(f)
+    except (OSError, ValueError):
+        generations = []
+
+    generations = [sorted(written)] + [g for g in generations if g != sorted(written)]
+    live = {path for generation in generations[:keep] for path in generation}
+    stale = {path for generation in generations[keep:] for path in generation} - live
+    for path in stale:
+        remove_artifact(out_dir, path)
+
+    with open(history_path, "w", encoding="utf-8") as f:
+        json.dump(generations[:keep], f)
+    return len(stale)
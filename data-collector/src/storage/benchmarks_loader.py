@@ -0,0 +1,190 @@
+"""
+Benchmarks Loader
+Carrega os scores de uma coleta em value.benchmarks numa única
+transação: as linhas vão por COPY para uma tabela temporária e um só
+comando aplica o merge (UPDATE das existentes que mudaram + INSERT das
+que ainda não têm linha). Linhas sem mudança não são tocadas e ids fora
+de value.llm_master_list são reportados em vez de ignorados em silêncio.
+
+value.benchmarks só é única por (llm_id, collected_at), então não dá
+para usar ON CONFLICT (llm_id): o merge é UPDATE + INSERT ... WHERE NOT
+EXISTS com a tabela travada contra escritas concorrentes.
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BENCHMARKS_TABLE = "value.benchmarks"
+MASTER_TABLE = "value.llm_master_list"
+STAGE_TABLE = "benchmarks_stage"
+DATA_SOURCE = "benchmarks_unified"
+
+# Coluna em value.benchmarks -> chave em benchmarks_unified.json
+BENCHMARK_COLUMNS = {
+    "artificial_analysis_intelligence_score": "intelligence_score",
+    "leaderboard_ai_score": "arena_elo",
+    "swe_bench_verified": "swe_bench",
+}
+
+
+def connect(dsn: Optional[str] = None):
+    """
+    Conexão psycopg em autocommit (DATABASE_URL por padrão): cada
+    load_benchmarks abre e confirma a própria transação.
+    """
+    import psycopg
+
+    dsn = dsn or os.environ.get("DATABASE_URL")
+    if not dsn:
+        raise ValueError("DATABASE_URL não definido")
+    return psycopg.connect(dsn, autocommit=True)
+
+
+def benchmark_rows(benchmarks_data: Dict, columns: Dict[str, str] = BENCHMARK_COLUMNS) -> List[Tuple]:
+    """
+    benchmarks_unified ({"benchmarks": {llm_id: scores}}) -> linhas
+    (llm_id, *valores na ordem de columns). Score ausente ou zero vira
+    NULL (mantém o valor do banco); modelos sem nenhum score ficam de fora.
+    """
+    rows = []
+    for llm_id, scores in benchmarks_data.get("benchmarks", {}).items():
+        values = tuple(scores.get(key) or None for key in columns.values())
+        if any(value is not None for value in values):
+            rows.append((llm_id, *values))
+    return rows
+
+
+def refresh_latest_benchmarks(cur, ids: Optional[Sequence[str]] = None, schema: str = "value") -> int:
+    """
+    Recalcula <schema>.latest_benchmarks para ids (None = todos) com
+    <schema>.refresh_latest_benchmarks. Sem a migração aplicada, só avisa.
+    """
+    from psycopg import sql
+
+    cur.execute("SELECT to_regprocedure(%s)", (f"{schema}.refresh_latest_benchmarks(character varying[])",))
+    if cur.fetchone()[0] is None:
+        logger.warning(f"⚠️ {schema}.latest_benchmarks não existe: aplique database/latest_benchmarks.sql")
+        return 0
+    cur.execute(
+        sql.SQL("SELECT {}.refresh_latest_benchmarks(%s)").format(sql.Identifier(schema)),
+        (list(ids) if ids is not None else None,),
+    )
+    return cur.fetchone()[0]
+
+
+def _identifier(name: str):
+    from psycopg import sql
+
+    return sql.Identifier(*name.split("."))
+
+
+def load_benchmarks(
+    conn,
+    rows: Sequence[Tuple],
+    columns: Sequence[str] = tuple(BENCHMARK_COLUMNS),
+    table: str = BENCHMARKS_TABLE,
+    master_table: str = MASTER_TABLE,
+    data_source: str = DATA_SOURCE,
+    refresh_latest: bool = True,
+) -> Dict:
+    """
+    Aplica as linhas (llm_id, *valores de columns) em `table` numa transação
+    (savepoint, se conn já estiver dentro de uma).
+
+    NULL nunca sobrescreve um valor existente. Com refresh_latest, os
+    modelos alterados são recalculados em latest_benchmarks (se a tabela
+    existir no schema de `table`) na mesma transação. Retorna contagens:
+    staged, updated, inserted, unchanged, refreshed e unknown (ids fora
+    de master_table, com a lista em unknown_ids).
+    """
+    from psycopg import sql
+
+    # Último valor vence se o mesmo id vier repetido
+    rows = list({row[0]: row for row in rows}.values())
+    cols = [sql.Identifier(column) for column in columns]
+    target, master, stage = _identifier(table), _identifier(master_table), sql.Identifier(STAGE_TABLE)
+    target_schema = table.split(".")[0] if "." in table else "public"
+    refreshed = 0
+
+    changed = sql.SQL(" OR ").join(
+        sql.SQL("(s.{c} IS NOT NULL AND s.{c} IS DISTINCT FROM b.{c})").format(c=c) for c in cols
+    )
+    merge = sql.SQL("""
+        WITH known AS (
+            SELECT s.* FROM {stage} s
+            WHERE EXISTS (SELECT 1 FROM {master} lm WHERE lm.id = s.llm_id)
+        ),
+        updated AS (
+            UPDATE {target} b SET {assignments}
+            FROM known s
+            WHERE b.llm_id = s.llm_id AND ({changed})
+            RETURNING b.llm_id
+        ),
+        inserted AS (
+            INSERT INTO {target} (llm_id, {cols}, data_source)
+            SELECT s.llm_id, {stage_cols}, %(data_source)s FROM known s
+            WHERE NOT EXISTS (SELECT 1 FROM {target} b WHERE b.llm_id = s.llm_id)
+            RETURNING llm_id
+        )
+        SELECT
+            (SELECT count(*) FROM known),
+            ARRAY(SELECT DISTINCT llm_id FROM updated),
+            ARRAY(SELECT llm_id FROM inserted)
+    """).format(
+        stage=stage,
+        master=master,
+        target=target,
+        assignments=sql.SQL(", ").join(sql.SQL("{c} = COALESCE(s.{c}, b.{c})").format(c=c) for c in cols),
+        changed=changed,
+        cols=sql.SQL(", ").join(cols),
+        stage_cols=sql.SQL(", ").join(sql.SQL("s.{c}").format(c=c) for c in cols),
+    )
+
+    with conn.transaction(), conn.cursor() as cur:
+        # Impede outro loader de inserir o mesmo llm_id entre o NOT EXISTS e o INSERT
+        cur.execute(sql.SQL("LOCK TABLE {} IN SHARE ROW EXCLUSIVE MODE").format(target))
+        # Mesmos tipos da tabela real: valores são arredondados como seriam no destino
+        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(stage))
+        cur.execute(sql.SQL(
+            "CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT llm_id, {cols} FROM {target} WITH NO DATA"
+        ).format(stage=stage, cols=sql.SQL(", ").join(cols), target=target))
+
+        with cur.copy(sql.SQL("COPY {} (llm_id, {}) FROM STDIN").format(stage, sql.SQL(", ").join(cols))) as copy:
+            for row in rows:
+                copy.write_row(row)
+
+        cur.execute(merge, {"data_source": data_source})
+        known, updated_ids, inserted_ids = cur.fetchone()
+        updated, inserted = len(updated_ids), len(inserted_ids)
+
+        # Scores pré-calculados dos modelos tocados (database/latest_benchmarks.sql)
+        if refresh_latest and (updated_ids or inserted_ids):
+            refreshed = refresh_latest_benchmarks(cur, updated_ids + inserted_ids, schema=target_schema)
+
+        cur.execute(sql.SQL(
+            "SELECT s.llm_id FROM {stage} s WHERE NOT EXISTS (SELECT 1 FROM {master} lm WHERE lm.id = s.llm_id) "
+            "ORDER BY s.llm_id"
+        ).format(stage=stage, master=master))
+        unknown_ids = [row[0] for row in cur.fetchall()]
+
+    stats = {
+        "staged": len(rows),
+        "updated": updated,
+        "inserted": inserted,
+        "unchanged": known - updated - inserted,
+        "refreshed": refreshed,
+        "unknown": len(unknown_ids),
+        "unknown_ids": unknown_ids,
+    }
+    logger.info(
+        f"🗃️ {table}: {stats['updated']} atualizados, {stats['inserted']} inseridos, "
+        f"{stats['unchanged']} sem mudança, {stats['unknown']} fora de {master_table}, "
+        f"{stats['refreshed']} recalculados em latest_benchmarks"
+    )
+    if unknown_ids:
+        logger.warning(f"⚠️ Modelos sem cadastro em {master_table}: {', '.join(unknown_ids[:10])}")
+    return stats
@@ -0,0 +1,80 @@
+"""
+Composite Rankings Store
+Calcula os rankings compostos de todos os presets de value.ranking_weights
+sobre value.latest_benchmarks e grava o ranking completo em
+value.composite_rankings (database/composite_rankings.sql), numa transação.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import logging
+
+import pandas as pd
+
+from calculators.composite import (
+    WEIGHT_COLUMNS,
+    component_matrix,
+    composite_rankings,
+    composite_scores,
+    criterion_name,
+    load_presets,
+    weight_matrix,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RANKINGS_TABLE = "value.composite_rankings"
+LATEST_TABLE = "value.latest_benchmarks"
+
+
+def latest_frame(conn, table: str = LATEST_TABLE) -> pd.DataFrame:
+    """id + colunas de benchmark/preço de latest_benchmarks (só modelos com linha)."""
+    columns = [column for column, _ in WEIGHT_COLUMNS.values()]
+    cursor = conn.execute(
+        f"SELECT llm_id, {', '.join(columns)} FROM {table} WHERE benchmark_id IS NOT NULL ORDER BY llm_id"
+    )
+    frame = pd.DataFrame(cursor.fetchall(), columns=["id", *columns])
+    for column in columns:
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("float64")
+    return frame
+
+
+def composite_rows(frame: pd.DataFrame, presets: Sequence[Dict]) -> List[tuple]:
+    """Linhas (preset_id, llm_id, rank, score, coverage) do ranking completo de cada preset."""
+    scores, coverage = composite_scores(component_matrix(frame), weight_matrix(presets))
+    rankings = composite_rankings(frame["id"].tolist(), scores, coverage, presets, k=None)
+    return [
+        (preset["id"], entry["model_id"], entry["rank"], entry["score"], entry["coverage"])
+        for preset in presets
+        for entry in rankings[criterion_name(preset)]
+    ]
+
+
+def refresh_composite_rankings(
+    conn,
+    presets: Optional[Sequence[Dict]] = None,
+    table: str = RANKINGS_TABLE,
+    source_table: str = LATEST_TABLE,
+) -> Dict:
+    """
+    Recalcula e grava os rankings de todos os presets (padrão: os de
+    value.ranking_weights). Retorna {"presets", "models", "rows"}; sem
+    as tabelas das migrações, só avisa.
+    """
+    for required in (table, source_table):
+        if conn.execute("SELECT to_regclass(%s)", (required,)).fetchone()[0] is None:
+            logger.warning(f"⚠️ {required} não existe: aplique database/latest_benchmarks.sql e composite_rankings.sql")
+            return {"presets": 0, "models": 0, "rows": 0}
+
+    presets = load_presets(conn) if presets is None else presets
+    with conn.transaction(), conn.cursor() as cur:
+        frame = latest_frame(cur, source_table)
+        rows = composite_rows(frame, presets)
+        cur.execute(f"DELETE FROM {table} WHERE preset_id = ANY(%s)", ([preset["id"] for preset in presets],))
+        with cur.copy(f"COPY {table} (preset_id, llm_id, rank, score, coverage) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+
+    stats = {"presets": len(presets), "models": len(frame), "rows": len(rows)}
+    logger.info(f"🏅 {table}: {stats['presets']} presets x {stats['models']} modelos ({stats['rows']} linhas)")
+    return stats
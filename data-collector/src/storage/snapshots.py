@@ -0,0 +1,292 @@
+"""
+Snapshot Store
+Histórico append-only do catálogo mesclado em Parquet, particionado por
+data de coleta (data/history/snapshots/date=YYYY-MM-DD/). Cada execução
+grava só as linhas que mudaram desde a anterior (mais uma linha
+"removed" para modelos que saíram do catálogo), então o estado em
+qualquer data é a última linha de cada modelo até ela.
+
+Consultas: rankings numa data, histórico de preço de um modelo e
+variações de preço acima de N% entre execuções.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from calculators.rankings import DEFAULT_TOP_K, RankingIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_DIR = "data/history"
+SNAPSHOT_DIR = "snapshots"
+RUNS_FILE = "runs.json"
+
+# Coluna -> caminho no modelo mesclado (build_merged_models)
+SNAPSHOT_COLUMNS = {
+    "name": "name",
+    "provider": "provider",
+    "context_length": "context_length",
+    "price_prompt": "pricing.prompt",
+    "price_completion": "pricing.completion",
+    "arena_elo": "benchmarks.arena_elo",
+    "swe_bench_full": "benchmarks.swe_bench_full",
+    "intelligence_score": "benchmarks.intelligence_score",
+    "output_speed_tps": "performance.output_speed_tps",
+    "latency_ttft": "performance.latency_ttft",
+    "cost_benefit_coding": "cost_benefit_scores.coding",
+    "cost_benefit_general": "cost_benefit_scores.general",
+}
+TEXT_COLUMNS = {"name", "provider"}
+INTEGER_COLUMNS = {"context_length"}  # gravadas como float64 (aceitam null)
+
+# Schema fixo: partições só com marcadores de remoção não podem mudar os tipos
+SNAPSHOT_SCHEMA = pa.schema(
+    [("model_id", pa.string())]
+    + [
+        (column, pa.string() if column in TEXT_COLUMNS else pa.float64())
+        for column in SNAPSHOT_COLUMNS
+    ]
+    + [("row_hash", pa.string()), ("removed", pa.bool_()), ("valid_from", pa.timestamp("ms"))]
+)
+
+
+def _get_path(model: Dict, path: str) -> Any:
+    value: Any = model
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _to_timestamp(value) -> pd.Timestamp:
+    """Timestamp UTC sem timezone (formato gravado no Parquet)."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts
+
+
+def _as_of_bound(value) -> pd.Timestamp:
+    """Limite exclusivo de "até a data D": uma data sem hora inclui o dia inteiro."""
+    if isinstance(value, str) and len(value) == 10:
+        return _to_timestamp(value) + pd.Timedelta(days=1)
+    return _to_timestamp(value).floor("ms") + pd.Timedelta(milliseconds=1)  # valid_from é gravado em ms
+
+
+def _row_hash(row: Dict) -> str:
+    canonical = json.dumps([row[c] for c in SNAPSHOT_COLUMNS], ensure_ascii=False, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def flatten_models(models: List[Dict]) -> pd.DataFrame:
+    """Modelos mesclados -> uma linha por modelo com as colunas do snapshot."""
+    rows = []
+    for model in models:
+        row = {"model_id": model.get("id", "")}
+        for column, path in SNAPSHOT_COLUMNS.items():
+            value = _get_path(model, path)
+            if column not in TEXT_COLUMNS and value is not None:
+                value = float(value)
+            row[column] = value
+        row["row_hash"] = _row_hash(row)
+        rows.append(row)
+    return pd.DataFrame(rows, columns=["model_id", *SNAPSHOT_COLUMNS, "row_hash"])
+
+
+def unflatten_rows(frame: pd.DataFrame) -> List[Dict]:
+    """Linhas do snapshot -> modelos no formato mesclado (para RankingIndex)."""
+    paths = [(column, path.split(".")) for column, path in SNAPSHOT_COLUMNS.items()]
+    models = []
+    for row in frame.to_dict("records"):
+        model: Dict[str, Any] = {"id": row["model_id"]}
+        for column, parts in paths:
+            value = row[column]
+            target = model
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            if value is None or value != value:  # NaN -> None
+                value = None
+            elif column in INTEGER_COLUMNS:
+                value = int(value)
+            target[parts[-1]] = value
+        models.append(model)
+    return models
+
+
+class SnapshotStore:
+    """
+    Histórico de snapshots em <root>/snapshots (Parquet particionado por
+    data) e o log de execuções em <root>/runs.json.
+
+    O histórico inteiro é lido uma vez e mantido em memória; as
+    consultas são operações pandas sobre ele (milissegundos).
+    """
+
+    def __init__(self, root: str = DEFAULT_HISTORY_DIR):
+        self.root = root
+        self.snapshot_dir = os.path.join(root, SNAPSHOT_DIR)
+        self._frame: Optional[pd.DataFrame] = None
+        self._rankings: Dict[tuple, Dict[str, List[Dict]]] = {}
+
+    # --- Escrita ---
+
+    def runs(self) -> List[Dict]:
+        try:
+            with open(os.path.join(self.root, RUNS_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def append(self, models: List[Dict], collected_at: Optional[str] = None) -> Dict:
+        """
+        Grava um snapshot do catálogo mesclado.
+
+        Só entram linhas novas ou alteradas e marcadores de remoção;
+        execuções precisam vir em ordem cronológica. Retorna o registro
+        da execução em runs.json.
+        """
+        collected_at = _to_timestamp(collected_at or datetime.utcnow())
+        runs = self.runs()
+        if runs and collected_at <= _to_timestamp(runs[-1]["collected_at"]):
+            raise ValueError(f"Snapshot de {collected_at} não é posterior à última execução ({runs[-1]['collected_at']})")
+
+        current = flatten_models(models).drop_duplicates("model_id", keep="last")
+        latest = self.as_of(None, include_removed=True)
+        previous_hash = dict(zip(latest["model_id"], latest["row_hash"].where(~latest["removed"])))
+
+        changed = current[[previous_hash.get(i) != h for i, h in zip(current["model_id"], current["row_hash"])]]
+        changed = changed.assign(removed=False)
+        gone = latest[~latest["removed"] & ~latest["model_id"].isin(current["model_id"])]
+        tombstones = pd.DataFrame({"model_id": gone["model_id"], "removed": True})
+
+        parts = [frame for frame in (changed, tombstones) if not frame.empty]
+        run = {
+            "collected_at": collected_at.isoformat() + "Z",
+            "models": len(current),
+            "changed": len(changed),
+            "removed": len(tombstones),
+        }
+        if parts:
+            rows = pd.concat(parts, ignore_index=True).assign(valid_from=collected_at)
+            self._write_partition(rows, collected_at)
+
+        runs.append(run)
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, RUNS_FILE), "w", encoding="utf-8") as f:
+            json.dump(runs, f, indent=2)
+
+        self._frame = None
+        self._rankings = {}
+        logger.info(
+            f"🗄️ Snapshot {run['collected_at']}: {run['changed']} alterados, "
+            f"{run['removed']} removidos de {run['models']} modelos"
+        )
+        return run
+
+    def _write_partition(self, rows: pd.DataFrame, collected_at: pd.Timestamp):
+        partition = os.path.join(self.snapshot_dir, f"date={collected_at:%Y-%m-%d}")
+        os.makedirs(partition, exist_ok=True)
+        rows = rows.reindex(columns=SNAPSHOT_SCHEMA.names)
+        table = pa.Table.from_pandas(rows, schema=SNAPSHOT_SCHEMA, preserve_index=False)
+        pq.write_table(table, os.path.join(partition, f"part-{collected_at:%H%M%S}.parquet"))
+
+    # --- Leitura ---
+
+    def frame(self) -> pd.DataFrame:
+        """Todas as linhas do histórico, ordenadas por valid_from (cacheado)."""
+        if self._frame is None:
+            if os.path.isdir(self.snapshot_dir) and os.listdir(self.snapshot_dir):
+                frame = pd.read_parquet(self.snapshot_dir, schema=SNAPSHOT_SCHEMA)
+                self._frame = frame.sort_values(["valid_from", "model_id"], kind="stable", ignore_index=True)
+            else:
+                self._frame = SNAPSHOT_SCHEMA.empty_table().to_pandas()
+        return self._frame
+
+    def _cut(self, date) -> int:
+        """Quantas linhas (ordenadas por valid_from) valem até a data."""
+        frame = self.frame()
+        if date is None:
+            return len(frame)
+        return int(frame["valid_from"].searchsorted(_as_of_bound(date), side="left"))
+
+    def _state(self, cut: int) -> pd.DataFrame:
+        # Ordem por model_id: é ela que desempata os rankings reconstruídos
+        state = self.frame().iloc[:cut].drop_duplicates("model_id", keep="last")
+        return state.sort_values("model_id", kind="stable")
+
+    def as_of(self, date=None, include_removed: bool = False) -> pd.DataFrame:
+        """
+        Estado do catálogo numa data (última linha de cada modelo até ela),
+        ordenado por model_id. date=None é o estado mais recente;
+        "YYYY-MM-DD" inclui o dia inteiro.
+        """
+        state = self._state(self._cut(date))
+        if not include_removed:
+            state = state[~state["removed"]]
+        return state.reset_index(drop=True)
+
+    def models_as_of(self, date=None) -> List[Dict]:
+        return unflatten_rows(self.as_of(date))
+
+    def rankings_as_of(self, date=None, k: int = DEFAULT_TOP_K, criteria=None) -> Dict[str, List[Dict]]:
+        """
+        Rankings (mesmo formato de calculate_rankings) como estavam na data;
+        empates são desempatados por model_id. O estado só muda a cada execução: datas entre duas execuções
+        reaproveitam o mesmo cálculo.
+        """
+        cut = self._cut(date)
+        key = (cut, k, tuple(criteria) if criteria is not None else None)
+        if key not in self._rankings:
+            state = self._state(cut)
+            self._rankings[key] = RankingIndex(unflatten_rows(state[~state["removed"]]), criteria).rankings(k)
+        return self._rankings[key]
+
+    def price_history(self, model_id: str) -> pd.DataFrame:
+        """Preços de um modelo a cada mudança (valid_from, prompt, completion, removed)."""
+        rows = self.frame()
+        rows = rows[rows["model_id"] == model_id][["valid_from", "price_prompt", "price_completion", "removed"]]
+        # Linhas que mudaram só benchmarks não interessam aqui
+        keys = list(zip(rows["price_prompt"].fillna(-1), rows["price_completion"].fillna(-1), rows["removed"]))
+        changed = [pos == 0 or key != keys[pos - 1] for pos, key in enumerate(keys)]
+        return rows[changed].reset_index(drop=True)
+
+    def price_changes(
+        self,
+        threshold_pct: float,
+        column: str = "price_prompt",
+        start=None,
+        end=None,
+    ) -> pd.DataFrame:
+        """
+        Modelos cujo preço (prompt por padrão) variou mais de threshold_pct
+        entre uma execução e a anterior, opcionalmente dentro de [start, end].
+        Saída: model_id, valid_from, old, new, change_pct.
+        """
+        rows = self.frame()
+        rows = rows[~rows["removed"]][["model_id", "valid_from", column]]
+        old = rows.groupby("model_id", sort=False)[column].shift()
+        changes = rows.assign(old=old, new=rows[column]).dropna(subset=["old", "new"])
+        changes = changes[changes["old"] != changes["new"]]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = (changes["new"] - changes["old"]) / changes["old"].abs() * 100
+        # Preço que sai de zero conta como variação infinita
+        changes = changes.assign(change_pct=pct.where(changes["old"] != 0, np.inf))
+        changes = changes[changes["change_pct"].abs() > threshold_pct]
+
+        if start is not None:
+            changes = changes[changes["valid_from"] >= _to_timestamp(start)]
+        if end is not None:
+            changes = changes[changes["valid_from"] < _as_of_bound(end)]
+        return changes[["model_id", "valid_from", "old", "new", "change_pct"]].reset_index(drop=True)
@@ -104,7 +104,15 @@ CREATE VIEW value.v_rank_unlimited AS
 SELECT *, ROW_NUMBER() OVER (ORDER BY context_window DESC, avg_price_per_1m ASC) as rank
 FROM value.v_models_basic;
 
--- 5. VERIFICAR RESULTADO
+-- 5. RECALCULAR value.latest_benchmarks (esvaziada pelo DELETE do passo 1)
+DO $$
+BEGIN
+    IF to_regprocedure('value.refresh_latest_benchmarks(character varying[])') IS NOT NULL THEN
+        PERFORM value.refresh_latest_benchmarks();
+    END IF;
+END $$;
+
+-- 6. VERIFICAR RESULTADO
 SELECT '✅ INSERTED:' as status, COUNT(*) as count FROM value.llm_master_list
 UNION ALL
 SELECT '✅ PRICES:' as status, COUNT(*) as count FROM value.benchmarks;
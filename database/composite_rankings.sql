@@ -0,0 +1,24 @@
+-- Composite Rankings: ranking completo de cada preset de
+-- value.ranking_weights sobre value.latest_benchmarks, calculado pelo
+-- pipeline Python (calculators/composite.py + storage/composite_rankings.py).
+-- /api/models lê daqui em vez de recalcular compostos: ?preset=<nome>
+-- (nome único em ranking_weights) e as categorias best-performance (preset
+-- is_default) e intermediate (preset 'balanced').
+--
+-- Requer database/latest_benchmarks.sql. Recalculado a cada carga de
+-- benchmarks do Python; o cron de benchmarks (TypeScript) não recalcula,
+-- então depois dele os compostos ficam da última carga Python.
+--
+-- Execute no Neon: psql $DATABASE_URL -f database/composite_rankings.sql
+
+CREATE TABLE IF NOT EXISTS value.composite_rankings (
+    preset_id INTEGER REFERENCES value.ranking_weights(id) ON DELETE CASCADE,
+    llm_id VARCHAR(100) REFERENCES value.llm_master_list(id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    score NUMERIC NOT NULL,        -- 0-100, média ponderada dos componentes disponíveis
+    coverage NUMERIC NOT NULL,     -- fração do peso do preset com dado (0-1)
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (preset_id, llm_id)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_composite_rank ON value.composite_rankings(preset_id, rank);
@@ -0,0 +1,219 @@
+-- Latest Benchmarks: última linha de value.benchmarks por modelo com os
+-- scores já calculados. Substitui o LEFT JOIN LATERAL (... ORDER BY
+-- collected_at DESC LIMIT 1) por modelo das views e o cálculo feito a
+-- cada request em /api/models: leituras viram index scans. Os rankings
+-- compostos das categorias ficam em value.composite_rankings.
+--
+-- Mantida por value.refresh_latest_benchmarks(ids): triggers por comando
+-- em value.benchmarks e value.llm_master_list recalculam os modelos
+-- tocados (scripts/populate-db.ts, SQL manual), e o loader Python
+-- (storage/benchmarks_loader.py) e o cron de benchmarks também a chamam.
+-- Para recalcular tudo: SELECT value.refresh_latest_benchmarks();
+--
+-- Execute no Neon: psql $DATABASE_URL -f database/latest_benchmarks.sql
+
+CREATE TABLE IF NOT EXISTS value.latest_benchmarks (
+    llm_id VARCHAR(100) PRIMARY KEY REFERENCES value.llm_master_list(id) ON DELETE CASCADE,
+    name VARCHAR(200) NOT NULL,
+    provider VARCHAR(100) NOT NULL,
+    context_window INTEGER,
+    supports_coding BOOLEAN,
+    supports_agents BOOLEAN,
+
+    -- Linha de origem em value.benchmarks (NULL = modelo sem benchmarks)
+    benchmark_id INTEGER,
+    collected_at TIMESTAMP,
+
+    price_input NUMERIC,
+    price_output NUMERIC,
+    plan_price_monthly NUMERIC,
+    plan_price_annual NUMERIC,
+    plan_tokens_included INTEGER,
+    plan_requests_per_day INTEGER,
+    artificial_analysis_intelligence_score NUMERIC,
+    swe_bench_verified NUMERIC,
+    agentic_score NUMERIC,
+    bfcl_score NUMERIC,
+    niah_score NUMERIC,
+    humanity_last_exam_score NUMERIC,
+    aider_polyglot_score NUMERIC,
+    leaderboard_ai_score NUMERIC,
+
+    -- Scores de v_performance_score / v_value_score (pesos 'performance')
+    performance_score NUMERIC NOT NULL,
+    value_score NUMERIC,           -- NULL com um só preço, como nas views antigas
+
+    -- Categoria cost-savings de /api/models
+    monthly_cost NUMERIC,          -- input * 1.0 + output * 0.5
+
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Bancos migrados antes: value_score era NOT NULL e um preço NULL abortava a carga
+ALTER TABLE value.latest_benchmarks ALTER COLUMN value_score DROP NOT NULL;
+
+-- Bancos migrados antes: o composto fixo de /api/models deu lugar aos
+-- presets de value.composite_rankings (database/composite_rankings.sql)
+DROP INDEX IF EXISTS value.idx_latest_composite;
+DROP INDEX IF EXISTS value.idx_latest_intermediate;
+ALTER TABLE value.latest_benchmarks
+    DROP COLUMN IF EXISTS composite_score,
+    DROP COLUMN IF EXISTS price_score,
+    DROP COLUMN IF EXISTS intermediate_score;
+
+-- Bancos migrados antes: colunas de plano lidas por calculators/breakeven.py
+ALTER TABLE value.latest_benchmarks
+    ADD COLUMN IF NOT EXISTS plan_price_annual NUMERIC,
+    ADD COLUMN IF NOT EXISTS plan_requests_per_day INTEGER;
+
+CREATE INDEX IF NOT EXISTS idx_latest_performance ON value.latest_benchmarks(performance_score DESC);
+CREATE INDEX IF NOT EXISTS idx_latest_value ON value.latest_benchmarks(value_score DESC);
+CREATE INDEX IF NOT EXISTS idx_latest_monthly_cost ON value.latest_benchmarks(monthly_cost);
+
+-- A busca da última linha por modelo usa este índice
+CREATE INDEX IF NOT EXISTS idx_benchmarks_llm_collected ON value.benchmarks(llm_id, collected_at DESC, id DESC);
+
+-- Recalcula os modelos em ids (NULL = todos). Retorna as linhas gravadas.
+CREATE OR REPLACE FUNCTION value.refresh_latest_benchmarks(ids VARCHAR[] DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    refreshed INTEGER;
+BEGIN
+    DELETE FROM value.latest_benchmarks WHERE ids IS NULL OR llm_id = ANY(ids);
+
+    INSERT INTO value.latest_benchmarks (
+        llm_id, name, provider, context_window, supports_coding, supports_agents,
+        benchmark_id, collected_at, price_input, price_output,
+        plan_price_monthly, plan_price_annual, plan_tokens_included, plan_requests_per_day,
+        artificial_analysis_intelligence_score, swe_bench_verified, agentic_score, bfcl_score,
+        niah_score, humanity_last_exam_score, aider_polyglot_score, leaderboard_ai_score,
+        performance_score, value_score, monthly_cost
+    )
+    SELECT
+        lm.id, lm.name, lm.provider, lm.context_window, lm.supports_coding, lm.supports_agents,
+        b.id, b.collected_at, b.price_input, b.price_output,
+        b.plan_price_monthly, b.plan_price_annual, b.plan_tokens_included, b.plan_requests_per_day,
+        b.artificial_analysis_intelligence_score, b.swe_bench_verified, b.agentic_score, b.bfcl_score,
+        b.niah_score, b.humanity_last_exam_score, b.aider_polyglot_score, b.leaderboard_ai_score,
+        p.performance_score,
+        CASE
+            WHEN (COALESCE(b.price_input, 0) + COALESCE(b.price_output, 0) * 0.5) > 0
+            THEN p.performance_score / (b.price_input + b.price_output * 0.5)
+            ELSE 0
+        END,
+        p.monthly_cost
+    FROM value.llm_master_list lm
+    LEFT JOIN LATERAL (
+        SELECT * FROM value.benchmarks b2
+        WHERE b2.llm_id = lm.id
+        ORDER BY b2.collected_at DESC, b2.id DESC
+        LIMIT 1
+    ) b ON true
+    CROSS JOIN LATERAL (
+        SELECT
+            COALESCE(b.artificial_analysis_intelligence_score * 0.15, 0) +
+            COALESCE(b.swe_bench_verified * 0.20, 0) +
+            COALESCE(b.agentic_score * 0.20, 0) +
+            COALESCE(b.bfcl_score * 0.10, 0) +
+            COALESCE(b.niah_score * 0.05, 0) +
+            COALESCE(b.humanity_last_exam_score * 0.10, 0) +
+            COALESCE(b.aider_polyglot_score * 0.15, 0) +
+            COALESCE(b.leaderboard_ai_score * 0.05, 0) AS performance_score,
+            b.price_input * 1.0 + b.price_output * 0.5 AS monthly_cost
+    ) p
+    WHERE lm.is_active = TRUE
+      AND (ids IS NULL OR lm.id = ANY(ids));
+
+    GET DIAGNOSTICS refreshed = ROW_COUNT;
+    RETURN refreshed;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Triggers por comando (não por linha): os ids vêm da tabela de transição
+-- changed_rows, então um INSERT de N linhas recalcula uma vez. Só grava em
+-- latest_benchmarks, que não tem triggers: sem recursão. TRUNCATE não tem
+-- tabela de transição e recalcula tudo; DELETE em llm_master_list já
+-- remove a linha pelo ON DELETE CASCADE.
+CREATE OR REPLACE FUNCTION value.sync_latest_benchmarks()
+RETURNS TRIGGER AS $$
+DECLARE
+    ids VARCHAR[];
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM value.refresh_latest_benchmarks();
+    ELSE
+        -- TG_ARGV[0]: coluna com o id do modelo (llm_id ou id)
+        EXECUTE format('SELECT array_agg(DISTINCT %I) FROM changed_rows', TG_ARGV[0]) INTO ids;
+        IF ids IS NOT NULL THEN
+            PERFORM value.refresh_latest_benchmarks(ids);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS latest_benchmarks_insert ON value.benchmarks;
+DROP TRIGGER IF EXISTS latest_benchmarks_update ON value.benchmarks;
+DROP TRIGGER IF EXISTS latest_benchmarks_delete ON value.benchmarks;
+DROP TRIGGER IF EXISTS latest_benchmarks_truncate ON value.benchmarks;
+DROP TRIGGER IF EXISTS latest_benchmarks_insert ON value.llm_master_list;
+DROP TRIGGER IF EXISTS latest_benchmarks_update ON value.llm_master_list;
+
+CREATE TRIGGER latest_benchmarks_insert AFTER INSERT ON value.benchmarks
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION value.sync_latest_benchmarks('llm_id');
+CREATE TRIGGER latest_benchmarks_update AFTER UPDATE ON value.benchmarks
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION value.sync_latest_benchmarks('llm_id');
+CREATE TRIGGER latest_benchmarks_delete AFTER DELETE ON value.benchmarks
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION value.sync_latest_benchmarks('llm_id');
+CREATE TRIGGER latest_benchmarks_truncate AFTER TRUNCATE ON value.benchmarks
+    FOR EACH STATEMENT EXECUTE FUNCTION value.sync_latest_benchmarks();
+CREATE TRIGGER latest_benchmarks_insert AFTER INSERT ON value.llm_master_list
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION value.sync_latest_benchmarks('id');
+CREATE TRIGGER latest_benchmarks_update AFTER UPDATE ON value.llm_master_list
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION value.sync_latest_benchmarks('id');
+
+-- Views antigas lendo da tabela (mesmas colunas; ranks por index scan)
+DROP VIEW IF EXISTS value.v_value_score;
+DROP VIEW IF EXISTS value.v_performance_score;
+
+CREATE VIEW value.v_performance_score AS
+SELECT
+    llm_id AS id,
+    name,
+    provider,
+    artificial_analysis_intelligence_score,
+    swe_bench_verified,
+    agentic_score,
+    bfcl_score,
+    niah_score,
+    humanity_last_exam_score,
+    aider_polyglot_score,
+    leaderboard_ai_score,
+    performance_score,
+    ROW_NUMBER() OVER (ORDER BY performance_score DESC) AS performance_rank
+FROM value.latest_benchmarks
+WHERE supports_coding = TRUE
+  AND supports_agents = TRUE;
+
+CREATE VIEW value.v_value_score AS
+SELECT
+    llm_id AS id,
+    name,
+    provider,
+    price_input,
+    price_output,
+    plan_price_monthly,
+    plan_tokens_included,
+    performance_score,
+    value_score,
+    ROW_NUMBER() OVER (ORDER BY value_score DESC) AS value_rank
+FROM value.latest_benchmarks
+WHERE supports_coding = TRUE
+  AND supports_agents = TRUE;
+
+SELECT value.refresh_latest_benchmarks() AS latest_benchmarks_rows;
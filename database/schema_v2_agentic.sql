@@ -113,7 +113,7 @@ CREATE TABLE IF NOT EXISTS value.benchmarks (
 -- Tabela de configuração de pesos para rankings
 CREATE TABLE IF NOT EXISTS value.ranking_weights (
     id SERIAL PRIMARY KEY,
-    name VARCHAR(100) NOT NULL, -- ex: 'performance', 'value', 'balanced'
+    name VARCHAR(100) NOT NULL UNIQUE, -- ex: 'performance', 'value', 'balanced'
     description TEXT,
     is_default BOOLEAN DEFAULT FALSE,
     
@@ -310,6 +310,13 @@ WHERE b.plan_price_monthly IS NOT NULL
   AND b.plan_price_monthly > 0
 ORDER BY plan_value_score DESC;
 
+-- Bancos criados antes do UNIQUE(name): remove presets repetidos por
+-- execuções anteriores deste seed (fica o de menor id) e cria o índice
+DELETE FROM value.ranking_weights rw
+USING value.ranking_weights keep
+WHERE keep.name = rw.name AND keep.id < rw.id;
+CREATE UNIQUE INDEX IF NOT EXISTS ranking_weights_name_key ON value.ranking_weights(name);
+
 -- Inserir pesos padrão
 INSERT INTO value.ranking_weights (
     name, description, is_default,
@@ -321,7 +328,7 @@ INSERT INTO value.ranking_weights (
 ('value', 'Best price/performance ratio', FALSE, 10, 15, 15, 8, 3, 7, 10, 3, 25, 25, 25, 25),
 ('balanced', 'Balanced performance and price', FALSE, 12, 18, 18, 9, 4, 8, 12, 4, 12, 12, 12, 12),
 ('agentic', 'Optimized for agentic coding', FALSE, 10, 10, 40, 25, 3, 5, 20, 3, 0, 0, 0, 0)
-ON CONFLICT DO NOTHING;
+ON CONFLICT (name) DO NOTHING;
 
 -- Função para alertar novo LLM
 CREATE OR REPLACE FUNCTION value.alert_new_llm()
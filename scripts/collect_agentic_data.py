@@ -8,11 +8,14 @@ Sources: Artificial Analysis, SWE-bench, BFCL, OpenRouter, etc.
 import json
 import os
 import sys
-import urllib.request
-import urllib.error
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "data-collector" / "src"))
+
+from collectors.openrouter import fetch_openrouter_models
+
 # Config
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
 PERPLEXITY_MODEL = "perplexity/sonar-deep-research"
@@ -89,21 +92,8 @@ AGENTIC_LLM_MASTER_LIST = [
 ]
 
 def fetch_openrouter_data():
-    """Busca preços e popularity do OpenRouter"""
-    try:
-        req = urllib.request.Request(
-            "https://openrouter.ai/api/v1/models",
-            headers={
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "HTTP-Referer": "https://value.ai-foil.com"
-            }
-        )
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return {m['id']: m for m in data.get('data', [])}
-    except Exception as e:
-        print(f"❌ OpenRouter error: {e}")
-        return {}
+    """Busca preços e popularity do OpenRouter (via cache HTTP compartilhado)"""
+    return {m['id']: m for m in fetch_openrouter_models()}
 
 def find_model_data(openrouter_models, search_ids):
     """Busca modelo nos dados do OpenRouter"""
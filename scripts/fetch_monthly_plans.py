@@ -6,15 +6,21 @@ Usa Perplexity via OpenRouter para encontrar preços atualizados
 
 import json
 import os
-import urllib.request
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "data-collector" / "src"))
+
+from collectors.completion_cache import CompletionCache
+from collectors.openrouter import completion_content
 
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
-OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 MODEL = "perplexity/sonar-deep-research"
+PARTIAL_FILE = "data/processed/monthly_plans_research.partial.md"
 
-def search_monthly_plans():
-    """Busca monthly plans via Perplexity"""
+def search_monthly_plans(refresh=False):
+    """Busca monthly plans via Perplexity (respostas em cache por 24h)"""
     if not OPENROUTER_API_KEY:
         print("❌ OPENROUTER_API_KEY não configurada")
         return None
@@ -43,34 +49,38 @@ Be specific with current 2026 pricing."""
                 {"role": "user", "content": query}
             ],
             "max_tokens": 2000,
-            "temperature": 0.1
+            "temperature": 0.1,
+            "usage": {"include": True}
         }
         
-        req = urllib.request.Request(
-            OPENROUTER_API_URL,
-            data=json.dumps(payload).encode('utf-8'),
-            headers={
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://value.ai-foil.com",
-                "X-Title": "Monthly Plans Research"
-            },
-            method='POST'
+        data = CompletionCache().chat_completion(
+            payload,
+            title="Monthly Plans Research",
+            refresh=refresh,
+            stream_path=PARTIAL_FILE,
+            api_key=OPENROUTER_API_KEY
         )
-        
-        with urllib.request.urlopen(req, timeout=120) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-            return content
+        stream = data.get("stream", {})
+        if stream.get("complete") is False:
+            print(f"⚠️ Resposta parcial: {stream.get('error')} (salva em {PARTIAL_FILE})")
+        if stream.get("ttft_ms") is not None:
+            print(f"📡 TTFT {stream['ttft_ms']} ms, {stream['tokens_per_sec']} tokens/s")
+        return completion_content(data) or None
             
     except Exception as e:
         print(f"❌ Erro: {e}")
         return None
 
 def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Busca monthly plans via Perplexity")
+    parser.add_argument("--refresh", action="store_true", help="Ignora a resposta em cache")
+    args = parser.parse_args()
+    
     print("🔍 Buscando monthly plans...\n")
     
-    result = search_monthly_plans()
+    result = search_monthly_plans(refresh=args.refresh)
     
     if result:
         print("✅ Resultado encontrado:\n")
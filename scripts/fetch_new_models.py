@@ -7,12 +7,14 @@ Uses OpenRouter API for pricing data
 import json
 import os
 import sys
-import urllib.request
-import urllib.error
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "data-collector" / "src"))
+
+from collectors import openrouter
 
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
-OPENROUTER_API_URL = "https://openrouter.ai/api/v1/models"
 
 def fetch_openrouter_models():
     """Busca modelos e preços da OpenRouter"""
@@ -20,23 +22,8 @@ def fetch_openrouter_models():
         print("❌ OPENROUTER_API_KEY não configurada")
         return []
     
-    try:
-        req = urllib.request.Request(
-            OPENROUTER_API_URL,
-            headers={
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "HTTP-Referer": "https://value.ai-foil.com",
-                "X-Title": "Value LLM Database"
-            }
-        )
-        
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return data.get("data", [])
-            
-    except Exception as e:
-        print(f"❌ Erro OpenRouter: {e}")
-        return []
+    # Cache HTTP compartilhado com o data-collector (ETag + TTL)
+    return openrouter.fetch_openrouter_models()
 
 def find_model_pricing(models, search_terms):
     """Busca preço de modelo por termos"""
@@ -67,6 +67,19 @@ async function main() {
     }
     console.log('✅ Prices inserted\n');
     
+    // Scores pré-calculados (database/latest_benchmarks.sql): os DELETEs acima
+    // esvaziam value.latest_benchmarks em cascata. Os triggers da migração já
+    // recalculam; isto cobre bancos migrados antes deles.
+    const latest = await client.query(
+      `SELECT to_regprocedure('value.refresh_latest_benchmarks(character varying[])') IS NOT NULL AS ok`
+    );
+    if (latest.rows[0].ok) {
+      const refreshed = await client.query('SELECT value.refresh_latest_benchmarks() AS count');
+      console.log(`📈 latest_benchmarks: ${refreshed.rows[0].count} rows\n`);
+    } else {
+      console.log('⚠️ value.latest_benchmarks missing: apply database/latest_benchmarks.sql\n');
+    }
+    
     // Verify
     const count = await client.query(`
       SELECT COUNT(*) as count 
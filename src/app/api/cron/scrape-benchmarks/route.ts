@@ -42,6 +42,7 @@ export async function GET(request: Request) {
 async function updateBenchmarksInDB(results: any[]) {
   let updated = 0;
   let errors = 0;
+  const touched: string[] = [];
   
   for (const result of results) {
     try {
@@ -77,6 +78,7 @@ async function updateBenchmarksInDB(results: any[]) {
           values
         );
         updated++;
+        touched.push(result.model_id);
       }
     } catch (e) {
       console.error(`[Cron] Failed to update ${result.model_id}:`, e);
@@ -84,5 +86,15 @@ async function updateBenchmarksInDB(results: any[]) {
     }
   }
   
+  // Recalcula os scores pré-calculados (database/latest_benchmarks.sql)
+  if (touched.length > 0) {
+    try {
+      await query('SELECT value.refresh_latest_benchmarks($1::varchar[])', [touched]);
+    } catch (e) {
+      console.error('[Cron] Failed to refresh latest_benchmarks:', e);
+      errors++;
+    }
+  }
+  
   return { updated, errors };
 }
@@ -1,5 +1,6 @@
 import { NextResponse } from 'next/server';
 import { query } from '@/lib/db';
+import { Performance } from '@/lib/scoring';
 
 export const dynamic = 'force-dynamic';
 
@@ -8,30 +9,67 @@ export async function GET(request: Request) {
     const { searchParams } = new URL(request.url);
     const category = searchParams.get('category') || 'intermediate';
     
-    // Query with ALL benchmark columns
-    const sql = `
-      SELECT 
-        lm.id,
-        lm.name,
-        lm.provider,
-        lm.context_window,
-        b.price_input,
-        b.price_output,
-        b.price_input * 1.0 + b.price_output * 0.5 as monthly_cost,
-        b.swe_bench_verified,
-        b.agentic_score,
-        b.artificial_analysis_intelligence_score as intelligence_score,
-        b.bfcl_score,
-        b.leaderboard_ai_score as arena_elo,
-        b.aider_polyglot_score
-      FROM value.llm_master_list lm
-      INNER JOIN value.benchmarks b ON b.llm_id = lm.id
-      WHERE b.price_input IS NOT NULL 
-        AND b.price_output IS NOT NULL
-        AND lm.is_active = TRUE
+    // Preset de value.ranking_weights: ranking composto gravado pelo pipeline Python
+    // (value.composite_rankings). Sem ?preset=, best-performance usa o preset
+    // is_default e intermediate o 'balanced' (mesmo mapa de SITE_CATEGORY_PRESETS
+    // em data-collector/src/calculators/composite.py); cost-savings é só o custo.
+    const preset = searchParams.get('preset');
+    let presetRow: { id: number; name: string } | null = null;
+    if (preset) {
+      // name é UNIQUE: um único id. Nome desconhecido é erro do cliente, não falta de dados
+      const known = await query('SELECT id, name FROM value.ranking_weights WHERE name = $1', [preset]);
+      if (!known.rows || known.rows.length === 0) {
+        return NextResponse.json({
+          error: `Unknown preset: ${preset}`,
+          models: [],
+          total: 0
+        }, { status: 404 });
+      }
+      presetRow = known.rows[0];
+    } else if (category !== 'cost-savings') {
+      const sitePreset = category === 'best-performance' ? null : 'balanced';
+      const fallback = await query(`
+        SELECT id, name FROM value.ranking_weights
+        ORDER BY COALESCE(name = $1, FALSE) DESC, is_default DESC, id
+        LIMIT 1
+      `, [sitePreset]);
+      presetRow = fallback.rows?.[0] ?? null;
+    }
+
+    const columns = `
+        lb.llm_id as id,
+        lb.name,
+        lb.provider,
+        lb.context_window,
+        lb.price_input,
+        lb.price_output,
+        lb.monthly_cost,
+        lb.swe_bench_verified,
+        lb.agentic_score,
+        lb.artificial_analysis_intelligence_score as intelligence_score,
+        lb.bfcl_score,
+        lb.leaderboard_ai_score as arena_elo,
+        lb.aider_polyglot_score`;
+    const sql = presetRow ? `
+      SELECT ${columns},
+        cr.score as preset_score,
+        cr.coverage as preset_coverage
+      FROM value.composite_rankings cr
+      JOIN value.latest_benchmarks lb ON lb.llm_id = cr.llm_id
+      WHERE cr.preset_id = $1
+        AND lb.price_input IS NOT NULL 
+        AND lb.price_output IS NOT NULL
+      ORDER BY cr.rank
+    ` : `
+      SELECT ${columns}
+      FROM value.latest_benchmarks lb
+      WHERE lb.price_input IS NOT NULL 
+        AND lb.price_output IS NOT NULL
+        AND lb.monthly_cost >= 0
+      ORDER BY lb.monthly_cost ASC, lb.llm_id
     `;
     
-    const result = await query(sql);
+    const result = await query(sql, presetRow ? [presetRow.id] : undefined);
     
     if (!result.rows || result.rows.length === 0) {
       return NextResponse.json({ 
@@ -41,38 +79,17 @@ export async function GET(request: Request) {
       }, { status: 500 });
     }
     
-    // Transform data
+    // Transform data (já ordenado pelo preset ou pelo custo)
     let models = result.rows.map((row: any) => {
       const monthlyCost = parseFloat(row.monthly_cost);
-      const sweBench = row.swe_bench_verified ? parseFloat(row.swe_bench_verified) : null;
-      const intelligence = row.intelligence_score ? parseFloat(row.intelligence_score) : null;
-      const arenaElo = row.arena_elo ? parseFloat(row.arena_elo) : null;
-      const agentic = row.agentic_score ? parseFloat(row.agentic_score) : null;
-      const bfcl = row.bfcl_score ? parseFloat(row.bfcl_score) : null;
-      const aider = row.aider_polyglot_score ? parseFloat(row.aider_polyglot_score) : null;
-      
-      // Calculate composite performance score (0-100)
-      // Weights: SWE-bench 40%, Intelligence 25%, Arena 15%, Agentic 10%, BFCL 5%, Aider 5%
-      let performanceScore = 0;
-      let performanceCount = 0;
-      
-      if (sweBench) { performanceScore += sweBench * 0.40; performanceCount++; }
-      if (intelligence) { performanceScore += intelligence * 0.25; performanceCount++; }
-      if (arenaElo) { performanceScore += ((arenaElo - 1200) / 13) * 0.15; performanceCount++; }
-      if (agentic) { performanceScore += agentic * 0.10; performanceCount++; }
-      if (bfcl) { performanceScore += bfcl * 0.05; performanceCount++; }
-      if (aider) { performanceScore += aider * 0.05; performanceCount++; }
-      
-      // Normalize if we have partial data
-      if (performanceCount > 0 && performanceCount < 6) {
-        performanceScore = performanceScore * (6 / performanceCount);
-      }
-      
-      // Value score (just inverse price)
-      const valueScore = monthlyCost > 0 ? 1000.0 / monthlyCost : 0;
-      
-      // INTERMEDIATE: Hybrid formula - Performance 70%, Price 30%
-      const intermediateScore = (performanceScore * 0.70) + (Math.min(valueScore / 10, 100) * 0.30);
+      const performance: Performance = {
+        swe_bench: row.swe_bench_verified ? parseFloat(row.swe_bench_verified) : null,
+        intelligence: row.intelligence_score ? parseFloat(row.intelligence_score) : null,
+        arena_elo: row.arena_elo ? parseFloat(row.arena_elo) : null,
+        agentic: row.agentic_score ? parseFloat(row.agentic_score) : null,
+        bfcl: row.bfcl_score ? parseFloat(row.bfcl_score) : null,
+        aider: row.aider_polyglot_score ? parseFloat(row.aider_polyglot_score) : null,
+      };
       
       return {
         id: row.id,
@@ -83,43 +100,18 @@ export async function GET(request: Request) {
           prompt: parseFloat(row.price_input),
           completion: parseFloat(row.price_output),
         },
-        performance: {
-          swe_bench: sweBench,
-          intelligence: intelligence,
-          arena_elo: arenaElo,
-          agentic: agentic,
-          bfcl: bfcl,
-          aider: aider,
-          composite: performanceScore,
-        },
-        scores: {
-          performance: performanceScore,
-          value: valueScore,
-          intermediate: intermediateScore,
-        },
+        performance,
+        ...(presetRow && {
+          composite: {
+            preset: presetRow.name,
+            score: parseFloat(row.preset_score),
+            coverage: parseFloat(row.preset_coverage),
+          },
+        }),
         monthly_cost: monthlyCost,
       };
     });
     
-    // Sort by category
-    switch (category) {
-      case 'cost-savings':
-        // Sort by price only (cheapest first)
-        models.sort((a: any, b: any) => a.monthly_cost - b.monthly_cost);
-        break;
-        
-      case 'best-performance':
-        // Sort by performance only (best first)
-        models.sort((a: any, b: any) => b.scores.performance - a.scores.performance);
-        break;
-        
-      case 'intermediate':
-      default:
-        // Sort by intermediate score (performance 70%, price 30%)
-        models.sort((a: any, b: any) => b.scores.intermediate - a.scores.intermediate);
-        break;
-    }
-    
     // Add rank
     models = models.map((m: any, i: number) => ({ ...m, rank: i + 1 }));
     
@@ -127,6 +119,7 @@ export async function GET(request: Request) {
       models,
       total: models.length,
       category,
+      ...(presetRow && { preset: presetRow.name }),
       source: 'database',
       updated_at: new Date().toISOString(),
     });
@@ -2,6 +2,7 @@
 
 import { Navbar } from "@/components/navbar";
 import { RankingTable } from "@/components/ranking-table";
+import { PlanOrApi } from "@/components/plan-or-api";
 import { useI18n } from "@/lib/i18n";
 
 export default function Home() {
@@ -71,6 +72,9 @@ export default function Home() {
           </div>
         </section>
         
+        {/* Plan x API: só aparece com models-workloads e models-breakeven publicados */}
+        <PlanOrApi />
+        
         {/* Methodology */}
         <section id="metodologia" className="section" style={{ background: 'rgba(20, 20, 20, 0.5)' }}>
           <div className="container">
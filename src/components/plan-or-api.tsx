@@ -0,0 +1,115 @@
+"use client";
+
+import { useState, useEffect } from "react";
+import { useI18n } from "@/lib/i18n";
+import { BreakevenPayload, WorkloadsPayload, fetchBreakeven, fetchWorkloads, planOrApi } from "@/lib/static-api";
+
+// Plano de assinatura x API por perfil de uso, com os artefatos estáticos
+// models-workloads e models-breakeven publicados pelo coletor
+export function PlanOrApi() {
+  const { t } = useI18n();
+  const [workloads, setWorkloads] = useState<WorkloadsPayload | null>(null);
+  const [breakeven, setBreakeven] = useState<BreakevenPayload | null>(null);
+  const [profile, setProfile] = useState("");
+  const [plan, setPlan] = useState("");
+  const [monthlyTokens, setMonthlyTokens] = useState(0);
+
+  useEffect(() => {
+    Promise.all([fetchWorkloads(), fetchBreakeven()])
+      .then(([w, b]) => {
+        setWorkloads(w);
+        setBreakeven(b);
+        setProfile(Object.keys(b.profiles)[0] ?? "");
+        setPlan(Object.keys(b.plans)[0] ?? "");
+      })
+      .catch(() => {});
+  }, []);
+
+  // Volume padrão: o do perfil (tokens por requisição x requisições por mês)
+  useEffect(() => {
+    const p = workloads?.profiles[profile];
+    if (p) setMonthlyTokens((p.input_tokens + p.output_tokens) * p.requests_per_month);
+  }, [workloads, profile]);
+
+  const table = breakeven?.tables[profile]?.[plan];
+  if (!workloads || !breakeven || !table) return null;
+
+  const capacity = breakeven.plans[plan].capacity_tokens[profile] ?? null;
+  const { planCheaper } = planOrApi(table, monthlyTokens, capacity);
+  const cheaper = new Set(planCheaper);
+  const top = workloads.profiles[profile]?.top ?? [];
+
+  const selectStyle = {
+    background: 'rgba(255, 255, 255, 0.05)',
+    color: 'var(--text)',
+    border: '1px solid rgba(255, 255, 255, 0.1)',
+    borderRadius: 8,
+    padding: '8px 12px',
+  };
+
+  return (
+    <section id="planos" className="section">
+      <div className="container">
+        <div className="section-header">
+          <div className="section-label">{t.plans.label}</div>
+          <h2 className="section-title">{t.plans.title}</h2>
+        </div>
+        <div className="glass-card" style={{ padding: 24 }}>
+          <div style={{ display: 'flex', flexWrap: 'wrap', gap: 12, marginBottom: 16 }}>
+            <select value={profile} onChange={(e) => setProfile(e.target.value)} style={selectStyle}>
+              {Object.keys(breakeven.profiles).map((name) => (
+                <option key={name} value={name}>{name}</option>
+              ))}
+            </select>
+            <select value={plan} onChange={(e) => setPlan(e.target.value)} style={selectStyle}>
+              {Object.entries(breakeven.plans).map(([key, p]) => (
+                <option key={key} value={key}>{p.provider} · {p.plan_name} (${p.price_monthly ?? 0}{t.plans.perMonth})</option>
+              ))}
+            </select>
+            <input
+              type="number"
+              min={0}
+              value={monthlyTokens}
+              onChange={(e) => setMonthlyTokens(Number(e.target.value) || 0)}
+              style={{ ...selectStyle, width: 180 }}
+            />
+            <span style={{ alignSelf: 'center', color: 'var(--text-secondary)', fontSize: 14 }}>{t.plans.tokensPerMonth}</span>
+          </div>
+
+          <p style={{ color: 'var(--text-secondary)', fontSize: 14, marginBottom: 16 }}>
+            {capacity !== null && monthlyTokens > capacity
+              ? t.plans.aboveCapacity.replace('{capacity}', capacity.toLocaleString())
+              : t.plans.planCheaper
+                  .replace('{count}', String(planCheaper.length))
+                  .replace('{total}', String(table.model_ids.length + table.never.length))}
+          </p>
+
+          <div className="table-container">
+            <table className="table">
+              <thead>
+                <tr>
+                  <th>#</th>
+                  <th>{t.plans.model}</th>
+                  <th>{t.plans.apiCost}</th>
+                  <th>{t.plans.bestOption}</th>
+                </tr>
+              </thead>
+              <tbody>
+                {top.map((entry) => (
+                  <tr key={entry.model_id}>
+                    <td>{entry.rank}</td>
+                    <td className="font-mono">{entry.model_id}</td>
+                    <td>${entry.monthly_cost.toFixed(2)}</td>
+                    <td style={{ color: cheaper.has(entry.model_id) ? 'var(--accent)' : 'var(--text-secondary)' }}>
+                      {cheaper.has(entry.model_id) ? t.plans.plan : t.plans.api}
+                    </td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          </div>
+        </div>
+      </div>
+    </section>
+  );
+}
@@ -3,6 +3,8 @@
 import { useState, useEffect } from "react";
 import { useI18n } from "@/lib/i18n";
 import { RecommendationButton } from "./recommendation-button";
+import { fetchColumnar, rankColumnar } from "@/lib/columnar";
+import { fetchCategoryRows, fetchModelDetail } from "@/lib/static-api";
 
 interface Benchmarks {
   swe_bench?: number | null;
@@ -11,7 +13,6 @@ interface Benchmarks {
   bfcl?: number | null;
   arena_elo?: number | null;
   aider?: number | null;
-  composite?: number;
 }
 
 interface Model {
@@ -20,14 +21,16 @@ interface Model {
   provider: string;
   pricing: { prompt: number; completion: number };
   performance: Benchmarks;
-  scores: {
-    performance: number;
-    value: number;
-    intermediate: number;
-  };
+  // Score do preset de value.ranking_weights (ausente em cost-savings)
+  composite?: { preset?: string; score: number; coverage: number };
   rank?: number;
   monthly_cost?: number;
-  context_length?: number;
+  context_length?: number | null;
+  detail?: string;
+}
+
+interface ModelDetailFields {
+  performance?: { output_speed_tps?: number | null; latency_ttft?: number | null };
 }
 
 type Category = "cost-savings" | "intermediate" | "best-performance";
@@ -44,6 +47,7 @@ export function RankingTable() {
   const [activeCategory, setActiveCategory] = useState<Category>("intermediate");
   const [loading, setLoading] = useState(true);
   const [expandedRow, setExpandedRow] = useState<string | null>(null);
+  const [details, setDetails] = useState<Record<string, ModelDetailFields>>({});
 
   const categories: CategoryFilter[] = [
     { 
@@ -54,7 +58,7 @@ export function RankingTable() {
     { 
       key: "intermediate", 
       label: "Balanced", 
-      description: "70% Performance / 30% Price" 
+      description: "Performance and price presets" 
     },
     { 
       key: "best-performance", 
@@ -67,13 +71,34 @@ export function RankingTable() {
     setLoading(true);
     fetch(`/api/models?category=${activeCategory}`)
       .then(r => r.json())
-      .then(data => {
-        setModels(data.models || []);
+      .then(async data => {
+        if (data.models?.length) return data.models;
+        // Sem banco: índice + shard da categoria (só o top-K), e o payload
+        // colunar completo se a API em shards não foi publicada
+        try {
+          return await fetchCategoryRows(activeCategory);
+        } catch {
+          return rankColumnar(await fetchColumnar(), activeCategory);
+        }
+      })
+      .then(rows => {
+        setModels(rows);
         setLoading(false);
       })
       .catch(() => setLoading(false));
   }, [activeCategory]);
 
+  // Detalhe do modelo (velocidade, latência) só quando a linha é aberta
+  const toggleRow = (m: Model) => {
+    const opening = expandedRow !== m.id;
+    setExpandedRow(opening ? m.id : null);
+    if (opening && m.detail && !details[m.id]) {
+      fetchModelDetail({ detail: m.detail })
+        .then((d) => setDetails((prev) => ({ ...prev, [m.id]: d.model })))
+        .catch(() => {});
+    }
+  };
+
   const formatBenchmark = (val: number | null | undefined): string => {
     if (val === null || val === undefined) return "—";
     return val.toFixed(1);
@@ -84,10 +109,10 @@ export function RankingTable() {
       case 'cost-savings':
         return { value: m.monthly_cost || 0, label: '$/mo', isPrice: true };
       case 'best-performance':
-        return { value: m.scores?.performance || 0, label: 'Perf', isPrice: false };
+        return { value: m.composite?.score ?? null, label: 'Perf', isPrice: false };
       case 'intermediate':
       default:
-        return { value: m.scores?.intermediate || 0, label: 'Score', isPrice: false };
+        return { value: m.composite?.score ?? null, label: 'Score', isPrice: false };
     }
   };
 
@@ -120,8 +145,8 @@ export function RankingTable() {
         </h2>
         <p style={{ color: 'var(--text-secondary)', fontSize: 16 }}>
           {activeCategory === 'cost-savings' && 'Ranked by lowest price per token'}
-          {activeCategory === 'intermediate' && '70% Performance weight + 30% Price weight'}
-          {activeCategory === 'best-performance' && 'Ranked by coding benchmarks only'}
+          {activeCategory === 'intermediate' && 'Ranked by the balanced preset (benchmarks + price)'}
+          {activeCategory === 'best-performance' && 'Ranked by the default performance preset'}
         </p>
       </div>
 
@@ -189,7 +214,7 @@ export function RankingTable() {
                 <>
                   <tr 
                     key={m.id}
-                    onClick={() => setExpandedRow(expandedRow === m.id ? null : m.id)}
+                    onClick={() => toggleRow(m)}
                     style={{ cursor: 'pointer' }}
                   >
                     <td>
@@ -240,9 +265,11 @@ export function RankingTable() {
                         fontWeight: 700,
                         fontSize: 15
                       }}>
-                        {score.isPrice 
-                          ? `~$${score.value.toFixed(2)}`
-                          : score.value.toFixed(1)
+                        {score.value === null
+                          ? '—'
+                          : score.isPrice
+                            ? `~$${score.value.toFixed(2)}`
+                            : score.value.toFixed(1)
                         }
                       </span>
                       <div style={{ fontSize: 10, color: 'var(--text-dim)' }}>{score.label}</div>
@@ -258,6 +285,12 @@ export function RankingTable() {
                             <h4 style={{ margin: '0 0 8px 0', fontSize: 14, color: 'var(--text-dim)' }}>Model Details</h4>
                             <p style={{ margin: 0, fontSize: 13 }}>Context: {(m.context_length || 0).toLocaleString()} tokens</p>
                             <p style={{ margin: '4px 0 0 0', fontSize: 13 }}>Est. monthly: ${m.monthly_cost?.toFixed(2)}</p>
+                            {details[m.id]?.performance?.output_speed_tps && (
+                              <p style={{ margin: '4px 0 0 0', fontSize: 13 }}>Speed: {Math.round(details[m.id].performance!.output_speed_tps!)} tok/s</p>
+                            )}
+                            {details[m.id]?.performance?.latency_ttft && (
+                              <p style={{ margin: '4px 0 0 0', fontSize: 13 }}>TTFT: {details[m.id].performance!.latency_ttft!.toFixed(2)} s</p>
+                            )}
                           </div>
                           
                           <div>
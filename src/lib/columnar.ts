@@ -0,0 +1,108 @@
+// Decoder do payload colunar (columnar-v1) gerado por
+// data-collector/src/publishers/columnar.py: um array por campo,
+// provider/family como índices de dicionário e números inteiros
+// quantizados (valor real = inteiro / scales[coluna]).
+
+import { monthlyCost, Performance } from '@/lib/scoring';
+import { fetchArtifact } from '@/lib/static-api';
+
+export const COLUMNAR_FORMAT = 'columnar-v1';
+
+export interface ColumnarPayload {
+  format: string;
+  updated_at: string | null;
+  count: number;
+  dictionaries: Record<string, string[]>;
+  scales: Record<string, number>;
+  columns: Record<string, (string | number | null)[]>;
+  rankings: Record<string, number[]>;
+}
+
+export interface ColumnarModel {
+  id: string;
+  name: string;
+  provider: string;
+  family: string;
+  context_length: number | null;
+  pricing: { prompt: number; completion: number };
+  performance: Performance;
+  cost_benefit: { coding: number | null; general: number | null };
+  pareto: { frontier: boolean; dominated_by: number | null };
+  monthly_cost: number;
+  rank?: number;
+}
+
+// Coluna inteira -> valores reais (dicionário ou escala aplicados)
+function column<T>(payload: ColumnarPayload, name: string): T[] {
+  const values = payload.columns[name] ?? new Array(payload.count).fill(null);
+  const dictionary = payload.dictionaries[name];
+  if (dictionary) return values.map((code) => dictionary[code as number]) as T[];
+  const scale = payload.scales[name];
+  if (scale) return values.map((v) => (v === null ? null : (v as number) / scale)) as T[];
+  return values as T[];
+}
+
+export function decodeColumnar(payload: ColumnarPayload): ColumnarModel[] {
+  if (payload.format !== COLUMNAR_FORMAT) {
+    throw new Error(`Unsupported payload format: ${payload.format}`);
+  }
+
+  const ids = column<string>(payload, 'id');
+  const names = column<string>(payload, 'name');
+  const providers = column<string>(payload, 'provider');
+  const families = column<string>(payload, 'family');
+  const context = column<number | null>(payload, 'context_length');
+  const pricePrompt = column<number | null>(payload, 'price_prompt');
+  const priceCompletion = column<number | null>(payload, 'price_completion');
+  const sweBench = column<number | null>(payload, 'swe_bench');
+  const intelligence = column<number | null>(payload, 'intelligence');
+  const arenaElo = column<number | null>(payload, 'arena_elo');
+  const coding = column<number | null>(payload, 'cost_benefit_coding');
+  const general = column<number | null>(payload, 'cost_benefit_general');
+  const paretoFrontier = column<number | null>(payload, 'pareto_frontier');
+  const dominatedBy = column<number | null>(payload, 'dominated_by');
+
+  const models: ColumnarModel[] = [];
+  for (let i = 0; i < payload.count; i++) {
+    const pricing = { prompt: pricePrompt[i] ?? 0, completion: priceCompletion[i] ?? 0 };
+    const performance: Performance = {
+      swe_bench: sweBench[i],
+      intelligence: intelligence[i],
+      arena_elo: arenaElo[i],
+      agentic: null,
+      bfcl: null,
+      aider: null,
+    };
+    const cost = monthlyCost(pricing);
+
+    models.push({
+      id: ids[i],
+      name: names[i],
+      provider: providers[i],
+      family: families[i],
+      context_length: context[i],
+      pricing,
+      performance,
+      cost_benefit: { coding: coding[i], general: general[i] },
+      pareto: { frontier: paretoFrontier[i] === 1, dominated_by: dominatedBy[i] },
+      monthly_cost: cost,
+    });
+  }
+  return models;
+}
+
+// Mesmo contrato de /api/models?category=...: na ordem do ranking da
+// categoria gravado pelo coletor (composite.py site_rankings), com rank
+export function rankColumnar(payload: ColumnarPayload, category: string): ColumnarModel[] {
+  return rankingRows(payload, decodeColumnar(payload), category).map((m, i) => ({ ...m, rank: i + 1 }));
+}
+
+// Rankings pré-calculados do coletor (by_price, by_pareto, ...) como índices de linha
+export function rankingRows(payload: ColumnarPayload, models: ColumnarModel[], criterion: string): ColumnarModel[] {
+  return (payload.rankings[criterion] ?? []).map((row) => models[row]);
+}
+
+// Resolve o artefato atual pelo manifest publicado (scripts/publish.py)
+export function fetchColumnar(name = 'models-columnar'): Promise<ColumnarPayload> {
+  return fetchArtifact<ColumnarPayload>(name);
+}
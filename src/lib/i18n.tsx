@@ -46,6 +46,19 @@ interface Translations {
     arena: string;
     artificialAnalysis: string;
   };
+  plans: {
+    label: string;
+    title: string;
+    tokensPerMonth: string;
+    aboveCapacity: string; // {capacity}
+    planCheaper: string; // {count}, {total}
+    model: string;
+    apiCost: string;
+    bestOption: string;
+    plan: string;
+    api: string;
+    perMonth: string;
+  };
   footer: {
     year: string;
   };
@@ -94,6 +107,19 @@ const translations: Record<Locale, Translations> = {
       arena: "Rankings ELO",
       artificialAnalysis: "Métricas de performance",
     },
+    plans: {
+      label: "Planos",
+      title: "Assinatura ou pagar por uso?",
+      tokensPerMonth: "tokens/mês",
+      aboveCapacity: "Acima da capacidade do plano ({capacity} tokens/mês): pague por uso.",
+      planCheaper: "O plano sai mais barato que a API em {count} de {total} modelos.",
+      model: "Modelo",
+      apiCost: "API $/mês",
+      bestOption: "Melhor opção",
+      plan: "Plano",
+      api: "API",
+      perMonth: "/mês",
+    },
     footer: {
       year: "2026",
     },
@@ -140,6 +166,19 @@ const translations: Record<Locale, Translations> = {
       arena: "ELO rankings",
       artificialAnalysis: "Performance metrics",
     },
+    plans: {
+      label: "Plans",
+      title: "Subscription or pay per use?",
+      tokensPerMonth: "tokens/mo",
+      aboveCapacity: "Above the plan capacity ({capacity} tokens/mo): pay per use.",
+      planCheaper: "The plan is cheaper than the API for {count} of {total} models.",
+      model: "Model",
+      apiCost: "API $/mo",
+      bestOption: "Best option",
+      plan: "Plan",
+      api: "API",
+      perMonth: "/mo",
+    },
     footer: {
       year: "2026",
     },
@@ -186,6 +225,19 @@ const translations: Record<Locale, Translations> = {
       arena: "ELO排名",
       artificialAnalysis: "性能指标",
     },
+    plans: {
+      label: "套餐",
+      title: "订阅还是按量付费？",
+      tokensPerMonth: "tokens/月",
+      aboveCapacity: "超出套餐容量（{capacity} tokens/月）：按量付费。",
+      planCheaper: "在 {total} 个模型中，套餐比 API 便宜的有 {count} 个。",
+      model: "模型",
+      apiCost: "API $/月",
+      bestOption: "最佳选择",
+      plan: "套餐",
+      api: "API",
+      perMonth: "/月",
+    },
     footer: {
       year: "2026",
     },
@@ -232,6 +284,19 @@ const translations: Record<Locale, Translations> = {
       arena: "ELO रैंकिंग",
       artificialAnalysis: "प्रदर्शन मेट्रिक्स",
     },
+    plans: {
+      label: "प्लान",
+      title: "सब्सक्रिप्शन या उपयोग के अनुसार भुगतान?",
+      tokensPerMonth: "tokens/माह",
+      aboveCapacity: "प्लान की क्षमता ({capacity} tokens/माह) से अधिक: उपयोग के अनुसार भुगतान करें।",
+      planCheaper: "{total} में से {count} मॉडलों के लिए प्लान API से सस्ता है।",
+      model: "मॉडल",
+      apiCost: "API $/माह",
+      bestOption: "सबसे अच्छा विकल्प",
+      plan: "प्लान",
+      api: "API",
+      perMonth: "/माह",
+    },
     footer: {
       year: "2026",
     },
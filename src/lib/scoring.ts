@@ -0,0 +1,26 @@
+// Tipos do ranking (compartilhados entre /api/models e os artefatos estáticos).
+// Os scores compostos vêm prontos do coletor Python (value.composite_rankings
+// e rankings do dataset), não são recalculados aqui.
+
+export type Category = 'cost-savings' | 'intermediate' | 'best-performance';
+
+export interface Performance {
+  swe_bench: number | null;
+  intelligence: number | null;
+  arena_elo: number | null;
+  agentic: number | null;
+  bfcl: number | null;
+  aider: number | null;
+}
+
+// Score de um preset de value.ranking_weights (calculators/composite.py)
+export interface Composite {
+  preset?: string;
+  score: number;
+  coverage: number;
+}
+
+// Mesmo custo mensal da query SQL: input * 1.0 + output * 0.5
+export function monthlyCost(pricing: { prompt: number; completion: number }): number {
+  return pricing.prompt * 1.0 + pricing.completion * 0.5;
+}
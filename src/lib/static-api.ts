@@ -0,0 +1,227 @@
+// API estática em shards publicada por data-collector/src/publishers/shards.py.
+// manifest.json (revalidado) -> índice -> shards com hash no nome (immutable),
+// carregados só quando a tela precisa deles.
+
+import { Composite, monthlyCost, Performance } from '@/lib/scoring';
+
+export const DATA_BASE = '/data';
+
+export interface ShardRef {
+  path: string;
+  count: number;
+}
+
+export interface ShardIndex {
+  updated_at: string | null;
+  total_models: number;
+  rankings: Record<string, ShardRef>;
+  providers: Record<string, ShardRef>;
+}
+
+export interface ModelSummary {
+  id: string;
+  name: string;
+  provider: string;
+  context_length: number | null;
+  pricing: { prompt: number; completion: number } | null;
+  benchmarks: Record<string, number | null> | null;
+  cost_benefit_scores: { coding: number; general: number } | null;
+  pareto: {
+    frontier: boolean;
+    dominated_by: number | null;
+    dominates: number | null;
+    frontier_2d: Record<string, boolean>;
+  } | null;
+  detail: string;
+}
+
+export interface RankingShard {
+  criterion: string;
+  entries: ({ rank: number; model_id: string; model: ModelSummary } & Record<string, unknown>)[];
+}
+
+export interface ProviderShard {
+  provider: string;
+  models: ModelSummary[];
+}
+
+export interface ModelDetail {
+  model: Record<string, any>;
+}
+
+// Linha de ranking-table.tsx montada do resumo de um shard
+export interface CategoryRow {
+  id: string;
+  name: string;
+  provider: string;
+  context_length: number | null;
+  pricing: { prompt: number; completion: number };
+  performance: Performance;
+  composite?: Composite;
+  monthly_cost: number;
+  rank: number;
+  detail: string;
+}
+
+// Custos por perfil de uso (data-collector/src/calculators/workloads.py)
+export interface WorkloadProfile {
+  name: string;
+  description?: string;
+  input_tokens: number;
+  output_tokens: number;
+  cached_input_share: number;
+  requests_per_month: number;
+  requests_per_task: number;
+  top: {
+    rank: number;
+    model_id: string;
+    monthly_cost: number;
+    cost_per_task: number;
+    seconds_per_task: number | null;
+  }[];
+}
+
+export interface WorkloadsPayload {
+  format: string;
+  updated_at: string | null;
+  profiles: Record<string, WorkloadProfile>;
+}
+
+// Mesma linha de /api/models: score e coverage do preset vêm da entrada do
+// shard (rankings compostos); cost-savings não tem score
+export function summaryRow(summary: ModelSummary, rank: number, entry: Record<string, unknown> = {}): CategoryRow {
+  const benchmarks = summary.benchmarks ?? {};
+  const pricing = { prompt: summary.pricing?.prompt ?? 0, completion: summary.pricing?.completion ?? 0 };
+  const performance: Performance = {
+    swe_bench: benchmarks.swe_bench_verified ?? null,
+    intelligence: benchmarks.intelligence_score ?? null,
+    arena_elo: benchmarks.arena_elo ?? null,
+    agentic: null,
+    bfcl: null,
+    aider: null,
+  };
+  return {
+    id: summary.id,
+    name: summary.name,
+    provider: summary.provider,
+    context_length: summary.context_length,
+    pricing,
+    performance,
+    ...(typeof entry.score === 'number' && {
+      composite: { score: entry.score, coverage: Number(entry.coverage ?? 0) },
+    }),
+    monthly_cost: monthlyCost(pricing),
+    rank,
+    detail: summary.detail,
+  };
+}
+
+// Breakeven plano x API (data-collector/src/calculators/breakeven.py)
+export interface BreakevenTable {
+  model_ids: string[];
+  breakeven_tokens: number[]; // tokens/mês, em ordem crescente
+  never: string[];
+}
+
+export interface BreakevenPayload {
+  format: string;
+  updated_at: string | null;
+  plans: Record<string, {
+    provider: string;
+    plan_name: string;
+    price_monthly: number | null;
+    tokens_included: number | null;
+    requests_per_day: number | null;
+    url: string | null;
+    capacity_tokens: Record<string, number | null>;
+  }>;
+  profiles: Record<string, Omit<WorkloadProfile, 'name' | 'description' | 'requests_per_month' | 'top'>>;
+  tables: Record<string, Record<string, BreakevenTable>>; // perfil -> plano -> tabela
+}
+
+// Shards nunca mudam de conteúdo: uma promessa por path basta
+const shardCache = new Map<string, Promise<any>>();
+
+function fetchShard<T>(path: string): Promise<T> {
+  let pending = shardCache.get(path);
+  if (!pending) {
+    pending = fetch(`${DATA_BASE}/${path}`).then((r) => {
+      if (!r.ok) throw new Error(`Shard ${path}: HTTP ${r.status}`);
+      return r.json();
+    });
+    pending.catch(() => shardCache.delete(path));
+    shardCache.set(path, pending);
+  }
+  return pending;
+}
+
+// Path atual de um artefato do manifest (models, models-columnar, models-index, models-workloads, models-breakeven)
+export async function resolveArtifact(name: string): Promise<string> {
+  const manifest = await fetch(`${DATA_BASE}/manifest.json`, { cache: 'no-cache' }).then((r) => r.json());
+  const entry = manifest.artifacts?.[name];
+  if (!entry) throw new Error(`Artifact not found: ${name}`);
+  return entry.path;
+}
+
+export async function fetchArtifact<T>(name: string): Promise<T> {
+  return fetchShard<T>(await resolveArtifact(name));
+}
+
+export function fetchIndex(): Promise<ShardIndex> {
+  return fetchArtifact<ShardIndex>('models-index');
+}
+
+export function fetchWorkloads(name = 'models-workloads'): Promise<WorkloadsPayload> {
+  return fetchArtifact<WorkloadsPayload>(name);
+}
+
+export function fetchBreakeven(name = 'models-breakeven'): Promise<BreakevenPayload> {
+  return fetchArtifact<BreakevenPayload>(name);
+}
+
+// Plano ou API para um volume mensal: busca binária pelo primeiro breakeven > monthlyTokens.
+// capacityTokens é plans[plano].capacity_tokens[perfil]: acima dele o plano não cobre o volume
+export function planOrApi(
+  table: BreakevenTable,
+  monthlyTokens: number,
+  capacityTokens: number | null,
+): { planCheaper: string[]; apiCheaper: string[] } {
+  if (capacityTokens !== null && monthlyTokens > capacityTokens) {
+    return { planCheaper: [], apiCheaper: [...table.model_ids, ...table.never] };
+  }
+  let lo = 0;
+  let hi = table.breakeven_tokens.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (table.breakeven_tokens[mid] <= monthlyTokens) lo = mid + 1;
+    else hi = mid;
+  }
+  return {
+    planCheaper: table.model_ids.slice(0, lo),
+    apiCheaper: [...table.model_ids.slice(lo), ...table.never],
+  };
+}
+
+export async function fetchRanking(criterion: string, index?: ShardIndex): Promise<RankingShard> {
+  const ref = (index ?? await fetchIndex()).rankings[criterion];
+  if (!ref) throw new Error(`Unknown ranking: ${criterion}`);
+  return fetchShard<RankingShard>(ref.path);
+}
+
+export async function fetchProvider(provider: string, index?: ShardIndex): Promise<ProviderShard> {
+  const ref = (index ?? await fetchIndex()).providers[provider];
+  if (!ref) throw new Error(`Unknown provider: ${provider}`);
+  return fetchShard<ProviderShard>(ref.path);
+}
+
+// Categoria do site (cost-savings, intermediate, best-performance), já
+// ordenada pelo coletor (calculators/composite.py site_rankings): índice + um shard
+export async function fetchCategoryRows(category: string): Promise<CategoryRow[]> {
+  const shard = await fetchRanking(category);
+  return shard.entries.map((entry) => summaryRow(entry.model, entry.rank, entry));
+}
+
+// summary.detail vem de um shard de ranking ou de provider
+export function fetchModelDetail(summary: Pick<ModelSummary, 'detail'>): Promise<ModelDetail> {
+  return fetchShard<ModelDetail>(summary.detail);
+}